@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from HttpSession import get_http_session
+
+# File the validation results are cached in. Only a fingerprint of each key is stored, never the key itself.
+API_KEY_CACHE_FILE = "api_key_cache.json"
+# How long a validation result is trusted before the key is checked against the API again
+API_KEY_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+# Placeholders from CredsTemplate.py, these are rejected without a network request
+API_KEY_PLACEHOLDERS = {
+    "deepl": "YOUR_DEEPL_API_KEY_HERE",
+    "google_vision": "YOUR_GOOGLE_VISION_API_KEY_HERE",
+}
+DEEPL_USAGE_ENDPOINT = "https://api-free.deepl.com/v2/usage"
+GOOGLE_VISION_ENDPOINT = "https://vision.googleapis.com/v1/images:annotate"
+
+def fingerprint_key(service, api_key):
+    """
+    Return a short hash identifying a key, so a changed key in Creds.py is validated again.
+    """
+    return hashlib.sha256(f"{service}:{api_key}".encode("utf-8")).hexdigest()[:16]
+
+def check_deepl_key(api_key):
+    """
+    Ask the DeepL usage endpoint whether the key is accepted. The usage endpoint does not use any of the character quota.
+    :return: True if valid, False if rejected, None if the API could not be reached.
+    """
+    response = get_http_session().get(
+        DEEPL_USAGE_ENDPOINT,
+        headers={"Authorization": f"DeepL-Auth-Key {api_key}"}
+    )
+    if response.status_code == 200:
+        return True
+    if response.status_code in (401, 403):
+        return False
+    print(f"DEBUG: DeepL key check returned {response.status_code}, trying again on the next launch")
+    return None
+
+def check_google_vision_key(api_key):
+    """
+    Send an annotate request without any images. Google checks the key before the request body,
+    so an invalid key is rejected while a valid one costs no Vision units.
+    :return: True if valid, False if rejected, None if the API could not be reached.
+    """
+    response = get_http_session().post(f"{GOOGLE_VISION_ENDPOINT}?key={api_key}", json={"requests": []})
+    if response.status_code == 200:
+        return True
+    if response.status_code in (401, 403) or "API_KEY_INVALID" in response.text:
+        return False
+    if response.status_code == 400:
+        return True  # The empty request itself was rejected, which means the key was accepted
+    print(f"DEBUG: Google Vision key check returned {response.status_code}, trying again on the next launch")
+    return None
+
+# Class that validates API keys against their services and remembers the result on disk
+class ApiKeyValidator:
+    def __init__(self, cache_file=API_KEY_CACHE_FILE, ttl=API_KEY_CACHE_TTL_SECONDS):
+        """
+        :param cache_file: JSON file the results are cached in, or None to keep them in memory only.
+        :param ttl: Seconds a cached result is trusted for.
+        """
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.checks = {"deepl": check_deepl_key, "google_vision": check_google_vision_key}
+        self.lock = threading.Lock()
+        self.results = self.load()  # Service -> {"fingerprint", "valid", "checked_at"}
+
+    def load(self):
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError) as e:
+            print(f"DEBUG: Ignoring unreadable API key cache: {e}")
+            return {}
+
+    def save(self):
+        if not self.cache_file:
+            return
+        try:
+            with open(self.cache_file, "w", encoding="utf-8") as file:
+                json.dump(self.results, file, indent=2)
+        except OSError as e:
+            print(f"DEBUG: Could not write API key cache: {e}")
+
+    def is_valid(self, service, api_key):
+        """
+        Check an API key, using the cached result when the same key was checked within the TTL.
+        Blocks on a network request on a cache miss, so call it from a background thread.
+        :param service: "deepl" or "google_vision".
+        :param api_key: The key from Creds.py.
+        :return: True if the key is valid. Keys that could not be checked (no network) count as valid and are not cached.
+        """
+        if not api_key or api_key == API_KEY_PLACEHOLDERS.get(service):
+            return False
+
+        fingerprint = fingerprint_key(service, api_key)
+        with self.lock:
+            cached = self.results.get(service)
+        if cached and cached["fingerprint"] == fingerprint and time.time() - cached["checked_at"] < self.ttl:
+            print(f"DEBUG: Using cached {service} key check from {time.ctime(cached['checked_at'])}")
+            return cached["valid"]
+
+        try:
+            valid = self.checks[service](api_key)
+        except Exception as e:
+            print(f"DEBUG: Could not check the {service} key: {type(e).__name__}")  # The message can contain the key
+            valid = None
+        if valid is None:
+            return True  # Let the user try, the request itself will report any problem
+
+        with self.lock:
+            self.results[service] = {"fingerprint": fingerprint, "valid": valid, "checked_at": time.time()}
+            self.save()
+        return valid
+
+    def forget(self, service=None):
+        """
+        Drop the cached result for one service, or for all of them, so the next check goes to the API.
+        """
+        with self.lock:
+            if service is None:
+                self.results.clear()
+            else:
+                self.results.pop(service, None)
+            self.save()
+
+
+# Shared validator so the cache file is only read once
+_api_key_validator = None
+_api_key_validator_lock = threading.Lock()
+
+def get_api_key_validator():
+    """
+    Return the process-wide ApiKeyValidator, creating it on first use.
+    """
+    global _api_key_validator
+    with _api_key_validator_lock:
+        if _api_key_validator is None:
+            _api_key_validator = ApiKeyValidator()
+        return _api_key_validator
@@ -0,0 +1,129 @@
+import asyncio
+import threading
+from concurrent.futures import CancelledError
+from GoogleVisionOCR import VISION_MAX_IMAGES_PER_REQUEST, get_google_vision_ocr, parse_annotate_response
+from HttpSession import HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT
+
+# aiohttp is optional. When it is installed the annotate requests are sent from the event loop itself,
+# otherwise each request runs the blocking GoogleVisionOCR client in the loop's thread pool.
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Maximum number of annotate requests waiting on the network at the same time
+VISION_MAX_IN_FLIGHT = 4
+
+# Class that sends Google Vision requests from a background asyncio event loop so callers never block on the network
+class AsyncGoogleVisionOCR:
+    def __init__(self, max_in_flight=VISION_MAX_IN_FLIGHT):
+        """
+        :param max_in_flight: Maximum number of annotate requests in flight at the same time.
+        """
+        self.client = get_google_vision_ocr()  # Shares the API key, endpoint, encoding and response parsing
+        self.max_in_flight = max_in_flight
+        self.latest = {}  # Channel name -> future of the most recent request on that channel
+        self.latest_lock = threading.Lock()
+        self.session = None
+        self.loop = asyncio.new_event_loop()
+        self.semaphore = asyncio.Semaphore(max_in_flight)
+        self.loop_thread = threading.Thread(target=self.run_loop, name="google-vision-loop", daemon=True)
+        self.loop_thread.start()
+
+    def run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, images, channel=None):
+        """
+        Queue an OCR request and return immediately.
+        :param images: One image or a list of up to VISION_MAX_IMAGES_PER_REQUEST images (PIL, NumPy or path).
+        :param channel: Optional name such as "snip". A new request on a channel cancels the previous one if it has not finished.
+        :return: concurrent.futures.Future resolving to one result dictionary (or a list of them if a list was passed).
+        """
+        batch = images if isinstance(images, list) else [images]
+        if len(batch) > VISION_MAX_IMAGES_PER_REQUEST:
+            raise ValueError(f"At most {VISION_MAX_IMAGES_PER_REQUEST} images can be sent in one request")
+        future = asyncio.run_coroutine_threadsafe(self.annotate(batch, single=not isinstance(images, list)), self.loop)
+        if channel is not None:
+            with self.latest_lock:
+                previous = self.latest.get(channel)
+                self.latest[channel] = future
+            if previous is not None and not previous.done():
+                print(f"DEBUG: Cancelling superseded Google Vision request on '{channel}'")
+                previous.cancel()
+        return future
+
+    def perform_ocr(self, image, channel=None):
+        """
+        Blocking wrapper with the same result as GoogleVisionOCR.perform_ocr. A cancelled request returns an empty result.
+        """
+        try:
+            return self.submit(image, channel).result()
+        except CancelledError:
+            return {"full_text": "", "paragraphs": []}
+        except Exception as e:
+            print(f"DEBUG: General error during Google Vision OCR: {e}")
+            return {"full_text": "", "paragraphs": []}
+
+    async def annotate(self, images, single=False):
+        empty_results = [{"full_text": "", "paragraphs": []} for _ in images]
+        async with self.semaphore:
+            if aiohttp is None:
+                results = await self.loop.run_in_executor(None, self.client.annotate, images)
+                return results[0] if single else results
+
+            try:
+                # JPEG encoding is CPU work, keep it off the event loop
+                encoded = await self.loop.run_in_executor(None, lambda: [self.client.encode_image(image) for image in images])
+                payload = self.client.build_payload([content for content, _ in encoded])
+                session = self.get_session()
+                async with session.post(f"{self.client.endpoint}?key={self.client.api_key}", json=payload) as response:
+                    print(f"DEBUG: Request sent to Google Vision API. Status code: {response.status}")
+                    response.raise_for_status()
+                    responses = (await response.json()).get("responses", [])
+                results = [
+                    parse_annotate_response(responses[i] if i < len(responses) else {}, scale)
+                    for i, (_, scale) in enumerate(encoded)
+                ]
+            except aiohttp.ClientError as req_error:
+                print(f"DEBUG: Request error during Google Vision OCR: {req_error}")
+                results = empty_results
+            except asyncio.TimeoutError:
+                print("DEBUG: Google Vision OCR request timed out")
+                results = empty_results
+            return results[0] if single else results
+
+    def get_session(self):
+        # Created on the loop thread, aiohttp sessions must be used from the loop they were created on
+        if self.session is None or self.session.closed:
+            timeout = aiohttp.ClientTimeout(connect=HTTP_CONNECT_TIMEOUT, sock_read=HTTP_READ_TIMEOUT)
+            self.session = aiohttp.ClientSession(
+                timeout=timeout, connector=aiohttp.TCPConnector(limit=self.max_in_flight)
+            )
+        return self.session
+
+    def close(self):
+        """
+        Close the HTTP session and stop the event loop.
+        """
+        async def close_session():
+            if self.session is not None:
+                await self.session.close()
+        asyncio.run_coroutine_threadsafe(close_session(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+# Shared async client so every snip uses the same event loop and connection pool
+_async_google_vision_ocr = None
+_async_google_vision_ocr_lock = threading.Lock()
+
+def get_async_google_vision_ocr():
+    """
+    Return the process-wide AsyncGoogleVisionOCR, starting its event loop on first use.
+    """
+    global _async_google_vision_ocr
+    with _async_google_vision_ocr_lock:
+        if _async_google_vision_ocr is None:
+            _async_google_vision_ocr = AsyncGoogleVisionOCR()
+        return _async_google_vision_ocr
@@ -0,0 +1,110 @@
+import os
+import queue
+import shutil
+import threading
+import time
+import cv2
+import numpy as np
+
+# Folder the debug images are written to, each sampled snip gets its own sub folder
+DEBUG_IMAGE_DIR = "debug_images"
+# Images waiting to be written, when the queue is full new images are dropped instead of blocking OCR
+DEBUG_QUEUE_SIZE = 32
+# Only every Nth snip is saved, 1 saves every snip
+DEBUG_SAMPLE_EVERY = 1
+# Number of snip folders kept on disk, the oldest are deleted first
+DEBUG_MAX_SNIPS = 20
+
+# Class that writes debug images on a background thread so encoding and disk I/O stay off the OCR path
+class DebugImageSink:
+    def __init__(self, debug_dir=DEBUG_IMAGE_DIR, queue_size=DEBUG_QUEUE_SIZE,
+                 sample_every=DEBUG_SAMPLE_EVERY, max_snips=DEBUG_MAX_SNIPS):
+        """
+        :param debug_dir: Folder the snip folders are created in.
+        :param queue_size: Maximum number of images waiting to be written.
+        :param sample_every: Save one snip out of every sample_every snips.
+        :param max_snips: Number of snip folders kept on disk.
+        """
+        self.debug_dir = debug_dir
+        self.sample_every = max(1, sample_every)
+        self.max_snips = max(1, max_snips)
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.snip_count = 0
+        self.dropped = 0
+        self.count_lock = threading.Lock()
+        self.writer_thread = threading.Thread(target=self.run, name="debug-image-writer", daemon=True)
+        self.writer_thread.start()
+
+    def start_snip(self):
+        """
+        Decide whether the current snip is sampled.
+        :return: Folder the snip's images are written to, or None if this snip is not saved.
+        """
+        with self.count_lock:
+            self.snip_count += 1
+            snip_number = self.snip_count
+        if (snip_number - 1) % self.sample_every:
+            return None
+        return os.path.join(self.debug_dir, f"snip_{time.strftime('%Y%m%d_%H%M%S')}_{snip_number:06d}")
+
+    def save(self, snip_dir, name, image):
+        """
+        Queue an image to be written as <snip_dir>/<name>.png. Never blocks, the image is dropped if the writer is behind.
+        :param snip_dir: Folder returned by start_snip, None is ignored.
+        :param name: File name without extension (e.g., "original_image", "threshold_otsu").
+        :param image: NumPy array (BGR(A) or greyscale) or PIL image. It is copied because preprocessing reuses its buffers.
+        """
+        if snip_dir is None:
+            return
+        try:
+            self.queue.put_nowait((snip_dir, name, image.copy()))
+        except queue.Full:
+            with self.count_lock:
+                self.dropped += 1
+            if self.dropped % 10 == 1:
+                print(f"DEBUG: Debug image writer is behind, {self.dropped} images dropped so far")
+
+    def run(self):
+        while True:
+            snip_dir, name, image = self.queue.get()
+            try:
+                if not os.path.isdir(snip_dir):
+                    os.makedirs(snip_dir, exist_ok=True)
+                    self.remove_old_snips()
+                if not isinstance(image, np.ndarray):
+                    # PIL images are RGB, cv2.imwrite expects BGR
+                    image = cv2.cvtColor(np.asarray(image.convert("RGB")), cv2.COLOR_RGB2BGR)
+                cv2.imwrite(os.path.join(snip_dir, f"{name}.png"), image)
+            except Exception as e:
+                print(f"DEBUG: Failed to write debug image {name}: {e}")
+            finally:
+                self.queue.task_done()
+
+    def remove_old_snips(self):
+        """
+        Delete the oldest snip folders so only max_snips are kept. Folder names sort by creation time.
+        """
+        snip_dirs = sorted(entry for entry in os.listdir(self.debug_dir) if entry.startswith("snip_"))
+        for entry in snip_dirs[:-self.max_snips]:
+            shutil.rmtree(os.path.join(self.debug_dir, entry), ignore_errors=True)
+
+    def flush(self):
+        """
+        Block until every queued image has been written, e.g. before a benchmark reads them back.
+        """
+        self.queue.join()
+
+
+# Shared sink so every snip uses the same writer thread and retention limit
+_sink = None
+_sink_lock = threading.Lock()
+
+def get_debug_image_sink():
+    """
+    Return the process-wide DebugImageSink, creating it (and its writer thread) on first use.
+    """
+    global _sink
+    with _sink_lock:
+        if _sink is None:
+            _sink = DebugImageSink()
+        return _sink
@@ -1,12 +1,24 @@
-import requests
-from Creds import deepl_api_key  # Import the API key from Creds.py
+import threading
+from urllib.parse import urlencode
+from TranslationCache import get_translation_cache
+from HttpSession import get_http_session
+
+# DeepL API request limits: at most 50 texts and 128 KiB of form data per translate request
+MAX_TEXTS_PER_REQUEST = 50
+MAX_REQUEST_BYTES = 128 * 1024
 
 # Class for handling DeepL translations
 # Also includes a check for unsupported languages gotten from a separate helper program DeepLSupportedLanguages.py
 class DeepLTranslation:
     def __init__(self):
+        # Import the API key here so a missing Creds.py only disables DeepL instead of every translation
+        try:
+            from Creds import deepl_api_key
+        except ImportError:
+            deepl_api_key = None
         self.deepl_api_key = deepl_api_key  # Use the imported API key from Creds.py
         self.endpoint = "https://api-free.deepl.com/v2/translate"
+        self.cache = get_translation_cache()
         """
         List of languages that DeepL does not support.
         Gotten from a separate helper program DeepLSupportedLanguages.py I made that checks the DeepL API and
@@ -25,12 +37,11 @@ class DeepLTranslation:
         """
         return language_name not in self.unsupported_languages
 
-    def translate_text(self, text, target_language):
+    def get_language_code(self, target_language):
         """
-        Sends text to the DeepL API for translation and returns the translated text.
-        :param text: The text to be translated.
+        Map a target language name to its DeepL language code.
         :param target_language: The name of the target language (e.g., "English").
-        :return: Translated text as a string.
+        :return: The DeepL language code, or None if DeepL does not support the language.
         """
         # Map the target language to the DeepL language code
         language_map = {
@@ -59,28 +70,100 @@ class DeepLTranslation:
             'Indonesian': 'ID',
             'Chinese (Simplified)': 'ZH',
         }
-    
+        return language_map.get(target_language)
+
+    def translate_text(self, text, target_language):
+        """
+        Sends text to the DeepL API for translation and returns the translated text.
+        :param text: The text to be translated.
+        :param target_language: The name of the target language (e.g., "English").
+        :return: Translated text as a string.
+        """
+        return self.translate_many([text], target_language)[0]
+
+    def translate_many(self, texts, target_language):
+        """
+        Translates several texts with as few DeepL requests as possible.
+        The texts are packed into requests of up to MAX_TEXTS_PER_REQUEST texts and MAX_REQUEST_BYTES bytes,
+        so a snip with 12 paragraphs costs a single round trip.
+        :param texts: List of texts to be translated.
+        :param target_language: The name of the target language (e.g., "English").
+        :return: List of translated texts in the same order as the input, None for any text that failed.
+        """
         # Get the DeepL language code for the target language
-        deepl_language_code = language_map.get(target_language)
+        deepl_language_code = self.get_language_code(target_language)
         if not deepl_language_code:
             print(f"DEBUG: Target language '{target_language}' is not supported by DeepL.")
-            return None
-    
+            return [None] * len(texts)
+
+        # Repeated text is served from the translation cache so it does not count towards the DeepL quota
+        results = [self.cache.get("deepl", "auto", deepl_language_code, text) for text in texts]
+        pending = {}  # Text -> indexes still needing a translation, identical paragraphs are only sent once
+        for i, text in enumerate(texts):
+            if results[i] is None:
+                pending.setdefault(text, []).append(i)
+
+        for batch in self.pack_batches(list(pending), deepl_language_code):
+            translations = self.send_batch(batch, deepl_language_code)
+            for text, translated_text in zip(batch, translations):
+                for i in pending[text]:
+                    results[i] = translated_text
+                self.cache.put("deepl", "auto", deepl_language_code, text, translated_text)
+        return results
+
+    def pack_batches(self, texts, deepl_language_code):
+        """
+        Split texts into batches that stay within the DeepL request limits while keeping their order.
+        A single text larger than the byte limit is still sent on its own.
+        """
+        base_size = len(urlencode({"auth_key": self.deepl_api_key, "target_lang": deepl_language_code}))
+        batches = []
+        batch = []
+        batch_size = base_size
+        for text in texts:
+            text_size = len(urlencode({"text": text})) + 1  # +1 for the '&' separator
+            if batch and (len(batch) >= MAX_TEXTS_PER_REQUEST or batch_size + text_size > MAX_REQUEST_BYTES):
+                batches.append(batch)
+                batch = []
+                batch_size = base_size
+            batch.append(text)
+            batch_size += text_size
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def send_batch(self, batch, deepl_language_code):
+        """
+        Send one batch of texts in a single request, the DeepL API accepts the text parameter multiple times.
+        :return: List of translated texts in the same order as the batch, None for each text if the request failed.
+        """
         try:
-            data = {
-                "auth_key": self.deepl_api_key,
-                "text": text,
-                "target_lang": deepl_language_code,
-            }
-            print(f"DEBUG: Sending text to DeepL API for translation to {deepl_language_code}...")
-            response = requests.post(self.endpoint, data=data)
-    
+            data = [("auth_key", self.deepl_api_key), ("target_lang", deepl_language_code)]
+            data += [("text", text) for text in batch]
+            print(f"DEBUG: Sending {len(batch)} text(s) to DeepL API for translation to {deepl_language_code}...")
+            response = get_http_session().post(self.endpoint, data=data)
+
             if response.status_code == 200:
                 print("DEBUG: Text successfully translated by DeepL.")
-                return response.json()["translations"][0]["text"]
+                return [translation["text"] for translation in response.json()["translations"]]
             else:
                 print(f"DEBUG: DeepL API error: {response.status_code} - {response.text}")
-                return None
+                return [None] * len(batch)
         except Exception as e:
             print(f"DEBUG: Error during DeepL text translation: {e}")
-            return None
\ No newline at end of file
+            return [None] * len(batch)
+
+
+# Shared DeepL client so it is only created once per process
+_deepl_translation = None
+_deepl_translation_lock = threading.Lock()
+
+def get_deepl_translation():
+    """
+    Return the process-wide DeepLTranslation client, creating it on first use.
+    """
+    global _deepl_translation
+    with _deepl_translation_lock:
+        if _deepl_translation is None:
+            _deepl_translation = DeepLTranslation()
+        return _deepl_translation
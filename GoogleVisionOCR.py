@@ -1,7 +1,17 @@
 import base64
 import requests
 import io
-from Creds import google_vision_api_key  # Import the API key from Creds.py
+import threading
+import cv2
+import numpy as np
+from HttpSession import get_http_session
+from TextRegionDetection import estimate_text_height
+
+# The annotate endpoint accepts at most this many images per request
+VISION_MAX_IMAGES_PER_REQUEST = 16
+# Images are downscaled until their text is about this many pixels tall, Vision reads text reliably well below that
+VISION_MIN_TEXT_HEIGHT = 20
+VISION_JPEG_QUALITY = 90
 
 # Class for handling Google Vision OCR 
 class GoogleVisionOCR:
@@ -9,86 +19,168 @@ class GoogleVisionOCR:
         """
         Initialise the Google Vision OCR using the API key from Creds.py.
         """
+        # Import the API key here so a missing Creds.py only disables Google Vision instead of every snip
+        try:
+            from Creds import google_vision_api_key
+        except ImportError:
+            google_vision_api_key = None
         self.api_key = google_vision_api_key
+        self.endpoint = "https://vision.googleapis.com/v1/images:annotate"
+
+    def encode_image(self, image):
+        """
+        Encode an image for the annotate request in memory.
+        Images whose text is taller than VISION_MIN_TEXT_HEIGHT are downscaled first and sent as JPEG.
+        :param image: PIL image, NumPy frame (BGRA, BGR or greyscale) or path to an image file (sent unchanged).
+        :return: Tuple of (encoded bytes, scale factor that was applied).
+        """
+        if isinstance(image, str):
+            with io.open(image, 'rb') as image_file:
+                return image_file.read(), 1.0
+
+        if isinstance(image, np.ndarray):
+            pixels = image
+            if pixels.ndim == 3 and pixels.shape[2] == 4:
+                pixels = cv2.cvtColor(pixels, cv2.COLOR_BGRA2BGR)  # JPEG has no alpha channel
+        else:
+            pixels = cv2.cvtColor(np.asarray(image.convert("RGB")), cv2.COLOR_RGB2BGR)
+
+        grey = pixels if pixels.ndim == 2 else cv2.cvtColor(pixels, cv2.COLOR_BGR2GRAY)
+        text_height = estimate_text_height(grey)
+        scale = 1.0
+        if text_height and text_height > VISION_MIN_TEXT_HEIGHT:
+            scale = VISION_MIN_TEXT_HEIGHT / text_height
+            pixels = cv2.resize(pixels, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
 
-    def perform_ocr(self, image_path):
+        success, encoded = cv2.imencode(".jpg", pixels, [cv2.IMWRITE_JPEG_QUALITY, VISION_JPEG_QUALITY])
+        if not success:
+            raise ValueError("Failed to encode image for Google Vision OCR")
+        return encoded.tobytes(), scale
+
+    def perform_ocr(self, image):
         """
         Perform OCR using Google Vision API with the API key.
-        :param image_path: Path to the image file.
+        :param image: PIL image, NumPy frame or path to the image file.
         :return: Dictionary with 'full_text' and 'paragraphs' (bounding boxes and text).
         """
+        return self.perform_ocr_batch([image])[0]
+
+    def perform_ocr_batch(self, images):
+        """
+        Perform OCR on several images, sending up to VISION_MAX_IMAGES_PER_REQUEST images in each annotate request.
+        :param images: List of PIL images, NumPy frames or image paths.
+        :return: List of dictionaries with 'full_text' and 'paragraphs', in the same order as the images.
+        """
+        results = []
+        for start in range(0, len(images), VISION_MAX_IMAGES_PER_REQUEST):
+            results.extend(self.annotate(images[start:start + VISION_MAX_IMAGES_PER_REQUEST]))
+        return results
+
+    def build_payload(self, encoded_images):
+        """
+        Build the images:annotate request body.
+        :param encoded_images: List of encoded image bytes.
+        """
+        return {
+            "requests": [
+                {
+                    "image": {"content": base64.b64encode(content).decode("utf-8")},
+                    "features": [{"type": "DOCUMENT_TEXT_DETECTION"}],  # Uses DOCUMENT_TEXT_DETECTION for for better results
+                }
+                for content in encoded_images
+            ]
+        }
+
+    def annotate(self, images):
+        """
+        Send one annotate request for up to VISION_MAX_IMAGES_PER_REQUEST images.
+        """
+        empty_results = [{"full_text": "", "paragraphs": []} for _ in images]
         try:
-            print(f"DEBUG: Starting OCR for image: {image_path}")
-
-            # Load the image into memory
-            with io.open(image_path, 'rb') as image_file:
-                image_content = image_file.read()
-            print(f"DEBUG: Image loaded successfully. Size: {len(image_content)} bytes")
-
-            # Encode the image content in base64
-            encoded_image_content = base64.b64encode(image_content).decode("utf-8")
-            print(f"DEBUG: Image content encoded in base64.")
-
-            # Prepare the request payload
-            url = f"https://vision.googleapis.com/v1/images:annotate?key={self.api_key}"
-            payload = {
-                "requests": [
-                    {
-                        "image": {"content": encoded_image_content},
-                        "features": [{"type": "DOCUMENT_TEXT_DETECTION"}],  # Uses DOCUMENT_TEXT_DETECTION for for better results
-                    }
-                ]
-            }
-
-            # Send the request to the Vision API
-            response = requests.post(url, json=payload)
+            print(f"DEBUG: Starting Google Vision OCR for {len(images)} image(s)")
+            encoded = [self.encode_image(image) for image in images]
+            print(f"DEBUG: Images encoded in memory. Sizes: {[len(content) for content, _ in encoded]} bytes")
+
+            # Send the request to the Vision API over the shared keep-alive session
+            url = f"{self.endpoint}?key={self.api_key}"
+            response = get_http_session().post(url, json=self.build_payload([content for content, _ in encoded]))
             print(f"DEBUG: Request sent to Google Vision API. Status code: {response.status_code}")
             response.raise_for_status()  # Raise an error for bad responses
 
-            # Parse the response
-            result = response.json()
-
-            full_text_annotation = result.get("responses", [{}])[0].get("fullTextAnnotation", {})
-            if not full_text_annotation:
-                print("DEBUG: No structured text detected by Google Vision OCR.")
-                return {"full_text": "", "paragraphs": []}
-
-            # Extract full text
-            full_text = full_text_annotation.get("text", "")
-            print(f"DEBUG: Extracted full text: {full_text}")
-
-            # Extract paragraphs with bounding boxes
-            paragraphs = []
-            for page in full_text_annotation.get("pages", []):
-                for block in page.get("blocks", []):
-                    for paragraph in block.get("paragraphs", []):
-                        paragraph_text = ""
-                        for word in paragraph.get("words", []):
-                            word_text = "".join([symbol.get("text", "") for symbol in word.get("symbols", [])])
-                            paragraph_text += word_text + " "
-                        bounding_box = paragraph.get("boundingBox", {}).get("vertices", [])
-
-                        # Convert bounding box vertices to x, y, width, height
-                        if len(bounding_box) == 4:
-                            x = bounding_box[0].get("x", 0)
-                            y = bounding_box[0].get("y", 0)
-                            width = bounding_box[2].get("x", 0) - x
-                            height = bounding_box[2].get("y", 0) - y
-                            paragraphs.append({
-                                "text": paragraph_text.strip(),
-                                "x": x,
-                                "y": y,
-                                "width": width,
-                                "height": height
-                            })
-
-            print(f"DEBUG: Extracted {len(paragraphs)} paragraphs with bounding boxes.")
-            return {"full_text": full_text, "paragraphs": paragraphs}
+            responses = response.json().get("responses", [])
+            return [
+                parse_annotate_response(responses[i] if i < len(responses) else {}, scale)
+                for i, (_, scale) in enumerate(encoded)
+            ]
 
         except requests.exceptions.RequestException as req_error:
             print(f"DEBUG: Request error during Google Vision OCR: {req_error}")
-            return {"full_text": "", "paragraphs": []}
+            return empty_results
 
         except Exception as e:
             print(f"DEBUG: General error during Google Vision OCR: {e}")
-            return {"full_text": "", "paragraphs": []}
\ No newline at end of file
+            return empty_results
+
+
+def parse_annotate_response(image_response, scale=1.0):
+    """
+    Convert one entry of the annotate "responses" list to the OCR result structure.
+    :param image_response: Response dictionary for one image.
+    :param scale: Scale factor the image was resized by before upload, boxes are mapped back to the original size.
+    :return: Dictionary with 'full_text' and 'paragraphs' (bounding boxes and text).
+    """
+    if "error" in image_response:
+        print(f"DEBUG: Google Vision OCR error: {image_response['error'].get('message', image_response['error'])}")
+        return {"full_text": "", "paragraphs": []}
+
+    full_text_annotation = image_response.get("fullTextAnnotation", {})
+    if not full_text_annotation:
+        print("DEBUG: No structured text detected by Google Vision OCR.")
+        return {"full_text": "", "paragraphs": []}
+
+    # Extract full text
+    full_text = full_text_annotation.get("text", "")
+    print(f"DEBUG: Extracted full text: {full_text}")
+
+    # Extract paragraphs with bounding boxes
+    paragraphs = []
+    for page in full_text_annotation.get("pages", []):
+        for block in page.get("blocks", []):
+            for paragraph in block.get("paragraphs", []):
+                paragraph_text = ""
+                for word in paragraph.get("words", []):
+                    word_text = "".join([symbol.get("text", "") for symbol in word.get("symbols", [])])
+                    paragraph_text += word_text + " "
+                bounding_box = paragraph.get("boundingBox", {}).get("vertices", [])
+
+                # Convert bounding box vertices to x, y, width, height in the original image's pixels
+                if len(bounding_box) == 4:
+                    x = bounding_box[0].get("x", 0)
+                    y = bounding_box[0].get("y", 0)
+                    width = bounding_box[2].get("x", 0) - x
+                    height = bounding_box[2].get("y", 0) - y
+                    paragraphs.append({
+                        "text": paragraph_text.strip(),
+                        "x": round(x / scale),
+                        "y": round(y / scale),
+                        "width": round(width / scale),
+                        "height": round(height / scale)
+                    })
+
+    print(f"DEBUG: Extracted {len(paragraphs)} paragraphs with bounding boxes.")
+    return {"full_text": full_text, "paragraphs": paragraphs}
+
+
+# Shared Google Vision client so it is only created once per process
+_google_vision_ocr = None
+_google_vision_ocr_lock = threading.Lock()
+
+def get_google_vision_ocr():
+    """
+    Return the process-wide GoogleVisionOCR client, creating it on first use.
+    """
+    global _google_vision_ocr
+    with _google_vision_ocr_lock:
+        if _google_vision_ocr is None:
+            _google_vision_ocr = GoogleVisionOCR()
+        return _google_vision_ocr
@@ -1,25 +1,23 @@
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox
-from PIL import Image
-from gtts import gTTS
-import os
-from Translation import TranslationHandling
-from DeepLTranslation import DeepLTranslation
-import pygame
+import importlib
+import sys
 import threading
+import time
 from screeninfo import get_monitors
-import mss
-import cv2
-import numpy as np
-import pytesseract
-from GoogleVisionOCR import GoogleVisionOCR
 import webbrowser
-from PipelineForOCR import perform_ocr, perform_translation
-
-# Import the API keys to check if they are set correctly
-# If they are not the related options will be disabled in the GUI
-from Creds import deepl_api_key, google_vision_api_key
+from LocalTranslation import LocalTranslation, get_local_translation
+from ScriptDetection import AUTO_DETECT_LANGUAGE
+# Heavy modules (pygame, gTTS, OpenCV, NumPy, mss, aiohttp, the OCR pipeline and the translation clients)
+# are imported inside the methods that use them so the window appears without waiting for them
+
+# Fast start: show the window first, then validate the API keys and build the Text Translation tab
+FAST_START = True
+# Delay after the first paint before the Text Translation tab is built (it is built straight away if it is opened sooner)
+FAST_START_DEFER_MS = 200
+# Modules imported on a background thread after the first paint so the first snip does not wait for them
+FAST_START_PRELOAD_MODULES = ("numpy", "mss", "PipelineForOCR", "AsyncGoogleVisionOCR", "RegionWatcher", "TextToSpeech")
 
 # Class that handles the GUI for the Live-Translate application along with the related functionality
 class MainGui(ctk.CTk):
@@ -35,6 +33,21 @@ class MainGui(ctk.CTk):
         # Keep a reference to the translation popup so it gets reused
         self.translation_popup = None
 
+        # Keep a reference to the region overlay and its labels so they get updated in place
+        self.translation_overlay = None
+        self.translation_overlay_labels = []
+
+        # Capture loop for the watch region (live) mode, None when not watching
+        self.region_watcher = None
+
+        # Time-to-first-text tracking: when the current capture was taken and the history of past measurements
+        self.first_text_pending_since = None
+        self.time_to_first_text_history = []
+        # Incremented for every translation so late paragraph updates from an older capture are ignored.
+        # Snip and watcher threads both start translations, so it is only incremented with the lock held.
+        self.translation_generation = 0
+        self.translation_generation_lock = threading.Lock()
+
         # Configure the main window to expand
         self.grid_rowconfigure(0, weight=1)  # Allow row 0 to expand
         self.grid_columnconfigure(0, weight=1)  # Allow column 0 to expand
@@ -60,7 +73,7 @@ class MainGui(ctk.CTk):
         self.header_frame.grid_columnconfigure(2, weight=1)
 
         # Create a Tabview widget for two pages inside main_frame
-        self.tabview = ctk.CTkTabview(self.main_frame)
+        self.tabview = ctk.CTkTabview(self.main_frame, command=self.on_tab_changed)
         self.tabview.grid(row=1, column=0, columnspan=2, sticky="nsew", padx=20, pady=(5,0))
 
         # Add the tabs to the Tabview
@@ -105,14 +118,10 @@ class MainGui(ctk.CTk):
         self.size_menu.set("1280x720")  # Set default size
         self.size_menu.grid(row=0, column=2, padx=(10,0), sticky="e")
 
-        # Check if the API keys for DeepL and Google Vision are set up correctly
-        # If not, later disable their use through the checkboxes in the GUI
-        self.deepl_enabled = self.is_deepl_enabled()
-        self.google_vision_enabled = self.is_google_vision_enabled()
-
-        # Show an error message if either API key is invalid so the user knows why the features are disabled
-        # Delay showing the error so the GUI loads onto the screen first
-        self.after(1500, self.show_api_key_error)  # Delay by 1.5 seconds
+        # The API keys for DeepL and Google Vision are checked on a background thread (validate_api_keys)
+        # Their checkboxes start disabled and are enabled by apply_api_key_state once the keys have been checked
+        self.deepl_enabled = False
+        self.google_vision_enabled = False
 
         # -----------------
         # Tab 1: OCR Translation
@@ -147,7 +156,7 @@ class MainGui(ctk.CTk):
         self.ocr_from_language_combo = ctk.CTkComboBox(
             self.ocr_tab_frame,
             width=160,
-            values=self.get_language_options("Chinese (Simplified)"),
+            values=self.get_language_options("Chinese (Simplified)", include_auto_detect=True),
             command=lambda language: self.change_dropdown(self.ocr_from_language_combo, language, "language")
         )
         self.ocr_from_language_combo.set("Chinese (Simplified)")
@@ -171,7 +180,8 @@ class MainGui(ctk.CTk):
         self.ocr_deepl_checkbox = ctk.CTkCheckBox(
             self.ocr_tab_frame,
             text="Use DeepL Instead Of Google Translate",
-            state="normal" if self.deepl_enabled else "disabled"
+            state="normal" if self.deepl_enabled else "disabled",
+            command=lambda: self.ocr_local_checkbox.deselect() if self.ocr_deepl_checkbox.get() else None
         )
         self.ocr_deepl_checkbox.grid(row=1, column=1, columnspan=2, padx=(10, 5), pady=(30, 30), sticky="w")
 
@@ -243,13 +253,48 @@ class MainGui(ctk.CTk):
         )
         self.preprocessing_checkbox.grid(row=4, column=0, columnspan=7, pady=(30,30))
 
+        # Add Watch Region checkbox to keep re-translating the selected region whenever its contents change
+        self.watch_region_checkbox = ctk.CTkCheckBox(
+            self.ocr_tab_frame,
+            text="Watch Region (Live Mode)",
+            command=self.toggle_watch_region
+        )
+        self.watch_region_checkbox.grid(row=5, column=1, columnspan=2, padx=(10,5), pady=(30,30), sticky="w")
+
+        # Add Watch Region Captures Per Second label
+        self.watch_fps_label = ctk.CTkLabel(self.ocr_tab_frame, text="Watch Region Captures Per Second:")
+        self.watch_fps_label.grid(row=5, column=4, padx=(20,5), pady=(30,30), sticky="e")
+
+        # Add Watch Region Captures Per Second dropdown
+        self.watch_fps_menu = ctk.CTkOptionMenu(
+            self.ocr_tab_frame,
+            values=self.get_watch_fps_options("2"),
+            command=lambda fps: self.change_dropdown(self.watch_fps_menu, fps, "fps")
+        )
+        self.watch_fps_menu.set("2")
+        self.watch_fps_menu.grid(row=5, column=5, padx=(0,10), pady=(30,30), sticky="w")
+
+        # Add Save Debug Images checkbox, off by default so snips are not written to disk unless asked for
+        self.save_debug_images_checkbox = ctk.CTkCheckBox(self.ocr_tab_frame, text="Save Debug Images")
+        self.save_debug_images_checkbox.grid(row=6, column=1, columnspan=2, padx=(10,5), pady=(30,30), sticky="w")
+
+        # Add A Checkbox To Translate Offline With Local Models (Disabled if argostranslate is not installed)
+        self.ocr_local_checkbox = ctk.CTkCheckBox(
+            self.ocr_tab_frame,
+            text="Translate Offline (Local Model)",
+            state="normal" if LocalTranslation.is_available() else "disabled",
+            command=lambda: self.toggle_local_translation(self.ocr_local_checkbox, self.ocr_deepl_checkbox,
+                                                          self.ocr_from_language_combo, self.ocr_to_language_combo)
+        )
+        self.ocr_local_checkbox.grid(row=6, column=4, columnspan=2, padx=(20,5), pady=(30,30), sticky="w")
+
         # Add Select & Translate button
         self.select_area_btn = ctk.CTkButton(
             self.ocr_tab_frame,
             text="Select & Translate",
             command=self.start_snip
         )
-        self.select_area_btn.grid(row=5, column=0, columnspan=7, pady=(30,30))
+        self.select_area_btn.grid(row=7, column=0, columnspan=7, pady=(30,30))
 
         # Add A Checkbox to Use Google Vision OCR Instead Of Tesseract OCR (Disabled if Google Vision API key is not set up correctly)
         self.use_google_vision_checkbox = ctk.CTkCheckBox(
@@ -260,6 +305,25 @@ class MainGui(ctk.CTk):
         self.use_google_vision_checkbox.grid(row=2, column=1, columnspan=2, padx=(10, 5), pady=(30, 30), sticky="w")
 
 
+        # With fast start the Text Translation tab is built after the window is on screen
+        self.text_translation_tab_built = False
+        if FAST_START:
+            self.after_idle(self.on_first_paint)
+        else:
+            self.build_text_translation_tab()
+            threading.Thread(target=self.validate_api_keys, daemon=True).start()
+
+        # Bind the right Alt key as a hotkey to re-trigger the snip process
+        self.bind("<Alt_R>", lambda event: self.start_snip())
+
+    def build_text_translation_tab(self):
+        """
+        Create the widgets of the Text Translation tab. Only the first call does anything.
+        """
+        if self.text_translation_tab_built:
+            return
+        self.text_translation_tab_built = True
+
         # -----------------
         # Tab 2: Text Translation
         # Add a scrollable frame for the Text Translation tab
@@ -331,31 +395,98 @@ class MainGui(ctk.CTk):
         self.text_deepl_checkbox = ctk.CTkCheckBox(
             self.text_translation_tab_frame,
             text="Use DeepL Instead Of Google Translate",
-            state="normal" if self.deepl_enabled else "disabled"
+            state="normal" if self.deepl_enabled else "disabled",
+            command=lambda: self.text_local_checkbox.deselect() if self.text_deepl_checkbox.get() else None
         )
         self.text_deepl_checkbox.grid(row=5, column=0, columnspan=2, padx=10, pady=10)
 
+        # Add a Checkbox To Translate Offline With Local Models (Disabled if argostranslate is not installed)
+        self.text_local_checkbox = ctk.CTkCheckBox(
+            self.text_translation_tab_frame,
+            text="Translate Offline (Local Model)",
+            state="normal" if LocalTranslation.is_available() else "disabled",
+            command=lambda: self.toggle_local_translation(self.text_local_checkbox, self.text_deepl_checkbox,
+                                                          self.from_language_combo, self.to_language_combo)
+        )
+        self.text_local_checkbox.grid(row=6, column=0, columnspan=2, padx=10, pady=10)
+
         # Add "Enable Text To Speech" checkbox to Text Translation tab
         self.text_tts_checkbox = ctk.CTkCheckBox(self.text_translation_tab_frame, text="Enable Text To Speech")
-        self.text_tts_checkbox.grid(row=6, column=0, columnspan=2, padx=10, pady=(10, 0))
+        self.text_tts_checkbox.grid(row=7, column=0, columnspan=2, padx=10, pady=(10, 0))
 
         # Add a label for the volume slider with dynamic percentage to Text Translation tab
         self.text_volume_label = ctk.CTkLabel(self.text_translation_tab_frame, text="Text To Speech Volume: 20%")
-        self.text_volume_label.grid(row=7, column=0, columnspan=2, padx=10, pady=(5, 0))
+        self.text_volume_label.grid(row=8, column=0, columnspan=2, padx=10, pady=(5, 0))
         
         # Add volume slider for Text Translation tab
         self.text_volume_slider = ctk.CTkSlider(self.text_translation_tab_frame, from_=0.0, to=1.0, width=150, command=self.update_text_volume_label)
         self.text_volume_slider.set(0.2)  # Default volume (20%)
-        self.text_volume_slider.grid(row=8, column=0, columnspan=2, padx=10, pady=(5, 0))
+        self.text_volume_slider.grid(row=9, column=0, columnspan=2, padx=10, pady=(5, 0))
 
-        # Bind the right Alt key as a hotkey to re-trigger the snip process
-        self.bind("<Alt_R>", lambda event: self.start_snip())
+    def on_tab_changed(self):
+        """
+        Build the Text Translation tab straight away if it is opened before the deferred build ran.
+        """
+        if self.tabview.get() == "Text Translation":
+            self.build_text_translation_tab()
+
+    def on_first_paint(self):
+        """
+        Fast start work that waits until the window is on screen: API key validation and module preloading
+        run on background threads and the Text Translation tab is built shortly after.
+        """
+        threading.Thread(target=self.validate_api_keys, daemon=True).start()
+        threading.Thread(target=self.preload_modules, daemon=True).start()
+        self.after(FAST_START_DEFER_MS, self.build_text_translation_tab)
 
-    def get_language_options(self, selected_language):
+    def preload_modules(self):
+        """
+        Import the heavy modules in the background so the first snip or translation does not wait for them.
+        """
+        for module_name in FAST_START_PRELOAD_MODULES:
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                print(f"DEBUG: Could not preload {module_name}: {e}")
+
+    def validate_api_keys(self):
+        """
+        Check the API keys on a background thread and hand the result to the GUI thread.
+        The result of each check is cached on disk, so later launches only go to the network when a key changes
+        or the cached result is older than API_KEY_CACHE_TTL_SECONDS.
+        """
+        deepl_enabled = self.is_deepl_enabled()
+        google_vision_enabled = self.is_google_vision_enabled()
+        self.after(0, lambda: self.apply_api_key_state(deepl_enabled, google_vision_enabled))
+
+    def apply_api_key_state(self, deepl_enabled, google_vision_enabled):
+        """
+        Enable the DeepL and Google Vision checkboxes whose API keys are valid, then report any invalid keys.
+        """
+        self.deepl_enabled = deepl_enabled
+        self.google_vision_enabled = google_vision_enabled
+        if google_vision_enabled:
+            self.use_google_vision_checkbox.configure(state="normal")
+        if deepl_enabled:
+            from DeepLTranslation import get_deepl_translation
+            deepl = get_deepl_translation()
+            checkboxes = [(self.ocr_deepl_checkbox, self.ocr_from_language_combo, self.ocr_to_language_combo)]
+            if self.text_translation_tab_built:
+                checkboxes.append((self.text_deepl_checkbox, self.from_language_combo, self.to_language_combo))
+            for checkbox, from_combo, to_combo in checkboxes:
+                # Languages DeepL does not support keep the checkbox disabled, the same as change_dropdown does
+                if (deepl.is_language_supported(from_combo.get().replace(" ✓", "")) and
+                        deepl.is_language_supported(to_combo.get().replace(" ✓", ""))):
+                    checkbox.configure(state="normal")
+        self.show_api_key_error()
+
+    def get_language_options(self, selected_language, include_auto_detect=False):
         """
         Generate a list of language options with a checkmark after the currently selected language.
+        :param include_auto_detect: Add the Auto Detect option first, only used for the OCR source language.
         """
-        return [f"{language} ✓" if language == selected_language else language for language in self.available_language_names]
+        language_names = ([AUTO_DETECT_LANGUAGE] if include_auto_detect else []) + self.available_language_names
+        return [f"{language} ✓" if language == selected_language else language for language in language_names]
 
     def get_theme_options(self, selected_theme):
         """
@@ -371,6 +502,13 @@ class MainGui(ctk.CTk):
         sizes = ["960x540", "1280x720", "1600x900"]
         return [f"{size} ✓" if size == selected_size else size for size in sizes]
 
+    def get_watch_fps_options(self, selected_fps):
+        """
+        Generate a list of watch region capture rates with a checkmark after the currently selected rate.
+        """
+        rates = ["1", "2", "5", "10"]
+        return [f"{rate} ✓" if rate == selected_fps else rate for rate in rates]
+
     def get_monitor_options(self, selected_index):
         """
         Generate a list of monitor options with a checkmark after the currently selected monitor.
@@ -380,25 +518,40 @@ class MainGui(ctk.CTk):
             for i, monitor in enumerate(self.monitors)
         ]
 
+    def toggle_local_translation(self, local_checkbox, deepl_checkbox, from_combo, to_combo):
+        """
+        Untick DeepL when offline translation is ticked and start loading the local model for the selected languages.
+        """
+        if local_checkbox.get():
+            deepl_checkbox.deselect()
+            get_local_translation().preload(from_combo.get().replace(" ✓", ""), to_combo.get().replace(" ✓", ""))
+
     def is_deepl_enabled(self):
         """
-        Check if DeepL API key is valid.
+        Check if DeepL API key is valid. Can send a request to DeepL, so it is called on a background thread.
         :return: True if valid, False otherwise.
         """
-        if not os.path.exists("Creds.py"):
+        # Import the API key here so a missing Creds.py only disables the feature
+        try:
+            from Creds import deepl_api_key
+        except ImportError:
             return False
-        # Check if the API key not null, an empty string, or the default placeholder
-        return deepl_api_key and deepl_api_key != "YOUR_DEEPL_API_KEY_HERE"
+        # Empty keys and the default placeholder are rejected without a request, other keys are checked against DeepL
+        from ApiKeyValidation import get_api_key_validator
+        return get_api_key_validator().is_valid("deepl", deepl_api_key)
     
     def is_google_vision_enabled(self):
         """
-        Check if Google Vision API key is valid.
+        Check if Google Vision API key is valid. Can send a request to Google Vision, so it is called on a background thread.
         :return: True if valid, False otherwise.
         """
-        if not os.path.exists("Creds.py"):
+        try:
+            from Creds import google_vision_api_key
+        except ImportError:
             return False
-        # Check if the API key not null, an empty string, or the default placeholder
-        return google_vision_api_key and google_vision_api_key != "YOUR_GOOGLE_VISION_API_KEY_HERE"
+        # Empty keys and the default placeholder are rejected without a request, other keys are checked against Google Vision
+        from ApiKeyValidation import get_api_key_validator
+        return get_api_key_validator().is_valid("google_vision", google_vision_api_key)
     
     def show_api_key_error(self):
         """
@@ -438,8 +591,9 @@ class MainGui(ctk.CTk):
 
         # Determine which options to use based on the option_type
         if option_type == "language":
-            options = self.get_language_options(selected_value)
-            deepl = DeepLTranslation()
+            from DeepLTranslation import get_deepl_translation
+            options = self.get_language_options(selected_value, include_auto_detect=dropdown is self.ocr_from_language_combo)
+            deepl = get_deepl_translation()
 
             # Determine which tab the dropdown belongs to
             if dropdown in [self.ocr_from_language_combo, self.ocr_to_language_combo]:
@@ -487,6 +641,11 @@ class MainGui(ctk.CTk):
             # Apply the selected size
             desired_width, desired_height = map(int, selected_value.split('x'))
             self.geometry(f"{desired_width}x{desired_height}")
+        elif option_type == "fps":
+            options = self.get_watch_fps_options(selected_value)
+            # Apply the new capture rate to a running watcher straight away
+            if self.region_watcher is not None:
+                self.region_watcher.interval = 1.0 / float(selected_value)
         else:
             raise ValueError(f"Unknown option_type: {option_type}")
 
@@ -550,75 +709,22 @@ class MainGui(ctk.CTk):
     
     def speak_text(self, text, language_name, volume=0.5):
         """
-        Uses gTTS to convert text to speech and play it using pygame in a separate thread.
+        Uses gTTS to convert text to speech and play it using pygame.
         Adjusts the volume based on the slider value.
+        :param text: A text, or a list of paragraphs that are spoken one after another.
+        Anything still being spoken from an earlier call is replaced.
         """
-        # Correct mapping of language names to gTTS language codes as they are not the same as the Google Translate or OCR ones
-        tts_language_map = {
-            'English': 'en',
-            'Spanish': 'es',
-            'French': 'fr',
-            'German': 'de',
-            'Chinese (Simplified)': 'zh-CN',
-            'Japanese': 'ja',
-            'Korean': 'ko',
-            'Russian': 'ru',
-            'Italian': 'it',
-            'Portuguese': 'pt',
-            'Dutch': 'nl',
-            'Greek': 'el',
-            'Arabic': 'ar',
-            'Hindi': 'hi',
-            'Bengali': 'bn',
-            'Turkish': 'tr',
-            'Vietnamese': 'vi',
-            'Polish': 'pl',
-            'Ukrainian': 'uk',
-            'Hebrew': 'iw',
-            'Swedish': 'sv',
-            'Norwegian': 'no',
-            'Finnish': 'fi',
-            'Danish': 'da',
-            'Hungarian': 'hu',
-            'Czech': 'cs',
-            'Romanian': 'ro',
-            'Thai': 'th',
-            'Indonesian': 'id',
-            'Malay': 'ms',
-            'Filipino': 'tl',
-            'Swahili': 'sw',
-        }
-    
-        # Get the correct gTTS language code
-        language_code = tts_language_map.get(language_name, 'en')  # Default to English if not found
-    
-        def play_audio():
-            try:
-                tts = gTTS(text=text, lang=language_code)
-                audio_file = "output.mp3"
-                tts.save(audio_file)
-    
-                # Initialise pygame mixer and set volume
-                pygame.mixer.init()
-                pygame.mixer.music.load(audio_file)
-                pygame.mixer.music.set_volume(volume)  # Set volume
-                pygame.mixer.music.play()
-                print(f"DEBUG: Audio playback started for text: {text} at volume: {volume}")
-    
-                # Wait for the audio to finish playing
-                while pygame.mixer.music.get_busy():
-                    pygame.time.wait(1000)  # Wait for 1s to avoid busy-waiting
-    
-                # Stop the music and clean up the audio file
-                print(f"DEBUG: Audio playback ended for text: {text}")
-                pygame.mixer.music.stop()
-                pygame.mixer.quit()
-                os.remove(audio_file)
-            except Exception as e:
-                print(f"Error in TTS: {e}")
-    
-        # Run the audio playback in a separate thread
-        threading.Thread(target=play_audio, daemon=True).start()
+        from TextToSpeech import get_speech_queue
+        get_speech_queue().speak_all(text if isinstance(text, list) else [text], language_name, volume)
+
+    def stop_speaking(self):
+        """
+        Stop the text to speech of the previous translation, if any was started.
+        """
+        # Nothing can be playing if TextToSpeech was never imported, so there is no need to load pygame here
+        if "TextToSpeech" in sys.modules:
+            sys.modules["TextToSpeech"].get_speech_queue().cancel()
+
     def translate_action(self):
         """
         Called when user clicks the Translate button.
@@ -626,8 +732,10 @@ class MainGui(ctk.CTk):
         then uses the appropriate translation service to perform the translation.
         """
 
+        from Translation import TranslationHandling
+        from DeepLTranslation import get_deepl_translation
         translator = TranslationHandling()
-        deepl = DeepLTranslation()
+        deepl = get_deepl_translation()
         languages = translator.get_available_languages()
         selected_from = self.from_language_combo.get()
         selected_to = self.to_language_combo.get()
@@ -639,15 +747,19 @@ class MainGui(ctk.CTk):
             dest_key = '1'
         text = self.input_textbox.get("1.0", "end").strip()
 
-        # Check if DeepL is enabled
-        if self.text_deepl_checkbox.get():
+        # Check if offline translation or DeepL is enabled
+        if self.text_local_checkbox.get():
+            translation_result = get_local_translation().translate_text(text, selected_to, source_language=selected_from)
+            print(f"DEBUG: Translated text using local model: {translation_result}")
+        elif self.text_deepl_checkbox.get():
             translation_result = deepl.translate_text(text, target_language=selected_to)
             print(f"DEBUG: Translated text using DeepL: {translation_result}")
         else:
-            translation_result = translator.translator.translate(
-                text, src=languages.get(src_key, ('', None))[1],
-                dest=languages.get(dest_key, ('English', 'en'))[1]
-            ).text
+            translation_result = translator.translate_text(
+                text,
+                dest_language=languages.get(dest_key, ('English', 'en'))[1],
+                src_language=languages.get(src_key, ('', 'auto'))[1]
+            )
             print(f"DEBUG: Translated text using Google Translate: {translation_result}")
 
         self.output_textbox.delete("1.0", "end")
@@ -720,17 +832,21 @@ class MainGui(ctk.CTk):
         region = {"top": int(top), "left": int(left), "width": int(right - left), "height": int(bottom - top)}
         print(f"DEBUG: Selected region {region}")
 
+        import mss
+        import numpy as np
+
         # Use mss to capture the selected region
+        # The BGRA buffer mss returns is wrapped as a NumPy array without copying it
         with mss.mss() as sct:
             try:
-                snip_image = sct.grab(region)
-                snip_image = Image.frombytes("RGB", snip_image.size, snip_image.rgb)
+                screenshot = sct.grab(region)
+                snip_image = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(screenshot.height, screenshot.width, 4)
             except Exception as e:
                 print(f"DEBUG: Error capturing region with mss: {e}")
                 return
 
         # Validate dimensions
-        w, h = snip_image.size
+        h, w = snip_image.shape[:2]
         print(f"DEBUG: Captured image size: {w}x{h}")
         if w == 0 or h == 0:
             print("DEBUG: Invalid capture region.")
@@ -739,20 +855,55 @@ class MainGui(ctk.CTk):
         # Close the snip overlay
         self.snip_overlay.destroy()
 
+        # A new selection replaces any region that is currently being watched and stops the previous text to speech
+        self.stop_watching()
+        self.stop_speaking()
+        if self.watch_region_checkbox.get():
+            # Give the snip overlay time to disappear before the first capture of the watched region
+            self.after(100, lambda: self.start_watching(region))
+            return
+
+        self.first_text_pending_since = time.perf_counter()
+        if self.use_google_vision_checkbox.get():
+            from AsyncGoogleVisionOCR import get_async_google_vision_ocr
+            # The request is sent from the async client's event loop, a newer snip cancels this one if it is still waiting
+            future = get_async_google_vision_ocr().submit(snip_image, channel="snip")
+            future.add_done_callback(lambda done: self.on_google_vision_result(done, region))
+            return
+
         # Perform OCR in a separate thread
         threading.Thread(target=self.perform_ocr_in_thread, args=(snip_image, region), daemon=True).start()
 
+    def on_google_vision_result(self, future, region):
+        """
+        Called from the Google Vision event loop when a snip's request finishes.
+        """
+        if future.cancelled():
+            return  # Superseded by a newer snip
+        try:
+            result = future.result()
+        except Exception as ocr_error:
+            print(f"DEBUG: OCR error: {ocr_error}")
+            return
+        print(f"DEBUG: Combined OCR text: {result['full_text']}")
+        self.process_ocr_result(result['full_text'], region, result['paragraphs'])
+
     def perform_ocr_in_thread(self, snip_image, region):
         """
         Perform OCR processing in a separate thread.
         """
+        from PipelineForOCR import perform_incremental_ocr
         try:
-            combined_text, paragraphs = perform_ocr(
+            combined_text, paragraphs = perform_incremental_ocr(
                 snip_image,
                 lang_name=self.ocr_from_language_combo.get(),
+                # Snipping the same region again only re-reads the paragraphs that changed
+                region_key=(region["left"], region["top"], region["width"], region["height"]),
                 use_preprocessing=self.enable_preprocessing.get(),
                 use_google_vision=self.use_google_vision_checkbox.get(),
-                debug=True
+                debug=self.save_debug_images_checkbox.get(),
+                # With Auto Detect the detected language is reused for later snips of the same region
+                script_cache_key=(region["left"], region["top"], region["width"], region["height"])
             )
             print(f"DEBUG: Combined OCR text: {combined_text}")
         except Exception as ocr_error:
@@ -762,6 +913,85 @@ class MainGui(ctk.CTk):
         # Process the OCR result
         self.process_ocr_result(combined_text, region, paragraphs)
 
+    def start_watching(self, region):
+        """
+        Start re-capturing the region at the selected rate, OCR and translation only run when its contents change.
+        """
+        from RegionWatcher import RegionWatcher
+        self.stop_watching()
+        watcher = RegionWatcher(
+            region,
+            on_change=lambda frame: self.process_watched_frame(frame, region, watcher),
+            fps=float(self.watch_fps_menu.get().replace(" ✓", ""))
+        )
+        self.region_watcher = watcher
+        watcher.start()
+
+    def stop_watching(self):
+        """
+        Stop the watch region capture loop if it is running.
+        """
+        if self.region_watcher is not None:
+            self.region_watcher.stop()
+            self.region_watcher = None
+
+    def toggle_watch_region(self):
+        """
+        Stop watching as soon as the Watch Region checkbox is unticked.
+        """
+        if not self.watch_region_checkbox.get():
+            self.stop_watching()
+
+    def is_current_watcher(self, watcher):
+        """
+        Check if a frame from this watcher should still be shown, it is dropped once the watcher was stopped or replaced.
+        :param watcher: The RegionWatcher that captured the frame, or None for a snip.
+        """
+        return watcher is None or (self.region_watcher is watcher and watcher.is_running())
+
+    def after_if_current(self, generation, watcher, callback):
+        """
+        Run a callback on the Tk thread, skipping it if a newer capture started translating or the watcher was stopped
+        in the meantime, so a slow older capture cannot replace the newer one's overlay or speech.
+        :param generation: The translation_generation assigned to the capture when its translation started, or None.
+        """
+        def run():
+            if generation in (None, self.translation_generation) and self.is_current_watcher(watcher):
+                callback()
+        self.after(0, run)
+
+    def process_watched_frame(self, frame, region, watcher):
+        """
+        Run OCR and translation for a changed frame of the watched region.
+        Called on the watcher thread, which waits for this to return before capturing again.
+        """
+        from PipelineForOCR import perform_incremental_ocr
+        self.first_text_pending_since = time.perf_counter()
+        try:
+            combined_text, paragraphs = perform_incremental_ocr(
+                frame,
+                lang_name=self.ocr_from_language_combo.get(),
+                # Only the paragraphs whose pixels changed since the last frame are OCR'd again
+                region_key=(region["left"], region["top"], region["width"], region["height"]),
+                use_preprocessing=self.enable_preprocessing.get(),
+                use_google_vision=self.use_google_vision_checkbox.get(),
+                # Realtime profile, each frame should be processed within one capture interval
+                latency_budget_ms=1000 / float(self.watch_fps_menu.get().replace(" ✓", "")),
+                script_cache_key=(region["left"], region["top"], region["width"], region["height"])
+            )
+        except Exception as ocr_error:
+            print(f"DEBUG: OCR error: {ocr_error}")
+            return
+
+        if not combined_text:
+            print("DEBUG: No text detected in watched region.")
+            return
+        if not self.is_current_watcher(watcher):
+            return  # Stopped while this frame was being read, the overlay was closed or replaced by a new snip
+
+        # Translate on the watcher thread as well so the next capture waits for this one to finish
+        self.perform_translation_in_thread(combined_text, self.ocr_to_language_combo.get(), region, paragraphs, watcher)
+
     def process_ocr_result(self, text, region, bounding_boxes):
         """
         Process the OCR result and initiate translation.
@@ -774,15 +1004,33 @@ class MainGui(ctk.CTk):
         selected_to_language = self.ocr_to_language_combo.get()
         threading.Thread(target=self.perform_translation_in_thread, args=(text, selected_to_language, region, bounding_boxes), daemon=True).start()
 
-    def perform_translation_in_thread(self, text, dest_language, region, bounding_boxes):
+    def perform_translation_in_thread(self, text, dest_language, region, bounding_boxes, watcher=None):
         """
         Perform translation in a separate thread.
+        For region-based output the overlay is shown straight away with the OCR text as a placeholder,
+        then each paragraph is swapped for its translation as soon as it finishes.
+        :param watcher: The RegionWatcher the text came from, nothing is shown once it has been stopped.
         """
+        from PipelineForOCR import perform_translation
+        with self.translation_generation_lock:
+            self.translation_generation += 1
+            generation = self.translation_generation
+        on_paragraph_translated = None
+        if self.region_based_checkbox.get():
+            self.after_if_current(generation, watcher, lambda: self.show_translation_in_region(region, [], bounding_boxes, placeholder=True))
+            on_paragraph_translated = lambda index, translated: self.after(
+                0, lambda: self.update_region_paragraph(generation, index, translated)
+            )
+
         try:
             translated_paragraphs = perform_translation(
                 bounding_boxes,
                 target_lang=dest_language,
-                use_deepl=self.ocr_deepl_checkbox.get()
+                use_deepl=self.ocr_deepl_checkbox.get(),
+                use_local=self.ocr_local_checkbox.get(),
+                source_lang=self.ocr_from_language_combo.get(),
+                parallel=True,
+                on_paragraph_translated=on_paragraph_translated
             )
             print(f"DEBUG: Translated paragraphs: {translated_paragraphs}")
         except Exception as translation_error:
@@ -790,19 +1038,44 @@ class MainGui(ctk.CTk):
             translated_paragraphs = []
 
         # Process the translation result
-        self.process_translation_result(translated_paragraphs, region, bounding_boxes)
+        self.process_translation_result(translated_paragraphs, region, bounding_boxes, watcher, generation)
 
-    def process_translation_result(self, translated_paragraphs, region=None, ocr_paragraphs=None):
+    def process_translation_result(self, translated_paragraphs, region=None, ocr_paragraphs=None, watcher=None, generation=None):
         """
         Process the translated text and update the GUI.
+        :param generation: The capture's translation_generation, nothing is shown or spoken once a newer capture has started.
         """
         if self.region_based_checkbox.get():
             # Use region-based translation
-            self.after(0, lambda: self.show_translation_in_region(region, translated_paragraphs, ocr_paragraphs))
+            self.after_if_current(generation, watcher, lambda: self.show_translation_in_region(region, translated_paragraphs, ocr_paragraphs))
         else:
             # Use popup-based translation
             combined_text = "\n".join(translated_paragraphs)
-            self.after(0, lambda: self.show_translation(region, combined_text))
+            self.after_if_current(generation, watcher, lambda: self.show_translation(region, combined_text))
+
+    def update_region_paragraph(self, generation, index, translated_text):
+        """
+        Replace the placeholder OCR text of one paragraph in the region overlay with its translation.
+        """
+        if generation != self.translation_generation or not translated_text:
+            return  # A newer capture has replaced the overlay or the translation failed
+        if self.translation_overlay is None or index >= len(self.translation_overlay_labels):
+            return
+        self.translation_overlay_labels[index].configure(text=translated_text, fg="black")
+        self.record_time_to_first_text()
+
+    def record_time_to_first_text(self):
+        """
+        Record the time from capturing the region to the first translated text appearing on screen.
+        Only the first text of each capture is counted.
+        """
+        if self.first_text_pending_since is None:
+            return
+        elapsed = time.perf_counter() - self.first_text_pending_since
+        self.first_text_pending_since = None
+        self.time_to_first_text_history.append(elapsed)
+        average = sum(self.time_to_first_text_history) / len(self.time_to_first_text_history)
+        print(f"DEBUG: Time to first text: {elapsed:.3f}s (average {average:.3f}s over {len(self.time_to_first_text_history)} captures)")
 
     def cancel_snip(self):
         """
@@ -837,6 +1110,7 @@ class MainGui(ctk.CTk):
         # Insert the translated text
         self.translation_textbox.insert("1.0", translated_text)
         self.translation_textbox.configure(state="disabled")  # Disable editing
+        self.record_time_to_first_text()
 
         # Calculate the required size for the textbox
         lines = translated_text.split("\n")
@@ -907,10 +1181,11 @@ class MainGui(ctk.CTk):
             new_width = max(20, (window_width - 40) // 8)  # Ensure a minimum width of 20 characters
             self.translation_textbox.configure(width=new_width)
 
-    def show_translation_in_region(self, region, translated_paragraphs, ocr_paragraphs):
+    def show_translation_in_region(self, region, translated_paragraphs, ocr_paragraphs, placeholder=False):
         """
         Display the translated text in the same region as the original snip area,
         scaled to the output monitor, using a frameless overlay.
+        :param placeholder: Show the OCR text in grey while the translations are still being fetched.
         """
         if not ocr_paragraphs:
             print("DEBUG: No paragraphs provided for region-based translation.")
@@ -950,34 +1225,36 @@ class MainGui(ctk.CTk):
         overlay_x = max(ox, min(overlay_x, ox + ow - overlay_w))
         overlay_y = max(oy, min(overlay_y, oy + oh - overlay_h))
 
-        # Destroy any existing overlay
-        if hasattr(self, 'translation_overlay') and self.translation_overlay.winfo_exists():
-            self.translation_overlay.destroy()
-
-        # Create frameless overlay
-        self.translation_overlay = tk.Toplevel(self)
-        self.translation_overlay.overrideredirect(True)        # No frame
-        self.translation_overlay.attributes("-topmost", True)  # Always on top
-        self.translation_overlay.config(bg="white")
+        # Reuse the existing overlay so repeated captures (e.g. a watched region) update it in place
+        if self.translation_overlay is None or not self.translation_overlay.winfo_exists():
+            # Create frameless overlay
+            self.translation_overlay = tk.Toplevel(self)
+            self.translation_overlay.overrideredirect(True)        # No frame
+            self.translation_overlay.attributes("-topmost", True)  # Always on top
+            self.translation_overlay.config(bg="white")
+            self.translation_overlay_labels = []
+
+            # Custom close “✕” button
+            self.translation_overlay_close_button = tk.Button(
+                self.translation_overlay,
+                text="✕",
+                bd=0,  # no border
+                highlightthickness=0,
+                font=("Arial", 12, "bold"),
+                bg="white",
+                activebackground="lightgrey",
+                command=self.close_translation_overlay
+            )
         self.translation_overlay.geometry(f"{overlay_w}x{overlay_h}+{overlay_x}+{overlay_y}")
-
-        # Custom close “✕” button
-        btn = tk.Button(
-            self.translation_overlay,
-            text="✕",
-            bd=0,  # no border
-            highlightthickness=0,
-            font=("Arial", 12, "bold"),
-            bg="white",
-            activebackground="lightgrey",
-            command=self.translation_overlay.destroy
-        )
-        btn.place(x=overlay_w - 20, y=4, width=16, height=16)
+        self.translation_overlay_close_button.place(x=overlay_w - 20, y=4, width=16, height=16)
 
         # Place each paragraph
+        spoken_texts = []
         for i, para in enumerate(ocr_paragraphs):
-            # Use the corresponding translated paragraph if available
-            text = translated_paragraphs[i] if i < len(translated_paragraphs) else para['text']
+            # Use the corresponding translated paragraph if available, otherwise show the OCR text greyed out
+            translated = translated_paragraphs[i] if i < len(translated_paragraphs) else None
+            text = translated or para['text']
+            text_colour = "black" if translated else "grey"
 
             # Scale and offset per-paragraph box
             sx = int(para['x'] * ow / iw) + padding
@@ -999,20 +1276,48 @@ class MainGui(ctk.CTk):
             # Choose a font size
             font_size = max(10, min(20, sh // 2))
 
-            lbl = tk.Label(
-                self.translation_overlay,
-                text=text,
-                bg="white",
-                fg="black",
-                font=("Arial", font_size),
-                anchor="nw",
-                justify="left",
-                wraplength=sw  # Wrap text to fit within the width of the label
-            )
+            # Update the label left by the previous capture if there is one, otherwise create it
+            if i < len(self.translation_overlay_labels):
+                lbl = self.translation_overlay_labels[i]
+                lbl.configure(text=text, fg=text_colour, font=("Arial", font_size), wraplength=sw)
+            else:
+                lbl = tk.Label(
+                    self.translation_overlay,
+                    text=text,
+                    bg="white",
+                    fg=text_colour,
+                    font=("Arial", font_size),
+                    anchor="nw",
+                    justify="left",
+                    wraplength=sw  # Wrap text to fit within the width of the label
+                )
+                self.translation_overlay_labels.append(lbl)
             lbl.place(x=sx, y=sy, width=sw, height=sh)
 
-            # Trigger TTS for each paragraph if enabled
-            if self.ocr_tts_checkbox.get():
-                selected_to = self.ocr_to_language_combo.get()  # Get the selected language name
-                volume = self.ocr_volume_slider.get()  # Get volume from slider
-                self.speak_text(text, selected_to, volume)  # Pass the language name
\ No newline at end of file
+            spoken_texts.append(text)
+
+        # Speak the paragraphs in order if TTS is enabled, placeholders are not spoken
+        # The speech queue synthesizes the next paragraphs while the current one plays and replaces anything from the previous capture
+        if not placeholder and self.ocr_tts_checkbox.get():
+            selected_to = self.ocr_to_language_combo.get()  # Get the selected language name
+            volume = self.ocr_volume_slider.get()  # Get volume from slider
+            self.speak_text(spoken_texts, selected_to, volume)  # Pass the language name
+
+        # Remove labels left over from a previous capture that had more paragraphs
+        for lbl in self.translation_overlay_labels[len(ocr_paragraphs):]:
+            lbl.destroy()
+        del self.translation_overlay_labels[len(ocr_paragraphs):]
+
+        if not placeholder and translated_paragraphs:
+            self.record_time_to_first_text()
+
+    def close_translation_overlay(self):
+        """
+        Close the region overlay, which also stops watching the region it belongs to and stops its text to speech.
+        """
+        self.stop_watching()
+        self.stop_speaking()
+        if self.translation_overlay is not None and self.translation_overlay.winfo_exists():
+            self.translation_overlay.destroy()
+        self.translation_overlay = None
+        self.translation_overlay_labels = []
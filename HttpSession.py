@@ -0,0 +1,78 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connection pool settings shared by the DeepL and Google Vision clients
+HTTP_POOL_SIZE = 10           # Keep-alive connections kept open per host
+HTTP_CONNECT_TIMEOUT = 5      # Seconds to wait for the TCP/TLS connection
+HTTP_READ_TIMEOUT = 30        # Seconds to wait for the API to respond
+HTTP_RETRIES = 3              # Retries for connection errors and retryable status codes
+HTTP_BACKOFF_FACTOR = 0.5     # Sleep between retries grows as 0.5s, 1s, 2s, ...
+HTTP_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# POSTs (DeepL translations, Vision annotations) are charged once the server processes them, so they are only retried
+# on connection errors and on these codes, which mean the request was turned away before it was processed
+HTTP_POST_RETRY_STATUS_CODES = (429, 503)
+
+# Retry policy that keeps read and 5xx retries to idempotent methods and retries POST only when it is safe to
+class ApiRetry(Retry):
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method.upper() == "POST":
+            return status_code in HTTP_POST_RETRY_STATUS_CODES
+        return super().is_retry(method, status_code, has_retry_after)
+
+# Session that keeps connections alive between requests and applies a default timeout to every call
+class PooledSession(requests.Session):
+    def __init__(self, pool_size=HTTP_POOL_SIZE, timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT),
+                 retries=HTTP_RETRIES, backoff_factor=HTTP_BACKOFF_FACTOR):
+        """
+        :param pool_size: Number of connections kept open per host.
+        :param timeout: Default (connect, read) timeout in seconds used when a call does not pass its own.
+        :param retries: Number of retries for failed connections and retryable status codes.
+        :param backoff_factor: Exponential backoff factor between retries.
+        """
+        super().__init__()
+        self.timeout = timeout
+        # Read timeouts and 5xx responses are only retried for the default idempotent methods,
+        # connection errors are retried for every method as nothing reached the server
+        retry = ApiRetry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=HTTP_RETRY_STATUS_CODES,
+            respect_retry_after_header=True,  # Wait as long as a 429/503 response asks before retrying
+            raise_on_status=False,  # Return the last response so the callers can log the API error
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+# Shared session used by the whole process so connections are reused across snips
+_session = None
+_session_lock = threading.Lock()
+
+def get_http_session():
+    """
+    Return the process-wide PooledSession, creating it on first use.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = PooledSession()
+        return _session
+
+def configure_http_session(**kwargs):
+    """
+    Replace the process-wide session with one using different pool, timeout or retry settings.
+    Takes the same keyword arguments as PooledSession. Clients pick the new session up on their next request.
+    """
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = PooledSession(**kwargs)
+        return _session
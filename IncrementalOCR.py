@@ -0,0 +1,126 @@
+import hashlib
+import threading
+import numpy as np
+
+# Pixels added around each paragraph box when it is hashed and re-OCR'd, so small layout shifts are caught
+INCREMENTAL_BOX_PADDING = 4
+# Number of regions whose previous frame is remembered
+INCREMENTAL_MAX_REGIONS = 16
+
+def hash_pixels(pixels):
+    return hashlib.blake2b(np.ascontiguousarray(pixels).data, digest_size=16).digest()
+
+# Class that re-OCRs only the paragraphs whose pixels changed since the previous capture of the same region
+class IncrementalOCR:
+    def __init__(self, max_regions=INCREMENTAL_MAX_REGIONS):
+        """
+        :param max_regions: Number of regions whose previous frame state is kept.
+        """
+        self.max_regions = max_regions
+        self.states = {}  # Region key -> {"shape", "settings", "boxes", "box_hashes", "outside_hash", "paragraphs"}
+        self.lock = threading.Lock()
+        self.stats = {"full": 0, "partial": 0, "unchanged": 0, "paragraphs_reused": 0, "paragraphs_ocrd": 0}
+
+    @staticmethod
+    def padded_boxes(paragraphs, shape):
+        height, width = shape[:2]
+        return [
+            (max(0, p["x"] - INCREMENTAL_BOX_PADDING), max(0, p["y"] - INCREMENTAL_BOX_PADDING),
+             min(width, p["x"] + p["width"] + INCREMENTAL_BOX_PADDING), min(height, p["y"] + p["height"] + INCREMENTAL_BOX_PADDING))
+            for p in paragraphs
+        ]
+
+    def build_state(self, frame, paragraphs, settings=None):
+        """
+        Hash every paragraph box and everything outside the boxes.
+        """
+        boxes = self.padded_boxes(paragraphs, frame.shape)
+        outside = frame.copy()
+        for x1, y1, x2, y2 in boxes:
+            outside[y1:y2, x1:x2] = 0
+        return {
+            "shape": frame.shape,
+            "settings": settings,
+            "boxes": boxes,
+            "box_hashes": [hash_pixels(frame[y1:y2, x1:x2]) for x1, y1, x2, y2 in boxes],
+            "outside_hash": hash_pixels(outside),
+            "paragraphs": paragraphs,
+        }
+
+    def perform(self, frame, key, ocr_function, settings=None):
+        """
+        OCR a frame, reusing the previous results of the same region for every paragraph box whose pixels did not change.
+        Falls back to a full OCR on the first frame, when the frame size or OCR settings change or when anything
+        outside the previous paragraph boxes changed (new text may have appeared there).
+        :param frame: NumPy frame (BGRA, BGR or greyscale) of the region.
+        :param key: Hashable id of the region.
+        :param ocr_function: Callable(image) -> list of paragraph dictionaries in that image's coordinates.
+        :param settings: Hashable OCR settings (language, preprocessing...) the previous results must have been read with.
+        :return: List of paragraph dictionaries in frame coordinates.
+        """
+        with self.lock:
+            previous = self.states.get(key)
+
+        paragraphs = None
+        if previous is not None and previous["shape"] == frame.shape and previous["settings"] == settings:
+            outside = frame.copy()
+            for x1, y1, x2, y2 in previous["boxes"]:
+                outside[y1:y2, x1:x2] = 0
+            if hash_pixels(outside) == previous["outside_hash"]:
+                paragraphs = self.update_changed_boxes(frame, previous, ocr_function)
+
+        if paragraphs is None:
+            self.stats["full"] += 1
+            paragraphs = ocr_function(frame)
+            self.stats["paragraphs_ocrd"] += len(paragraphs)
+
+        state = self.build_state(frame, paragraphs, settings)
+        with self.lock:
+            self.states.pop(key, None)
+            self.states[key] = state  # Most recently used last
+            while len(self.states) > self.max_regions:
+                self.states.pop(next(iter(self.states)))
+        return paragraphs
+
+    def update_changed_boxes(self, frame, previous, ocr_function):
+        """
+        Re-OCR the paragraph boxes whose hash changed and keep the previous paragraphs for the rest.
+        """
+        paragraphs = []
+        changed = 0
+        for (x1, y1, x2, y2), box_hash, paragraph in zip(previous["boxes"], previous["box_hashes"], previous["paragraphs"]):
+            crop = frame[y1:y2, x1:x2]
+            if hash_pixels(crop) == box_hash:
+                paragraphs.append(paragraph)
+                self.stats["paragraphs_reused"] += 1
+                continue
+            changed += 1
+            for new_paragraph in ocr_function(np.ascontiguousarray(crop)):
+                # Crop coordinates back to frame coordinates
+                new_paragraph["x"] += x1
+                new_paragraph["y"] += y1
+                paragraphs.append(new_paragraph)
+                self.stats["paragraphs_ocrd"] += 1
+
+        self.stats["partial" if changed else "unchanged"] += 1
+        print(f"DEBUG: Incremental OCR re-read {changed} of {len(previous['boxes'])} paragraphs")
+        return paragraphs
+
+    def forget(self, key):
+        with self.lock:
+            self.states.pop(key, None)
+
+
+# Shared instance so consecutive snips of the same region can reuse each other's results
+_incremental_ocr = None
+_incremental_ocr_lock = threading.Lock()
+
+def get_incremental_ocr():
+    """
+    Return the process-wide IncrementalOCR, creating it on first use.
+    """
+    global _incremental_ocr
+    with _incremental_ocr_lock:
+        if _incremental_ocr is None:
+            _incremental_ocr = IncrementalOCR()
+        return _incremental_ocr
@@ -0,0 +1,207 @@
+import importlib.util
+import threading
+import time
+from TranslationCache import get_translation_cache
+
+# argostranslate is optional. It runs OpenNMT models with CTranslate2 on the CPU, so translations need no network,
+# API key or quota once the model for a language pair has been installed.
+# Importing it loads CTranslate2 and its sentence splitter, so it is only imported on the first translation.
+ARGOS_AVAILABLE = importlib.util.find_spec("argostranslate") is not None
+argostranslate = None
+
+def import_argostranslate():
+    global argostranslate
+    if argostranslate is None and ARGOS_AVAILABLE:
+        import argostranslate.package
+        import argostranslate.translate
+    return argostranslate
+
+# Download and install the model for a language pair the first time it is used (a one-off download of about 100MB per model).
+# Set to False to only use models installed beforehand with argospm.
+LOCAL_TRANSLATION_AUTO_INSTALL = True
+# A language pair whose model could not be found or installed is tried again after this many seconds,
+# so a dropped connection during the download does not disable it for the rest of the session
+LOCAL_TRANSLATION_RETRY_SECONDS = 60
+
+# Class for translating text on this machine with Argos Translate instead of an online service
+class LocalTranslation:
+    def __init__(self):
+        self.cache = get_translation_cache()
+        self.translations = {}  # (source code, target code) -> loaded Argos translation
+        self.failures = {}  # (source code, target code) -> time.monotonic() of the last failed load
+        self.pair_locks = {}  # (source code, target code) -> lock held while that pair's model loads or runs
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def is_available():
+        """
+        Check if the argostranslate package is installed, without importing it.
+        """
+        return ARGOS_AVAILABLE
+
+    def get_language_code(self, language_name):
+        """
+        Map a language name to its Argos Translate (ISO 639-1) code.
+        :param language_name: The name of the language (e.g., "English").
+        :return: The Argos language code, or None if there is no local model for the language.
+        """
+        language_map = {
+            'English': 'en',
+            'Spanish': 'es',
+            'French': 'fr',
+            'German': 'de',
+            'Chinese (Simplified)': 'zh',
+            'Japanese': 'ja',
+            'Korean': 'ko',
+            'Russian': 'ru',
+            'Italian': 'it',
+            'Portuguese': 'pt',
+            'Dutch': 'nl',
+            'Greek': 'el',
+            'Arabic': 'ar',
+            'Hindi': 'hi',
+            'Bengali': 'bn',
+            'Turkish': 'tr',
+            'Vietnamese': 'vi',
+            'Polish': 'pl',
+            'Ukrainian': 'uk',
+            'Hebrew': 'he',
+            'Swedish': 'sv',
+            'Norwegian': 'nb',
+            'Finnish': 'fi',
+            'Danish': 'da',
+            'Hungarian': 'hu',
+            'Czech': 'cs',
+            'Romanian': 'ro',
+            'Thai': 'th',
+            'Indonesian': 'id',
+            'Malay': 'ms',
+            'Filipino': 'tl',
+        }
+        return language_map.get(language_name)
+
+    def install_pair(self, source_code, target_code):
+        """
+        Download and install the model for a language pair, going through English if there is no direct model.
+        :return: True if a model (or both halves of the English pivot) is now installed.
+        """
+        print(f"DEBUG: Installing local translation model {source_code} -> {target_code}...")
+        argostranslate.package.update_package_index()
+        installed = argostranslate.package.install_package_for_language_pair(source_code, target_code)
+        if not installed and "en" not in (source_code, target_code):
+            installed = (argostranslate.package.install_package_for_language_pair(source_code, "en") and
+                         argostranslate.package.install_package_for_language_pair("en", target_code))
+        # Some argostranslate versions cache the installed language list, reload it so the new model is found
+        if hasattr(argostranslate.translate.get_installed_languages, "cache_clear"):
+            argostranslate.translate.get_installed_languages.cache_clear()
+        return installed
+
+    def get_translation(self, source_code, target_code):
+        """
+        Return the translation for a language pair, loading it on first use and keeping it for later calls.
+        Must be called with the pair's lock held.
+        :return: Argos translation object, or None if no model is installed for the pair.
+        """
+        key = (source_code, target_code)
+        if key in self.translations:
+            return self.translations[key]
+        failed_at = self.failures.get(key)
+        if failed_at is not None and time.monotonic() - failed_at < LOCAL_TRANSLATION_RETRY_SECONDS:
+            return None  # Failed moments ago, every paragraph of a capture should not retry the download
+
+        translation = None
+        for attempt in range(2):
+            source = argostranslate.translate.get_language_from_code(source_code)
+            target = argostranslate.translate.get_language_from_code(target_code)
+            if source is not None and target is not None:
+                translation = source.get_translation(target)
+            if translation is not None or attempt or not LOCAL_TRANSLATION_AUTO_INSTALL:
+                break
+            try:
+                if not self.install_pair(source_code, target_code):
+                    break
+            except Exception as e:
+                print(f"DEBUG: Error installing local translation model {source_code} -> {target_code}: {e}")
+                break
+
+        if translation is None:
+            print(f"DEBUG: No local translation model installed for {source_code} -> {target_code}, "
+                  f"trying again in {LOCAL_TRANSLATION_RETRY_SECONDS}s")
+            self.failures[key] = time.monotonic()
+            return None
+        self.failures.pop(key, None)
+        self.translations[key] = translation
+        return translation
+
+    def get_pair_lock(self, key):
+        with self.lock:
+            return self.pair_locks.setdefault(key, threading.Lock())
+
+    def translate_text(self, text, target_language, source_language='English'):
+        """
+        Translate text on this machine.
+        :param text: The text to be translated.
+        :param target_language: The name of the target language (e.g., "English").
+        :param source_language: The name of the source language, local models cannot detect it.
+        :return: Translated text as a string, or None if the languages have no local model.
+        """
+        if import_argostranslate() is None:
+            print("DEBUG: argostranslate is not installed, local translation is unavailable.")
+            return None
+        source_code = self.get_language_code(source_language)
+        target_code = self.get_language_code(target_language)
+        if source_code is None or target_code is None:
+            print(f"DEBUG: No local translation for '{source_language}' -> '{target_language}'.")
+            return None
+        if source_code == target_code:
+            return text
+
+        cached = self.cache.get("local", source_code, target_code, text)
+        if cached is not None:
+            return cached
+
+        key = (source_code, target_code)
+        # The model is loaded on the first translation and the Argos translation objects are not thread safe
+        with self.get_pair_lock(key):
+            translation = self.get_translation(source_code, target_code)
+            if translation is None:
+                return None
+            translated_text = translation.translate(text)
+        self.cache.put("local", source_code, target_code, text, translated_text)
+        return translated_text
+
+    def preload(self, source_language, target_language):
+        """
+        Load the model for a language pair in the background so the first snip does not wait for it.
+        """
+        if not ARGOS_AVAILABLE:
+            return
+        source_code = self.get_language_code(source_language)
+        target_code = self.get_language_code(target_language)
+        if source_code is None or target_code is None or source_code == target_code:
+            return
+
+        def load():
+            import_argostranslate()
+            with self.get_pair_lock((source_code, target_code)):
+                translation = self.get_translation(source_code, target_code)
+                if translation is not None:
+                    translation.translate("Hello")  # Creates the CTranslate2 translator
+            print(f"DEBUG: Local translation model {source_code} -> {target_code} ready")
+
+        threading.Thread(target=load, daemon=True).start()
+
+
+# Shared local translator so each model is only loaded once per process
+_local_translation = None
+_local_translation_lock = threading.Lock()
+
+def get_local_translation():
+    """
+    Return the process-wide LocalTranslation, creating it on first use.
+    """
+    global _local_translation
+    with _local_translation_lock:
+        if _local_translation is None:
+            _local_translation = LocalTranslation()
+        return _local_translation
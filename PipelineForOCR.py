@@ -1,106 +1,104 @@
-import pytesseract
 from PIL import Image
 import cv2
 import numpy as np
 import os
-from GoogleVisionOCR import GoogleVisionOCR
+import threading
+import pytesseract
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from GoogleVisionOCR import get_google_vision_ocr
 from Translation import TranslationHandling
-from DeepLTranslation import DeepLTranslation
+from DeepLTranslation import get_deepl_translation
+from LocalTranslation import get_local_translation
+from TesseractEngine import get_tesseract_engine
+from PreprocessingPlan import get_preprocessing_plan
+from DebugImageSink import get_debug_image_sink
+from TextRegionDetection import detect_text_regions
+from ScriptDetection import AUTO_DETECT_LANGUAGE, get_script_detector
+from IncrementalOCR import get_incremental_ocr
+from TranslationCache import get_translation_cache
+from TranslationExecutor import get_translation_executor
 
-def preprocess_for_ocr(pil_img, language_code, debug=False, debug_dir="debug_images"):
+def frame_to_grey(image):
     """
-    Applies language-specific preprocessing tuned to benchmarked optimal parameters.
-    Uses minimal processing for languages that already achieve 100% accuracy across all testing.
+    Convert a captured frame to a single channel greyscale NumPy array in one step.
+    NumPy frames are expected in the OpenCV/mss channel order (BGRA or BGR), PIL images in RGB(A).
+    :param image: PIL image or NumPy array.
+    :return: 2D uint8 NumPy array.
     """
-    import os
-    if debug:
-        os.makedirs(debug_dir, exist_ok=True)
-        pil_img.save(f"{debug_dir}/original_image.png")
-
-    # Convert to OpenCV format and grayscale
-    img_cv = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
-    grey = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
-
-    """
-    After testing various preprocessing techniques through the OptimisePreProcessing.py helper app I made, the following configurations were found to be optimal for each language.
-    The configurations are based on the language code and include parameters for contrast, denoising, inversion, blurring, and thresholding.
-    This data can be found in the ocr_accuracy_parameter_search Completed Example.csv that was built using the OptimisePreProcessing.py helper app.
-    """
-    language_specific_configs = {
-        "ara":     {"contrast": 1.2, "denoise": 9,    "invert": False, "blur": "median",   "threshold": "adaptive_gaussian"},
-        "ben":     {"contrast": 1.2, "denoise": 1,    "invert": False, "blur": "median",   "threshold": "none"},
-        "chi_sim": {"contrast": 1.2, "denoise": None, "invert": False, "blur": "median",   "threshold": "otsu"},
-        "ell":     {"contrast": 1.0, "denoise": 3,    "invert": False, "blur": "none",     "threshold": "none"},
-        "hin":     {"contrast": 1.4, "denoise": None, "invert": False, "blur": "gaussian", "threshold": "otsu"},
-        "jpn":     {"contrast": 1.0, "denoise": None, "invert": False, "blur": "gaussian", "threshold": "none"},
-        "kor":     {"contrast": 1.4, "denoise": None, "invert": True,  "blur": "median",   "threshold": "none"},
-        "tha":     {"contrast": 1.0, "denoise": None, "invert": False, "blur": "gaussian", "threshold": "otsu"},
-    }
+    if isinstance(image, np.ndarray):
+        if image.ndim == 2:
+            return image
+        if image.shape[2] == 4:
+            return cv2.cvtColor(image, cv2.COLOR_BGRA2GRAY)
+        return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
 
+    if image.mode == "L":
+        return np.asarray(image)
+    if image.mode == "RGBA":
+        return cv2.cvtColor(np.asarray(image), cv2.COLOR_RGBA2GRAY)
+    return cv2.cvtColor(np.asarray(image.convert("RGB")), cv2.COLOR_RGB2GRAY)
+
+
+def frame_to_pil(image):
     """
-    For all other languages, use the default configuration.
-    All other languages were found to be 100% accurate without extensive preprocessing,
-    At least in the image tests I performed and evaluated.
-    Best-performing configurations for most languages.
-    This results in the image being just converted to grayscale and saved as a PNG.
+    Convert a captured frame to a PIL image for the code paths that still need one (e.g., Google Vision uploads).
+    :param image: PIL image or NumPy array in BGRA, BGR or greyscale.
+    :return: PIL image.
     """
-    default_config = {
-        "contrast": 1.0,
-        "denoise": None,
-        "invert": False,
-        "blur": "none",
-        "threshold": "none"
-    }
-    
-    config = language_specific_configs.get(language_code, default_config)
+    if not isinstance(image, np.ndarray):
+        return image
+    if image.ndim == 2:
+        return Image.fromarray(image)
+    if image.shape[2] == 4:
+        return Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGRA2RGB))
+    return Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
 
-    # Inversion
-    if config["invert"]:
-        grey = cv2.bitwise_not(grey)
-        if debug:
-            Image.fromarray(grey).save(f"{debug_dir}/inverted.png")
 
-    # Contrast
-    if config["contrast"] != 1.0:
-        grey = cv2.convertScaleAbs(grey, alpha=config["contrast"], beta=0)
-        if debug:
-            Image.fromarray(grey).save(f"{debug_dir}/contrast.png")
+def save_original_debug_image(image, debug_dir="debug_images"):
+    """
+    Save the captured frame before any preprocessing for debugging.
+    """
+    os.makedirs(debug_dir, exist_ok=True)
+    if isinstance(image, np.ndarray):
+        cv2.imwrite(f"{debug_dir}/original_image.png", image)
+    else:
+        image.save(f"{debug_dir}/original_image.png")
 
-    # Denoising
-    if config["denoise"] is not None:
-        grey = cv2.fastNlMeansDenoising(grey, None, h=config["denoise"])
-        if debug:
-            Image.fromarray(grey).save(f"{debug_dir}/denoised.png")
 
-    # Blur
-    if config["blur"] == "gaussian":
-        grey = cv2.GaussianBlur(grey, (3, 3), 0)
-        if debug:
-            Image.fromarray(grey).save(f"{debug_dir}/blur_gaussian.png")
-    elif config["blur"] == "median":
-        grey = cv2.medianBlur(grey, 3)
-        if debug:
-            Image.fromarray(grey).save(f"{debug_dir}/blur_median.png")
+def preprocess_for_ocr(pil_img, language_code, debug=False, debug_dir="debug_images"):
+    """
+    Applies language-specific preprocessing tuned to benchmarked optimal parameters.
+    Uses minimal processing for languages that already achieve 100% accuracy across all testing.
+    Accepts a PIL image or a NumPy frame and returns a PIL image, see preprocess_grey for the array only path.
+    """
+    if debug:
+        save_original_debug_image(pil_img, debug_dir)
 
-    # Thresholding
-    if config["threshold"] == "otsu":
-        _, grey = cv2.threshold(grey, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-        if debug:
-            Image.fromarray(grey).save(f"{debug_dir}/threshold_otsu.png")
-    elif config["threshold"] == "adaptive_gaussian":
-        grey = cv2.adaptiveThreshold(grey, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-                                     cv2.THRESH_BINARY, 15, 4)
-        if debug:
-            Image.fromarray(grey).save(f"{debug_dir}/threshold_adaptive_gaussian.png")
-    elif config["threshold"] == "adaptive_mean":
-        grey = cv2.adaptiveThreshold(grey, 255, cv2.ADAPTIVE_THRESH_MEAN_C,
-                                     cv2.THRESH_BINARY, 11, 2)
-        if debug:
-            Image.fromarray(grey).save(f"{debug_dir}/threshold_adaptive_mean.png")
+    grey = preprocess_grey(frame_to_grey(pil_img), language_code, debug=debug, debug_dir=debug_dir)
+    # Copy out of the plan's reused buffer so the returned image stays valid after the next frame
+    return Image.fromarray(grey.copy())
 
-    return Image.fromarray(grey)
 
+def preprocess_grey(grey, language_code, debug=False, debug_dir="debug_images", latency_budget_ms=None, denoise_method=None, on_stage=None):
+    """
+    Applies the language-specific preprocessing to a greyscale NumPy array without converting through PIL.
+    The precompiled plan for the language writes into buffers reused across frames, copy the result to keep it.
+    :param grey: 2D uint8 NumPy array.
+    :param language_code: The Tesseract language code (e.g., "eng", "chi_sim").
+    :param debug: Save an image after every stage to debug_dir.
+    :param latency_budget_ms: Optional per-frame latency budget (realtime profile). When set, NL-means is swapped
+                              for a cheaper denoise method if it would not fit in the budget.
+    :param denoise_method: Force one of DENOISE_METHODS instead of choosing from the budget (used for benchmarking).
+    :param on_stage: Optional hook called as on_stage(stage name, image) after every stage.
+    :return: 2D uint8 NumPy array ready for OCR.
+    """
+    if debug and on_stage is None:
+        os.makedirs(debug_dir, exist_ok=True)
+        on_stage = lambda name, image: cv2.imwrite(f"{debug_dir}/{name}.png", image)
 
+    plan = get_preprocessing_plan(language_code)
+    return plan.run(grey, latency_budget_ms=latency_budget_ms, denoise_method=denoise_method, on_stage=on_stage)
 
 
 def get_ocr_language_code(language_name):
@@ -118,23 +116,28 @@ def get_ocr_language_code(language_name):
     return lang_map.get(language_name, 'eng')
 
 
-def perform_ocr(image, lang_name, use_preprocessing=True, use_google_vision=False, debug=False):
-    temp_path = "temp_ocr_image.png"
-    ocr_lang = get_ocr_language_code(lang_name)
-    paragraphs = []
-
-    if use_google_vision:
-        image.save(temp_path)
-        ocr = GoogleVisionOCR()
-        result = ocr.perform_ocr(temp_path)
-        os.remove(temp_path)
-        return result['full_text'], result['paragraphs']
+# How Tesseract words are merged into paragraphs:
+# "vectorised" uses Tesseract's own block/paragraph numbering with NumPy array operations,
+# "legacy" is the original word by word loop that merges words closer than 50px vertically or 100px horizontally.
+PARAGRAPH_GROUPING = "vectorised"
 
-    if use_preprocessing:
-        image = preprocess_for_ocr(image, language_code=ocr_lang, debug=debug)
+def group_words(ocr_data, method=None):
+    """
+    Merge the word level results of image_to_data into paragraphs.
+    :param ocr_data: Dictionary in the format of pytesseract.image_to_data with Output.DICT.
+    :param method: "vectorised" or "legacy", defaults to PARAGRAPH_GROUPING.
+    :return: List of paragraph dictionaries with x, y, width, height and text.
+    """
+    if (method or PARAGRAPH_GROUPING) == "legacy":
+        return group_words_legacy(ocr_data)
+    return group_words_vectorised(ocr_data)
 
-    ocr_data = pytesseract.image_to_data(image, lang=ocr_lang, output_type=pytesseract.Output.DICT)
 
+def group_words_legacy(ocr_data):
+    """
+    The original grouping loop, kept for comparison and selectable with PARAGRAPH_GROUPING = "legacy".
+    """
+    paragraphs = []
     current_paragraph = {"x": None, "y": None, "width": 0, "height": 0, "text": ""}
     for i in range(len(ocr_data['text'])):
         if ocr_data['text'][i].strip() and ocr_data['width'][i] > 1 and ocr_data['height'][i] > 1:
@@ -156,18 +159,342 @@ def perform_ocr(image, lang_name, use_preprocessing=True, use_google_vision=Fals
     if current_paragraph["x"] is not None:
         paragraphs.append(current_paragraph)
 
+    return paragraphs
+
+
+def group_words_vectorised(ocr_data):
+    """
+    Group words by Tesseract's (page, block, paragraph) numbers with array operations instead of a Python loop.
+    Tesseract lists the words of a paragraph consecutively, so each paragraph is one run of equal numbers
+    and its box is the min/max of the word boxes over that run.
+    Each paragraph also gets the mean Tesseract confidence of its words as "conf".
+    """
+    texts = np.asarray([text.strip() for text in ocr_data['text']], dtype=object)
+    if not len(texts):
+        return []
+    left = np.asarray(ocr_data['left'], dtype=np.int64)
+    top = np.asarray(ocr_data['top'], dtype=np.int64)
+    width = np.asarray(ocr_data['width'], dtype=np.int64)
+    height = np.asarray(ocr_data['height'], dtype=np.int64)
+
+    # Same word filter as the legacy loop: non-empty text with a box larger than 1px
+    keep = (texts != "") & (width > 1) & (height > 1)
+    if not keep.any():
+        return []
+    keys = np.stack([np.asarray(ocr_data['page_num'])[keep], np.asarray(ocr_data['block_num'])[keep],
+                     np.asarray(ocr_data['par_num'])[keep]], axis=1)
+    confidences = np.asarray(ocr_data['conf'], dtype=np.float64)[keep]
+    texts, left, top = texts[keep], left[keep], top[keep]
+    right, bottom = left + width[keep], top + height[keep]
+
+    # Index of the first word of each paragraph
+    starts = np.flatnonzero(np.concatenate(([True], (keys[1:] != keys[:-1]).any(axis=1))))
+    ends = np.append(starts[1:], len(texts))
+    x = np.minimum.reduceat(left, starts)
+    y = np.minimum.reduceat(top, starts)
+    x2 = np.maximum.reduceat(right, starts)
+    y2 = np.maximum.reduceat(bottom, starts)
+    mean_confidences = np.add.reduceat(confidences, starts) / (ends - starts)
+
+    return [
+        {"x": int(x[i]), "y": int(y[i]), "width": int(x2[i] - x[i]), "height": int(y2[i] - y[i]),
+         "text": " ".join(texts[start:end]), "conf": float(mean_confidences[i])}
+        for i, (start, end) in enumerate(zip(starts, ends))
+    ]
+
+
+# Large captures are split into horizontal strips at the gaps between paragraphs and OCR'd in parallel processes.
+# Captures smaller than OCR_TILING_MIN_PIXELS (or machines with one core) use a single whole-image OCR call.
+OCR_TILING = True
+OCR_TILING_MIN_PIXELS = 2_000_000     # Roughly a 1920x1080 capture
+OCR_TILING_WORKERS = os.cpu_count() or 1
+OCR_TILING_MIN_STRIP_HEIGHT = 200     # Strips shorter than this are not worth a separate OCR call
+OCR_TILING_INK_THRESHOLD = 40         # Grey level difference from the background that counts as text
+# A gap between text lines is a paragraph break when it is this many times taller than the typical gap between lines.
+# Strips are only cut at paragraph breaks, Tesseract would return a paragraph cut between its lines as two paragraphs.
+OCR_TILING_PARAGRAPH_GAP_RATIO = 1.8
+
+def find_blank_runs(grey):
+    """
+    Find the runs of text-free rows with a horizontal projection profile.
+    :param grey: 2D uint8 NumPy array.
+    :return: Tuple of NumPy arrays (first row, row after the last) of every run.
+    """
+    background = int(np.median(grey[::4, ::4]))  # Subsampled, the background is the most common grey level
+    ink_per_row = (cv2.absdiff(grey, background) > OCR_TILING_INK_THRESHOLD).sum(axis=1)
+    blank = ink_per_row == 0
+    # Start and end of every run of blank rows
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], blank.astype(np.int8), [0]))))
+    return edges[0::2], edges[1::2]
+
+
+def find_line_gaps(grey):
+    """
+    Find the rows between text lines.
+    :param grey: 2D uint8 NumPy array.
+    :return: NumPy array of row indices in the middle of each run of text-free rows.
+    """
+    run_starts, run_ends = find_blank_runs(grey)
+    return (run_starts + run_ends) // 2
+
+
+def find_paragraph_gaps(grey):
+    """
+    Find the rows between paragraphs, the gaps between text lines that are much taller than the usual line spacing.
+    The margins above the first and below the last line are not gaps.
+    :param grey: 2D uint8 NumPy array.
+    :return: NumPy array of row indices in the middle of each paragraph break.
+    """
+    run_starts, run_ends = find_blank_runs(grey)
+    inside = (run_starts > 0) & (run_ends < grey.shape[0])
+    run_starts, run_ends = run_starts[inside], run_ends[inside]
+    if not len(run_starts):
+        return run_starts
+    run_heights = run_ends - run_starts
+    breaks = run_heights > np.median(run_heights) * OCR_TILING_PARAGRAPH_GAP_RATIO
+    return (run_starts[breaks] + run_ends[breaks]) // 2
+
+
+def split_into_strips(grey, strip_count):
+    """
+    Split an image into about strip_count horizontal strips, cutting only at gaps between paragraphs.
+    :return: List of (top, bottom) row ranges covering the whole image.
+    """
+    height = grey.shape[0]
+    gaps = find_paragraph_gaps(grey)
+    cuts = []
+    for target in np.linspace(0, height, strip_count + 1)[1:-1]:
+        if not len(gaps):
+            break
+        cut = int(gaps[np.argmin(np.abs(gaps - target))])
+        # Skip cuts that would leave a strip too short to be worth its own OCR call
+        if cut - (cuts[-1] if cuts else 0) >= OCR_TILING_MIN_STRIP_HEIGHT and height - cut >= OCR_TILING_MIN_STRIP_HEIGHT:
+            cuts.append(cut)
+    bounds = [0] + cuts + [height]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def init_ocr_worker(tesseract_cmd):
+    # Worker processes do not run Main.py, so they are given the Tesseract path configured there
+    pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+
+
+def ocr_strip(strip, ocr_lang):
+    """
+    Runs in an OCR worker process. OCR one strip with the worker's own persistent engine and group it into paragraphs.
+    """
+    return group_words(get_tesseract_engine().image_to_data(strip, ocr_lang))
+
+
+# Process pool shared by every tiled OCR call so the workers and their Tesseract engines stay warm
+_ocr_pool = None
+_ocr_pool_lock = threading.Lock()
+
+def get_ocr_process_pool():
+    """
+    Return the process pool used for tiled OCR, creating it on first use.
+    """
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is None:
+            _ocr_pool = ProcessPoolExecutor(max_workers=OCR_TILING_WORKERS, initializer=init_ocr_worker,
+                                            initargs=(pytesseract.pytesseract.tesseract_cmd,))
+        return _ocr_pool
+
+
+def reset_ocr_process_pool(pool):
+    """
+    Shut down a broken process pool so the next tiled OCR call starts a new one.
+    """
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is pool:
+            _ocr_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def perform_tiled_ocr(grey, ocr_lang, strip_count=OCR_TILING_WORKERS):
+    """
+    OCR a large greyscale image as parallel strips and stitch the paragraphs back together.
+    :param grey: 2D uint8 NumPy array.
+    :param ocr_lang: The Tesseract language code.
+    :return: List of paragraph dictionaries in full-image coordinates, top to bottom, or None if the image has no
+             paragraph breaks to split at or a worker process died.
+    """
+    strips = split_into_strips(grey, strip_count)
+    if len(strips) < 2:
+        return None
+    pool = get_ocr_process_pool()
+    paragraphs = []
+    try:
+        futures = [pool.submit(ocr_strip, np.ascontiguousarray(grey[top:bottom]), ocr_lang) for top, bottom in strips]
+        for (top, _), future in zip(strips, futures):
+            for paragraph in future.result():
+                paragraph["y"] += top  # Strip coordinates back to capture coordinates
+                paragraphs.append(paragraph)
+    except BrokenProcessPool as e:
+        # A crashed worker breaks the whole pool, replace it and read this capture in one call instead
+        print(f"DEBUG: OCR worker process died ({e}), restarting the OCR process pool")
+        reset_ocr_process_pool(pool)
+        return None
+    return paragraphs
+
+
+# Detect the text regions of a capture with OpenCV first and OCR only those crops.
+# Only used with the persistent Tesseract engine, with pytesseract every crop would start a new tesseract process.
+OCR_TEXT_REGIONS = True
+
+def perform_region_ocr(grey, ocr_lang):
+    """
+    OCR only the parts of a capture that contain text.
+    :param grey: 2D uint8 NumPy array.
+    :param ocr_lang: The Tesseract language code.
+    :return: List of paragraph dictionaries in full-capture coordinates, or None if the whole capture should be OCR'd.
+    """
+    regions = detect_text_regions(grey)
+    if regions is None:
+        return None
+    engine = get_tesseract_engine()
+    paragraphs = []
+    for x, y, width, height in regions:
+        crop = np.ascontiguousarray(grey[y:y + height, x:x + width])
+        for paragraph in group_words(engine.image_to_data(crop, ocr_lang)):
+            # Crop coordinates back to capture coordinates so the region overlay still lines up
+            paragraph["x"] += x
+            paragraph["y"] += y
+            paragraphs.append(paragraph)
+    return paragraphs
+
+
+def resolve_ocr_language(image, lang_name, script_cache_key=None):
+    """
+    Return the Tesseract language code perform_ocr uses for an image, detecting the script for AUTO_DETECT_LANGUAGE.
+    """
+    if lang_name == AUTO_DETECT_LANGUAGE:
+        return get_script_detector().get_language_code(frame_to_grey(image), script_cache_key)
+    return get_ocr_language_code(lang_name)
+
+
+def perform_ocr(image, lang_name, use_preprocessing=True, use_google_vision=False, debug=False, latency_budget_ms=None, use_tiling=None, use_text_regions=None, script_cache_key=None, ocr_lang=None, paragraph_grouping=None):
+    """
+    :param lang_name: OCR source language name, or AUTO_DETECT_LANGUAGE to pick the traineddata from the detected script.
+    :param script_cache_key: Hashable id of the region or window being captured. With auto detection the detected
+                             language is reused for the same key until the OCR confidence drops.
+    :param ocr_lang: Tesseract language code already resolved with resolve_ocr_language, None to resolve it here.
+    :param paragraph_grouping: "vectorised" or "legacy" to override PARAGRAPH_GROUPING (used for benchmarking).
+    """
+    if use_google_vision:
+        # The capture is downscaled and JPEG encoded in memory, no temporary file is written
+        result = get_google_vision_ocr().perform_ocr(image)
+        return result['full_text'], result['paragraphs']
+
+    auto_detect = lang_name == AUTO_DETECT_LANGUAGE
+    if ocr_lang is None:
+        ocr_lang = resolve_ocr_language(image, lang_name, script_cache_key)
+
+    if use_preprocessing:
+        on_stage = None
+        if debug:
+            # Debug images are handed to the background writer so saving them does not delay OCR
+            sink = get_debug_image_sink()
+            snip_dir = sink.start_snip()
+            if snip_dir is not None:
+                sink.save(snip_dir, "original_image", image)
+                on_stage = lambda name, stage_image: sink.save(snip_dir, name, stage_image)
+        image = preprocess_grey(frame_to_grey(image), language_code=ocr_lang, latency_budget_ms=latency_budget_ms, on_stage=on_stage)
+    elif isinstance(image, np.ndarray):
+        # Raw frames are handed to the engine as greyscale pixels, Tesseract greyscales internally anyway
+        image = frame_to_grey(image)
+
+    paragraphs = None
+    if use_text_regions is None:
+        use_text_regions = OCR_TEXT_REGIONS and get_tesseract_engine().is_persistent()
+    if use_text_regions and isinstance(image, np.ndarray):
+        paragraphs = perform_region_ocr(image, ocr_lang)
+
+    if use_tiling is None:
+        use_tiling = OCR_TILING
+    if paragraphs is None and use_tiling and OCR_TILING_WORKERS > 1 and isinstance(image, np.ndarray) and image.size >= OCR_TILING_MIN_PIXELS:
+        paragraphs = perform_tiled_ocr(image, ocr_lang)
+
+    if paragraphs is None:
+        # Uses the persistent Tesseract engine when tesserocr is installed, otherwise falls back to pytesseract
+        ocr_data = get_tesseract_engine().image_to_data(image, ocr_lang)
+        paragraphs = group_words(ocr_data, paragraph_grouping)
+
+    if auto_detect:
+        confidences = [p["conf"] for p in paragraphs if "conf" in p]
+        if confidences:
+            get_script_detector().report_confidence(script_cache_key, sum(confidences) / len(confidences))
+
+    return join_paragraph_text(paragraphs, ocr_lang), paragraphs
+
+
+def join_paragraph_text(paragraphs, ocr_lang):
     if ocr_lang == 'chi_sim':
-        full_text = "".join([p['text'] for p in paragraphs])
-    else:
-        full_text = " ".join([p['text'] for p in paragraphs])
+        return "".join([p['text'] for p in paragraphs])
+    return " ".join([p['text'] for p in paragraphs])
 
-    return full_text, paragraphs
+
+def perform_incremental_ocr(image, lang_name, region_key, use_preprocessing=True, use_google_vision=False, **ocr_options):
+    """
+    OCR a capture of a region that was captured before, re-reading only the paragraphs whose pixels changed.
+    Takes the same arguments as perform_ocr plus region_key, a hashable id of the captured region.
+    Google Vision and PIL images always use a full perform_ocr call.
+    :return: Tuple of (full_text, paragraphs) like perform_ocr.
+    """
+    if use_google_vision or not isinstance(image, np.ndarray):
+        return perform_ocr(image, lang_name, use_preprocessing=use_preprocessing, use_google_vision=use_google_vision, **ocr_options)
+
+    script_cache_key = ocr_options.get("script_cache_key")
+    # Resolved once per capture so changed paragraphs are re-read, and the text joined, with the same language.
+    # With Auto Detect this reuses the region's cached detection when there is one.
+    ocr_lang = resolve_ocr_language(image, lang_name, script_cache_key)
+    # Paragraphs read with other settings are not reused, snipping the same region after changing the language,
+    # preprocessing or latency budget reads it again from scratch
+    settings = (ocr_lang, use_preprocessing,
+                tuple(sorted((name, value) for name, value in ocr_options.items() if name not in ("debug", "script_cache_key"))))
+
+    paragraphs = get_incremental_ocr().perform(
+        image, region_key,
+        lambda frame: perform_ocr(frame, lang_name, use_preprocessing=use_preprocessing, ocr_lang=ocr_lang, **ocr_options)[1],
+        settings=settings
+    )
+    return join_paragraph_text(paragraphs, ocr_lang), paragraphs
 
 # Route text to the appropriate translation method based on the user's choice.
-def perform_translation(paragraphs, target_lang, use_deepl=False):
-    if use_deepl:
-        deepl = DeepLTranslation()
-        return [deepl.translate_text(p['text'], target_lang) for p in paragraphs]
+# With parallel=True Google Translate paragraphs are fanned out over the shared TranslationExecutor.
+# on_paragraph_translated(index, translated_text) is called as soon as each paragraph is ready so callers can show progress.
+# use_local translates on this machine with Argos Translate, it needs the source language name since local models cannot detect it.
+def perform_translation(paragraphs, target_lang, use_deepl=False, parallel=False, on_paragraph_translated=None, use_local=False, source_lang=None):
+    if use_local and get_local_translation().get_language_code(source_lang) is None:
+        print(f"DEBUG: Local translation needs a known source language, got '{source_lang}'. Using Google Translate.")
+        use_local = False
+
+    if use_local:
+        local = get_local_translation()
+        translations = []
+        for i, p in enumerate(paragraphs):
+            translations.append(local.translate_text(p['text'], target_lang, source_language=source_lang))
+            if on_paragraph_translated is not None:
+                on_paragraph_translated(i, translations[i])
+    elif use_deepl:
+        deepl = get_deepl_translation()
+        # All paragraphs of the snip are sent to DeepL together in as few requests as possible
+        translations = deepl.translate_many([p['text'] for p in paragraphs], target_lang)
+        if on_paragraph_translated is not None:
+            for i, translation in enumerate(translations):
+                on_paragraph_translated(i, translation)
+    elif parallel:
+        translations = get_translation_executor().map([p['text'] for p in paragraphs], target_lang, on_result=on_paragraph_translated)
     else:
         translator = TranslationHandling()
-        return [translator.translate_text(p['text'], target_lang) for p in paragraphs]
+        translations = []
+        for i, p in enumerate(paragraphs):
+            translations.append(translator.translate_text(p['text'], target_lang))
+            if on_paragraph_translated is not None:
+                on_paragraph_translated(i, translations[i])
+
+    stats = get_translation_cache().get_stats()
+    print(f"DEBUG: Translation cache hits: {stats['hits']}, misses: {stats['misses']} ({stats['hit_rate']:.0%} hit rate)")
+    return translations
@@ -0,0 +1,191 @@
+import threading
+import time
+import cv2
+import numpy as np
+
+"""
+After testing various preprocessing techniques through the OptimisePreProcessing.py helper app I made, the following configurations were found to be optimal for each language.
+The configurations are based on the language code and include parameters for contrast, denoising, inversion, blurring, and thresholding.
+This data can be found in the ocr_accuracy_parameter_search Completed Example.csv that was built using the OptimisePreProcessing.py helper app.
+"""
+LANGUAGE_SPECIFIC_CONFIGS = {
+    "ara":     {"contrast": 1.2, "denoise": 9,    "invert": False, "blur": "median",   "threshold": "adaptive_gaussian"},
+    "ben":     {"contrast": 1.2, "denoise": 1,    "invert": False, "blur": "median",   "threshold": "none"},
+    "chi_sim": {"contrast": 1.2, "denoise": None, "invert": False, "blur": "median",   "threshold": "otsu"},
+    "ell":     {"contrast": 1.0, "denoise": 3,    "invert": False, "blur": "none",     "threshold": "none"},
+    "hin":     {"contrast": 1.4, "denoise": None, "invert": False, "blur": "gaussian", "threshold": "otsu"},
+    "jpn":     {"contrast": 1.0, "denoise": None, "invert": False, "blur": "gaussian", "threshold": "none"},
+    "kor":     {"contrast": 1.4, "denoise": None, "invert": True,  "blur": "median",   "threshold": "none"},
+    "tha":     {"contrast": 1.0, "denoise": None, "invert": False, "blur": "gaussian", "threshold": "otsu"},
+}
+
+"""
+For all other languages, use the default configuration.
+All other languages were found to be 100% accurate without extensive preprocessing,
+At least in the image tests I performed and evaluated.
+Best-performing configurations for most languages.
+This results in the image being just converted to grayscale and saved as a PNG.
+"""
+DEFAULT_CONFIG = {
+    "contrast": 1.0,
+    "denoise": None,
+    "invert": False,
+    "blur": "none",
+    "threshold": "none"
+}
+
+# Denoise methods used by the realtime profile, from the most accurate and slowest to the fastest
+DENOISE_METHODS = ("nl_means", "downscaled_nl_means", "bilateral")
+# Share of the per-frame latency budget the denoise step is allowed to use, the rest is left for OCR
+REALTIME_DENOISE_SHARE = 0.5
+# Scale factor used by downscaled NL-means, a 0.5 scale runs NL-means on a quarter of the pixels
+DENOISE_DOWNSCALE = 0.5
+# Estimated cost of each denoise method in nanoseconds per pixel, refined from the measured runs
+_denoise_cost_ns_per_pixel = {"nl_means": 1500.0, "downscaled_nl_means": 400.0, "bilateral": 10.0}
+
+def denoise_grey(grey, h, method="nl_means", dst=None):
+    """
+    Denoise a greyscale image with one of DENOISE_METHODS and update that method's cost estimate.
+    :param grey: 2D uint8 NumPy array.
+    :param h: Filter strength from the language config, the NL-means h parameter.
+    :param method: "nl_means" (benchmarked default), "downscaled_nl_means" or "bilateral".
+    :param dst: Optional preallocated output array the same size as grey.
+    :return: 2D uint8 NumPy array the same size as the input.
+    """
+    start_time = time.perf_counter()
+    if method == "downscaled_nl_means":
+        # NL-means on a smaller copy, then scaled back so box coordinates still match the capture
+        small = cv2.resize(grey, None, fx=DENOISE_DOWNSCALE, fy=DENOISE_DOWNSCALE, interpolation=cv2.INTER_AREA)
+        small = cv2.fastNlMeansDenoising(small, None, h=h)
+        denoised = cv2.resize(small, (grey.shape[1], grey.shape[0]), dst=dst, interpolation=cv2.INTER_LINEAR)
+    elif method == "bilateral":
+        # Edge preserving like NL-means but a single local pass, the colour sigma grows with the requested strength
+        denoised = cv2.bilateralFilter(grey, 5, 10 * h, 5, dst=dst)
+    else:
+        denoised = cv2.fastNlMeansDenoising(grey, dst, h=h)
+
+    if grey.size:
+        # Moving average so the estimate follows the speed of this machine
+        measured = (time.perf_counter() - start_time) * 1e9 / grey.size
+        _denoise_cost_ns_per_pixel[method] = 0.8 * _denoise_cost_ns_per_pixel[method] + 0.2 * measured
+    return denoised
+
+def choose_denoise_method(grey, latency_budget_ms=None):
+    """
+    Pick the most accurate denoise method whose estimated time fits in the latency budget.
+    :param grey: The image that is about to be denoised, only its size is used.
+    :param latency_budget_ms: Per-frame latency budget in milliseconds, or None to always use NL-means.
+    :return: One of DENOISE_METHODS.
+    """
+    if latency_budget_ms is None:
+        return "nl_means"
+    allowed_ms = latency_budget_ms * REALTIME_DENOISE_SHARE
+    for method in DENOISE_METHODS:
+        if _denoise_cost_ns_per_pixel[method] * grey.size / 1e6 <= allowed_ms:
+            return method
+    return DENOISE_METHODS[-1]
+
+
+# Class that turns one language's preprocessing config into a fixed list of stages, built once and reused for every frame
+class PreprocessingPlan:
+    def __init__(self, language_code, config):
+        """
+        :param language_code: The Tesseract language code the plan is for (e.g., "eng", "chi_sim").
+        :param config: One of the LANGUAGE_SPECIFIC_CONFIGS entries or DEFAULT_CONFIG.
+        """
+        self.language_code = language_code
+        self.config = config
+        self.buffers = threading.local()  # Each OCR thread reuses its own pair of output buffers
+        self.stages = []  # List of (stage name, function(src, dst, denoise_method) -> result)
+
+        # Inversion and contrast are both per-pixel mappings so they are fused into one lookup table
+        self.lut = self.build_lut(config["invert"], config["contrast"])
+        if self.lut is not None:
+            if config["invert"] and config["contrast"] != 1.0:
+                name = "inverted_contrast"
+            else:
+                name = "inverted" if config["invert"] else "contrast"
+            self.stages.append((name, lambda src, dst, _: cv2.LUT(src, self.lut, dst=dst)))
+
+        if config["denoise"] is not None:
+            self.stages.append(("denoised", self.denoise))
+
+        if config["blur"] == "gaussian":
+            self.stages.append(("blur_gaussian", lambda src, dst, _: cv2.GaussianBlur(src, (3, 3), 0, dst=dst)))
+        elif config["blur"] == "median":
+            self.stages.append(("blur_median", lambda src, dst, _: cv2.medianBlur(src, 3, dst=dst)))
+
+        if config["threshold"] == "otsu":
+            self.stages.append(("threshold_otsu", lambda src, dst, _: cv2.threshold(
+                src, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=dst)[1]))
+        elif config["threshold"] == "adaptive_gaussian":
+            self.stages.append(("threshold_adaptive_gaussian", lambda src, dst, _: cv2.adaptiveThreshold(
+                src, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 15, 4, dst=dst)))
+        elif config["threshold"] == "adaptive_mean":
+            self.stages.append(("threshold_adaptive_mean", lambda src, dst, _: cv2.adaptiveThreshold(
+                src, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY, 11, 2, dst=dst)))
+
+    @staticmethod
+    def build_lut(invert, contrast):
+        """
+        Build the 256 entry table for inversion followed by contrast, matching bitwise_not then convertScaleAbs.
+        :return: uint8 NumPy array, or None if both stages are no-ops.
+        """
+        if not invert and contrast == 1.0:
+            return None
+        values = np.arange(256, dtype=np.float64)
+        if invert:
+            values = 255 - values
+        return np.clip(np.rint(values * contrast), 0, 255).astype(np.uint8)
+
+    def denoise(self, src, dst, denoise_method):
+        return denoise_grey(src, self.config["denoise"], denoise_method, dst=dst)
+
+    def get_buffers(self, shape):
+        """
+        Return the two output buffers of the calling thread, reallocating them only when the frame size changes.
+        """
+        buffers = getattr(self.buffers, "pair", None)
+        if buffers is None or buffers[0].shape != shape:
+            buffers = (np.empty(shape, dtype=np.uint8), np.empty(shape, dtype=np.uint8))
+            self.buffers.pair = buffers
+        return buffers
+
+    def run(self, grey, latency_budget_ms=None, denoise_method=None, on_stage=None):
+        """
+        Apply the plan to a greyscale frame.
+        The result is written into a buffer that is reused by the next frame processed on the same thread,
+        so callers that keep the result beyond that must copy it.
+        :param grey: 2D uint8 NumPy array, never modified.
+        :param latency_budget_ms: Optional per-frame latency budget used to choose the denoise method (realtime profile).
+        :param denoise_method: Force one of DENOISE_METHODS instead of choosing from the budget.
+        :param on_stage: Optional hook called as on_stage(stage name, image) after every stage, e.g. to save debug images.
+        :return: 2D uint8 NumPy array ready for OCR, the input itself when the plan has no stages.
+        """
+        if not self.stages:
+            return grey
+
+        if self.config["denoise"] is not None and denoise_method is None:
+            denoise_method = choose_denoise_method(grey, latency_budget_ms)
+            if denoise_method != "nl_means":
+                print(f"DEBUG: Realtime profile using {denoise_method} denoise for {self.language_code}")
+
+        buffers = self.get_buffers(grey.shape)
+        image = grey
+        # Stages alternate between the two buffers so no stage reads and writes the same array
+        for index, (name, stage) in enumerate(self.stages):
+            image = stage(image, buffers[index % 2], denoise_method)
+            if on_stage is not None:
+                on_stage(name, image)
+        return image
+
+
+# Plans for every configured language are built once at import, other languages share the default plan
+_plans = {code: PreprocessingPlan(code, config) for code, config in LANGUAGE_SPECIFIC_CONFIGS.items()}
+_default_plan = PreprocessingPlan("default", DEFAULT_CONFIG)
+
+def get_preprocessing_plan(language_code):
+    """
+    Return the precompiled preprocessing plan for a Tesseract language code.
+    """
+    return _plans.get(language_code, _default_plan)
@@ -0,0 +1,91 @@
+import threading
+import time
+import cv2
+import mss
+import numpy as np
+
+# Class that continuously re-captures a pinned screen region and reports when its contents meaningfully change
+class RegionWatcher:
+    def __init__(self, region, on_change, fps=2.0, pixel_threshold=12, changed_fraction=0.002, fingerprint_size=(64, 64)):
+        """
+        :param region: The mss capture region ({"top", "left", "width", "height"}).
+        :param on_change: Called from the watcher thread with the BGRA NumPy frame whenever the region has changed.
+                          The next capture only happens after it returns, so OCR and translation never overlap.
+        :param fps: How many times per second the region is captured.
+        :param pixel_threshold: Grey level difference (0-255) for a fingerprint cell to count as changed.
+        :param changed_fraction: Fraction of fingerprint cells that must change for the frame to count as changed.
+                                 Kept small so a single new subtitle line in a large region still triggers OCR.
+        :param fingerprint_size: Size the frame is downsampled to before it is compared.
+        """
+        self.region = region
+        self.on_change = on_change
+        self.interval = 1.0 / max(fps, 0.1)
+        self.pixel_threshold = pixel_threshold
+        self.changed_fraction = changed_fraction
+        self.fingerprint_size = fingerprint_size
+        self.last_fingerprint = None  # Fingerprint of the last frame that was passed to on_change
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        """
+        Start the capture loop on its own daemon thread.
+        """
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        print(f"DEBUG: Watching region {self.region} every {self.interval:.2f}s")
+
+    def stop(self):
+        """
+        Stop the capture loop. Safe to call from any thread, including from inside on_change.
+        """
+        self.stop_event.set()
+        print(f"DEBUG: Stopped watching region {self.region}")
+
+    def is_running(self):
+        return self.thread is not None and self.thread.is_alive() and not self.stop_event.is_set()
+
+    def fingerprint(self, frame):
+        """
+        Build a cheap, downsampled greyscale fingerprint of a BGRA frame.
+        Area interpolation averages the pixels so cursor blinks and compression noise barely move it.
+        """
+        small = cv2.resize(frame, self.fingerprint_size, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGRA2GRAY)
+
+    def has_changed(self, fingerprint):
+        """
+        Compare a fingerprint against the last processed frame.
+        :return: True if enough of the fingerprint has changed or nothing has been processed yet.
+        """
+        if self.last_fingerprint is None or fingerprint.shape != self.last_fingerprint.shape:
+            return True
+        difference = cv2.absdiff(fingerprint, self.last_fingerprint)
+        changed_cells = np.count_nonzero(difference > self.pixel_threshold)
+        return changed_cells > self.changed_fraction * difference.size
+
+    def run(self):
+        # mss handles are not shareable between threads so the watcher owns its own
+        with mss.mss() as sct:
+            while not self.stop_event.is_set():
+                start_time = time.perf_counter()
+                try:
+                    screenshot = sct.grab(self.region)
+                    frame = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(screenshot.height, screenshot.width, 4)
+                except Exception as e:
+                    print(f"DEBUG: Error capturing watched region with mss: {e}")
+                    self.stop_event.wait(self.interval)
+                    continue
+
+                fingerprint = self.fingerprint(frame)
+                if self.has_changed(fingerprint):
+                    self.last_fingerprint = fingerprint
+                    try:
+                        self.on_change(frame)
+                    except Exception as e:
+                        print(f"DEBUG: Error processing watched region: {e}")
+
+                # Sleep for the rest of the frame interval, returning early if stopped
+                elapsed = time.perf_counter() - start_time
+                self.stop_event.wait(max(0.0, self.interval - elapsed))
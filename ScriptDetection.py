@@ -0,0 +1,118 @@
+import threading
+# TesseractEngine (pytesseract, tesserocr) is imported on the first detection, Gui imports this module for
+# AUTO_DETECT_LANGUAGE before the window is shown
+
+# Name shown in the OCR "From Language" dropdown to pick the Tesseract language automatically
+AUTO_DETECT_LANGUAGE = "Auto Detect"
+
+# Tesseract OSD script names -> traineddata used to OCR them.
+# Latin and Cyrillic use the script models, which cover every language written in that script.
+SCRIPT_TO_LANGUAGE_CODE = {
+    "Latin": "script/Latin",
+    "Cyrillic": "script/Cyrillic",
+    "Han": "chi_sim",
+    "Japanese": "jpn",
+    "Katakana": "jpn",
+    "Hiragana": "jpn",
+    "Hangul": "kor",
+    "Korean": "kor",
+    "Arabic": "ara",
+    "Hebrew": "heb",
+    "Devanagari": "hin",
+    "Bengali": "ben",
+    "Thai": "tha",
+    "Greek": "ell",
+}
+# Used when OSD cannot decide (too little text) or finds a script that is not mapped above
+FALLBACK_LANGUAGE_CODE = "eng"
+# The script models are not part of a default tessdata install, these language models are used instead when they are missing
+SCRIPT_MODEL_FALLBACKS = {
+    "script/Latin": "eng",
+    "script/Cyrillic": "rus",
+}
+# A cached decision is dropped when the OCR confidence of a frame falls below this...
+SCRIPT_CACHE_MIN_CONFIDENCE = 50.0
+# ...or drops by more than this many points from the confidence of the first frame OCR'd with it
+SCRIPT_CACHE_MAX_CONFIDENCE_DROP = 20.0
+
+# Class that picks the OCR language from the script of the text and remembers the choice per region or window
+class ScriptDetector:
+    def __init__(self):
+        self.decisions = {}  # Cache key -> {"language_code", "script", "baseline_confidence"}
+        self.lock = threading.Lock()
+
+    def detect(self, image):
+        """
+        Run script detection on an image.
+        :param image: 2D uint8 NumPy array or PIL image.
+        :return: Tuple of (Tesseract language code, script name or None).
+        """
+        from TesseractEngine import get_tesseract_engine
+        engine = get_tesseract_engine()
+        script, confidence = engine.detect_script(image)
+        language_code = SCRIPT_TO_LANGUAGE_CODE.get(script, FALLBACK_LANGUAGE_CODE)
+        installed = engine.get_installed_languages()
+        if installed and language_code not in installed:
+            fallback = SCRIPT_MODEL_FALLBACKS.get(language_code, FALLBACK_LANGUAGE_CODE)
+            print(f"DEBUG: '{language_code}' is not installed, using '{fallback}' for {script} text")
+            language_code = fallback if fallback in installed else FALLBACK_LANGUAGE_CODE
+        print(f"DEBUG: Detected script {script} (confidence {confidence:.2f}), using '{language_code}'")
+        return language_code, script
+
+    def get_language_code(self, image, cache_key=None):
+        """
+        Return the OCR language for an image, reusing the decision made for the same cache key.
+        :param image: The (preprocessed) capture.
+        :param cache_key: Hashable id of the watched region or window, or None to always detect.
+        :return: Tesseract language code.
+        """
+        if cache_key is not None:
+            with self.lock:
+                decision = self.decisions.get(cache_key)
+            if decision is not None:
+                return decision["language_code"]
+
+        language_code, script = self.detect(image)
+        # Undecided results are not cached so the next frame tries again
+        if cache_key is not None and script is not None:
+            with self.lock:
+                self.decisions[cache_key] = {"language_code": language_code, "script": script, "baseline_confidence": None}
+        return language_code
+
+    def report_confidence(self, cache_key, confidence):
+        """
+        Record the OCR confidence of a frame read with the cached decision, dropping the decision if it got worse.
+        :param cache_key: The key passed to get_language_code.
+        :param confidence: Mean word confidence (0-100) of the frame, or None if unknown.
+        """
+        if cache_key is None or confidence is None:
+            return
+        with self.lock:
+            decision = self.decisions.get(cache_key)
+            if decision is None:
+                return
+            if decision["baseline_confidence"] is None:
+                decision["baseline_confidence"] = confidence
+            elif (confidence < SCRIPT_CACHE_MIN_CONFIDENCE or
+                  confidence < decision["baseline_confidence"] - SCRIPT_CACHE_MAX_CONFIDENCE_DROP):
+                print(f"DEBUG: OCR confidence dropped to {confidence:.1f}, detecting the script again on the next frame")
+                del self.decisions[cache_key]
+
+    def forget(self, cache_key):
+        with self.lock:
+            self.decisions.pop(cache_key, None)
+
+
+# Shared detector so decisions are kept between snips of the same region
+_detector = None
+_detector_lock = threading.Lock()
+
+def get_script_detector():
+    """
+    Return the process-wide ScriptDetector, creating it on first use.
+    """
+    global _detector
+    with _detector_lock:
+        if _detector is None:
+            _detector = ScriptDetector()
+        return _detector
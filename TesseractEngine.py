@@ -0,0 +1,228 @@
+import os
+import atexit
+import threading
+import pytesseract
+
+# tesserocr is an optional binding to the Tesseract C-API.
+# When it is installed the engine below keeps one initialised Tesseract instance per language loaded in memory,
+# otherwise OCR falls back to pytesseract which starts a new tesseract process for every image.
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+# Keys returned by pytesseract.image_to_data with Output.DICT, the persistent engine produces the same structure
+# so the paragraph grouping in PipelineForOCR works unchanged for both backends.
+OCR_DATA_KEYS = ["level", "page_num", "block_num", "par_num", "line_num", "word_num",
+                 "left", "top", "width", "height", "conf", "text"]
+
+# Language code of the traineddata used for orientation and script detection
+OSD_LANGUAGE = "osd"
+
+# Class that keeps Tesseract engines warm between snips
+class TesseractEngine:
+    def __init__(self):
+        """
+        Initialise the engine registry. Engines are created lazily the first time a language is used
+        and are then reused for every following image in that language.
+        """
+        self.apis = {}   # Language code -> initialised tesserocr.PyTessBaseAPI
+        self.locks = {}  # Language code -> lock, a single Tesseract instance is not thread safe
+        self.registry_lock = threading.Lock()
+        self.tessdata_path = None
+        self.installed_languages = None
+
+    def is_persistent(self):
+        """
+        Check if the persistent tesserocr backend is available.
+        :return: True if tesserocr is installed, False if pytesseract will be used instead.
+        """
+        return tesserocr is not None
+
+    def get_tessdata_path(self):
+        """
+        Locate the tessdata folder of the Tesseract installation configured in Main.py.
+        :return: Path to the tessdata folder (ending in a separator) or None to use the tesserocr default.
+        """
+        if self.tessdata_path is None:
+            tesseract_dir = os.path.dirname(pytesseract.pytesseract.tesseract_cmd)
+            candidate = os.path.join(tesseract_dir, "tessdata")
+            if tesseract_dir and os.path.isdir(candidate):
+                self.tessdata_path = candidate + os.sep
+            elif os.environ.get("TESSDATA_PREFIX"):
+                self.tessdata_path = os.path.join(os.environ["TESSDATA_PREFIX"], "")
+            else:
+                self.tessdata_path = ""
+        return self.tessdata_path or None
+
+    def get_installed_languages(self):
+        """
+        List the traineddata installed with Tesseract, read once per session.
+        Script models are found in the tessdata folder as "script/Latin" etc., `tesseract --list-langs` (used when the
+        folder is unknown) only lists language models.
+        :return: Set of language codes, empty if they could not be listed.
+        """
+        if self.installed_languages is None:
+            languages = set()
+            tessdata_path = self.get_tessdata_path()
+            if tessdata_path:
+                for folder, _, files in os.walk(tessdata_path):
+                    for file in files:
+                        if file.endswith(".traineddata"):
+                            relative = os.path.relpath(os.path.join(folder, file), tessdata_path)
+                            languages.add(relative[:-len(".traineddata")].replace(os.sep, "/"))
+            else:
+                try:
+                    languages = set(pytesseract.get_languages())
+                except (pytesseract.TesseractNotFoundError, OSError) as e:
+                    print(f"DEBUG: Could not list the installed Tesseract languages: {e}")
+            self.installed_languages = languages
+        return self.installed_languages
+
+    def get_api(self, language_code):
+        """
+        Return the warm Tesseract instance and its lock for a language, creating it on first use.
+        :param language_code: The Tesseract language code (e.g., "eng", "chi_sim").
+        :return: Tuple of (PyTessBaseAPI, threading.Lock).
+        """
+        with self.registry_lock:
+            if language_code not in self.apis:
+                print(f"DEBUG: Initialising persistent Tesseract engine for '{language_code}'...")
+                tessdata_path = self.get_tessdata_path()
+                # The osd traineddata is only used for orientation and script detection
+                options = {"psm": tesserocr.PSM.OSD_ONLY} if language_code == OSD_LANGUAGE else {}
+                if tessdata_path:
+                    api = tesserocr.PyTessBaseAPI(path=tessdata_path, lang=language_code, **options)
+                else:
+                    api = tesserocr.PyTessBaseAPI(lang=language_code, **options)
+                self.apis[language_code] = api
+                self.locks[language_code] = threading.Lock()
+            return self.apis[language_code], self.locks[language_code]
+
+    def image_to_data(self, image, language_code):
+        """
+        Run OCR on an image and return word level results.
+        Uses the persistent tesserocr engine when available and falls back to pytesseract otherwise.
+        :param image: PIL image or 2D uint8 NumPy array (greyscale pixels) to perform OCR on.
+        :param language_code: The Tesseract language code (e.g., "eng", "chi_sim").
+        :return: Dictionary in the same format as pytesseract.image_to_data with Output.DICT.
+        """
+        if tesserocr is None:
+            return pytesseract.image_to_data(image, lang=language_code, output_type=pytesseract.Output.DICT)
+
+        try:
+            api, lock = self.get_api(language_code)
+        except RuntimeError as e:
+            # Raised by tesserocr when the traineddata cannot be loaded, pytesseract reports this more clearly
+            print(f"DEBUG: Persistent Tesseract engine unavailable for '{language_code}': {e}")
+            return pytesseract.image_to_data(image, lang=language_code, output_type=pytesseract.Output.DICT)
+
+        with lock:
+            self.set_image(api, image)
+            api.Recognize()
+            return self.collect_words(api)
+
+    def set_image(self, api, image):
+        if hasattr(image, "ndim") and image.ndim == 2:
+            # Hand the raw greyscale pixels straight to Tesseract, no PIL or encoded image in between
+            height, width = image.shape
+            api.SetImageBytes(image.tobytes(), width, height, 1, width)
+        else:
+            api.SetImage(image)
+
+    def detect_script(self, image):
+        """
+        Detect the writing system of an image with Tesseract's orientation and script detection (OSD).
+        :param image: PIL image or 2D uint8 NumPy array.
+        :return: Tuple of (script name as reported by Tesseract e.g. "Latin", "Han", confidence), or (None, 0.0) if
+                 there was not enough text to decide.
+        """
+        if tesserocr is not None:
+            try:
+                api, lock = self.get_api(OSD_LANGUAGE)
+                with lock:
+                    self.set_image(api, image)
+                    result = api.DetectOrientationScript()
+                if result:
+                    return result["script_name"], float(result["script_conf"])
+                return None, 0.0
+            except RuntimeError as e:
+                print(f"DEBUG: Persistent Tesseract OSD unavailable: {e}")
+
+        try:
+            result = pytesseract.image_to_osd(image, output_type=pytesseract.Output.DICT)
+            return result["script"], float(result["script_conf"])
+        except pytesseract.TesseractError as e:
+            # Raised when the image has too few characters for OSD
+            print(f"DEBUG: Script detection failed: {e}")
+            return None, 0.0
+
+    def collect_words(self, api):
+        """
+        Walk the recognised words of the current image and build the pytesseract style result dictionary.
+        :param api: The PyTessBaseAPI that has just run Recognize().
+        :return: Dictionary in the same format as pytesseract.image_to_data with Output.DICT.
+        """
+        ocr_data = {key: [] for key in OCR_DATA_KEYS}
+        iterator = api.GetIterator()
+        if iterator is None:
+            return ocr_data
+
+        word_level = tesserocr.RIL.WORD
+        block_num = par_num = line_num = word_num = 0
+        for word in tesserocr.iterate_level(iterator, word_level):
+            # Track the block/paragraph/line numbering the same way the tesseract TSV output does
+            if word.IsAtBeginningOf(tesserocr.RIL.BLOCK):
+                block_num += 1
+                par_num = line_num = 0
+            if word.IsAtBeginningOf(tesserocr.RIL.PARA):
+                par_num += 1
+                line_num = 0
+            if word.IsAtBeginningOf(tesserocr.RIL.TEXTLINE):
+                line_num += 1
+                word_num = 0
+            word_num += 1
+
+            box = word.BoundingBox(word_level)
+            if box is None:
+                continue
+            x1, y1, x2, y2 = box
+            ocr_data["level"].append(5)
+            ocr_data["page_num"].append(1)
+            ocr_data["block_num"].append(block_num)
+            ocr_data["par_num"].append(par_num)
+            ocr_data["line_num"].append(line_num)
+            ocr_data["word_num"].append(word_num)
+            ocr_data["left"].append(x1)
+            ocr_data["top"].append(y1)
+            ocr_data["width"].append(x2 - x1)
+            ocr_data["height"].append(y2 - y1)
+            ocr_data["conf"].append(word.Confidence(word_level))
+            ocr_data["text"].append(word.GetUTF8Text(word_level) or "")
+        return ocr_data
+
+    def close(self):
+        """
+        Release every initialised Tesseract instance.
+        """
+        with self.registry_lock:
+            for api in self.apis.values():
+                api.End()
+            self.apis.clear()
+            self.locks.clear()
+
+
+# Shared engine used by the whole process so the loaded traineddata survives between snips
+_engine = None
+_engine_lock = threading.Lock()
+
+def get_tesseract_engine():
+    """
+    Return the process-wide TesseractEngine, creating it on first use.
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = TesseractEngine()
+            atexit.register(_engine.close)
+        return _engine
@@ -0,0 +1,86 @@
+import cv2
+import numpy as np
+
+# Settings for the OpenCV text localisation pre-pass, tuned for screen text at typical UI sizes
+TEXT_REGION_MIN_HEIGHT = 6          # Components shorter than this are treated as noise or UI lines
+TEXT_REGION_MIN_AREA = 80           # Components with fewer pixels than this are ignored
+TEXT_REGION_JOIN_KERNEL = (25, 7)   # Closing kernel (width, height) that joins the characters of a line into one component
+TEXT_REGION_PADDING = 6             # Pixels added around every region so characters at the edge are not clipped
+TEXT_REGION_LINE_GAP = 0.75         # Lines closer than this fraction of the typical line height are kept in one region
+TEXT_REGION_MAX_COVERAGE = 0.6      # If the regions cover more of the capture than this, cropping saves nothing
+TEXT_REGION_MAX_REGIONS = 12        # Above this many regions the per-crop OCR overhead outweighs the saving
+
+def merge_overlapping_boxes(boxes, vertical_gap=0):
+    """
+    Merge boxes that overlap until no two boxes overlap.
+    :param boxes: List of [x1, y1, x2, y2].
+    :param vertical_gap: Boxes this many pixels apart vertically still count as overlapping, so the lines of a paragraph stay together.
+    :return: List of merged [x1, y1, x2, y2].
+    """
+    merged = True
+    while merged:
+        merged = False
+        result = []
+        for box in boxes:
+            for other in result:
+                if box[0] <= other[2] and other[0] <= box[2] and box[1] <= other[3] + vertical_gap and other[1] <= box[3] + vertical_gap:
+                    other[0], other[1] = min(other[0], box[0]), min(other[1], box[1])
+                    other[2], other[3] = max(other[2], box[2]), max(other[3], box[3])
+                    merged = True
+                    break
+            else:
+                result.append(list(box))
+        boxes = result
+    return boxes
+
+def find_line_boxes(grey):
+    """
+    Find the bounding boxes of the text lines in a capture.
+    A morphological gradient highlights character edges whatever the text and background colours,
+    closing joins the edges into text lines and connected components gives their bounding boxes.
+    :param grey: 2D uint8 NumPy array.
+    :return: List of (x, y, width, height) with one box per text line (or word group on sparse screens).
+    """
+    gradient = cv2.morphologyEx(grey, cv2.MORPH_GRADIENT, cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3)))
+    _, edges = cv2.threshold(gradient, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    joined = cv2.morphologyEx(edges, cv2.MORPH_CLOSE, cv2.getStructuringElement(cv2.MORPH_RECT, TEXT_REGION_JOIN_KERNEL))
+
+    _, _, stats, _ = cv2.connectedComponentsWithStats(joined, connectivity=8)
+    return [(int(x), int(y), int(w), int(h)) for x, y, w, h, area in stats[1:]  # Label 0 is the background
+            if h >= TEXT_REGION_MIN_HEIGHT and area >= TEXT_REGION_MIN_AREA]
+
+def estimate_text_height(grey):
+    """
+    Estimate the height of the text in a capture in pixels.
+    :return: Median text line height, or None if no text was found.
+    """
+    line_boxes = find_line_boxes(grey)
+    if not line_boxes:
+        return None
+    return float(np.median([h for _, _, _, h in line_boxes]))
+
+def detect_text_regions(grey):
+    """
+    Find the parts of a capture that contain text using only OpenCV (no network, no GPU).
+    The line boxes from find_line_boxes are padded and merged into paragraph sized regions.
+    :param grey: 2D uint8 NumPy array.
+    :return: List of (x, y, width, height) regions sorted top to bottom, or None if the whole capture should be OCR'd
+             (the regions cover most of it, there are too many, or no text was found).
+    """
+    height, width = grey.shape
+    boxes = []
+    for x, y, w, h in find_line_boxes(grey):
+        boxes.append([max(0, x - TEXT_REGION_PADDING), max(0, y - TEXT_REGION_PADDING),
+                      min(width, x + w + TEXT_REGION_PADDING), min(height, y + h + TEXT_REGION_PADDING)])
+    if boxes:
+        # OCR'ing each paragraph as one crop keeps Tesseract's paragraph grouping the same as on the whole capture
+        line_height = float(np.median([y2 - y1 for _, y1, _, y2 in boxes]))
+        boxes = merge_overlapping_boxes(boxes, vertical_gap=int(line_height * TEXT_REGION_LINE_GAP))
+
+    if not boxes or len(boxes) > TEXT_REGION_MAX_REGIONS:
+        return None
+    covered = sum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in boxes)
+    if covered > TEXT_REGION_MAX_COVERAGE * width * height:
+        return None
+    boxes.sort(key=lambda box: (box[1], box[0]))
+    return [(x1, y1, x2 - x1, y2 - y1) for x1, y1, x2, y2 in boxes]
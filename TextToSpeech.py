@@ -0,0 +1,271 @@
+import io
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from gtts import gTTS
+
+# Maximum size of the synthesized speech kept in memory, the least recently used audio is dropped first
+TTS_CACHE_MAX_BYTES = 32 * 1024 * 1024
+# Mixer settings, gTTS produces 24kHz mono MP3s
+TTS_MIXER_FREQUENCY = 24000
+TTS_MIXER_CHANNELS = 8  # Number of sounds that can play at the same time
+# Number of queued paragraphs synthesized ahead of the one playing, so the next one is ready when it ends
+TTS_PREFETCH_DEPTH = 2
+
+# Mapping of language names to gTTS language codes as they are not the same as the Google Translate or OCR ones
+TTS_LANGUAGE_CODES = {
+    'English': 'en',
+    'Spanish': 'es',
+    'French': 'fr',
+    'German': 'de',
+    'Chinese (Simplified)': 'zh-CN',
+    'Japanese': 'ja',
+    'Korean': 'ko',
+    'Russian': 'ru',
+    'Italian': 'it',
+    'Portuguese': 'pt',
+    'Dutch': 'nl',
+    'Greek': 'el',
+    'Arabic': 'ar',
+    'Hindi': 'hi',
+    'Bengali': 'bn',
+    'Turkish': 'tr',
+    'Vietnamese': 'vi',
+    'Polish': 'pl',
+    'Ukrainian': 'uk',
+    'Hebrew': 'iw',
+    'Swedish': 'sv',
+    'Norwegian': 'no',
+    'Finnish': 'fi',
+    'Danish': 'da',
+    'Hungarian': 'hu',
+    'Czech': 'cs',
+    'Romanian': 'ro',
+    'Thai': 'th',
+    'Indonesian': 'id',
+    'Malay': 'ms',
+    'Filipino': 'tl',
+    'Swahili': 'sw',
+}
+
+# Class that synthesizes speech with gTTS, caches the audio in memory and plays it with one shared pygame mixer
+class TextToSpeech:
+    def __init__(self, max_cache_bytes=TTS_CACHE_MAX_BYTES):
+        """
+        :param max_cache_bytes: Maximum total size of the cached MP3 audio.
+        """
+        self.max_cache_bytes = max_cache_bytes
+        self.cache = OrderedDict()  # (language code, text) -> MP3 bytes, oldest first
+        self.cache_bytes = 0
+        self.cache_lock = threading.Lock()
+        self.mixer_lock = threading.Lock()
+        self.playing = []  # {"channel", "finished", "stopped", "owner"} for every sound currently playing
+        self.playing_lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def get_language_code(language_name):
+        """
+        Map a language name to its gTTS language code, English if the language is not listed.
+        """
+        return TTS_LANGUAGE_CODES.get(language_name, 'en')
+
+    def init_mixer(self):
+        """
+        Initialise the pygame mixer the first time audio is played. It stays open for the rest of the session.
+        """
+        with self.mixer_lock:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init(frequency=TTS_MIXER_FREQUENCY, channels=1)
+                pygame.mixer.set_num_channels(TTS_MIXER_CHANNELS)
+
+    def synthesize(self, text, language_name):
+        """
+        Return the MP3 audio of the text, from the cache if the same text was spoken before in the same language.
+        :param text: Text to speak.
+        :param language_name: The name of the language (e.g., "English").
+        :return: MP3 bytes.
+        """
+        key = (self.get_language_code(language_name), text)
+        with self.cache_lock:
+            audio = self.cache.get(key)
+            if audio is not None:
+                self.cache.move_to_end(key)
+                self.stats["hits"] += 1
+                return audio
+            self.stats["misses"] += 1
+
+        # Written to memory instead of output.mp3 so concurrent calls do not overwrite each other's file
+        buffer = io.BytesIO()
+        gTTS(text=text, lang=key[0]).write_to_fp(buffer)
+        audio = buffer.getvalue()
+
+        with self.cache_lock:
+            if key not in self.cache and len(audio) <= self.max_cache_bytes:
+                self.cache[key] = audio
+                self.cache_bytes += len(audio)
+                while self.cache_bytes > self.max_cache_bytes:
+                    _, evicted = self.cache.popitem(last=False)
+                    self.cache_bytes -= len(evicted)
+        return audio
+
+    def play(self, audio, volume=0.5, owner=None, is_cancelled=None):
+        """
+        Play MP3 audio from memory and block until it finishes or stop() is called.
+        The end of playback is signalled by a timer set to the length of the sound, so nothing polls the mixer.
+        :param audio: MP3 bytes from synthesize.
+        :param volume: Volume between 0.0 and 1.0.
+        :param owner: Optional object passed to stop() to stop only the sounds it started.
+        :param is_cancelled: Optional callable checked once the sound is registered with stop(), so a cancellation that
+                             came while the audio was being decoded still stops it.
+        :return: True if the audio played to the end, False if it was stopped.
+        """
+        self.init_mixer()
+        sound = pygame.mixer.Sound(file=io.BytesIO(audio))
+        sound.set_volume(volume)
+        channel = sound.play()
+        if channel is None:
+            print("DEBUG: No free mixer channel for text to speech")
+            return False
+
+        playback = {"channel": channel, "finished": threading.Event(), "stopped": False, "owner": owner}
+        with self.playing_lock:
+            self.playing.append(playback)
+        if is_cancelled is not None and is_cancelled():
+            playback["stopped"] = True
+            channel.stop()
+            playback["finished"].set()
+        timer = threading.Timer(sound.get_length(), playback["finished"].set)
+        timer.daemon = True
+        timer.start()
+        playback["finished"].wait()
+        timer.cancel()
+        with self.playing_lock:
+            self.playing.remove(playback)
+        return not playback["stopped"]
+
+    def stop(self, owner=None):
+        """
+        Stop the sounds that are playing and wake up the threads waiting on them.
+        :param owner: Only stop the sounds played with this owner, or None to stop every sound.
+        """
+        with self.playing_lock:
+            playing = [playback for playback in self.playing if owner is None or playback["owner"] is owner]
+        for playback in playing:
+            playback["stopped"] = True
+            playback["channel"].stop()
+            playback["finished"].set()
+
+
+# Class that speaks a list of paragraphs in order, synthesizing the next paragraphs while the current one plays
+class SpeechQueue:
+    def __init__(self, text_to_speech, prefetch_depth=TTS_PREFETCH_DEPTH):
+        """
+        :param text_to_speech: TextToSpeech used to synthesize and play the audio.
+        :param prefetch_depth: Number of queued paragraphs synthesized ahead of the one playing (0 synthesizes each one when its turn comes).
+        """
+        self.tts = text_to_speech
+        self.prefetch_depth = prefetch_depth
+        self.executor = ThreadPoolExecutor(max_workers=max(1, prefetch_depth), thread_name_prefix="tts-synth")
+        self.pending = deque()  # {"text", "language", "volume", "generation", "audio" future or None}, in speaking order
+        self.generation = 0  # Incremented by cancel so items from a replaced overlay are dropped
+        self.condition = threading.Condition()
+        self.player_thread = threading.Thread(target=self.run, name="tts-player", daemon=True)
+        self.player_thread.start()
+
+    def prefetch(self):
+        """
+        Start synthesizing the first prefetch_depth pending paragraphs. Must be called with the condition held.
+        """
+        for item in list(self.pending)[:self.prefetch_depth]:
+            if item["audio"] is None:
+                item["audio"] = self.executor.submit(self.tts.synthesize, item["text"], item["language"])
+
+    def enqueue(self, texts, language_name, volume=0.5):
+        """
+        Add paragraphs to the end of the queue.
+        :param texts: List of texts, spoken in this order.
+        :param language_name: The name of the language (e.g., "English").
+        :param volume: Volume between 0.0 and 1.0.
+        """
+        with self.condition:
+            for text in texts:
+                if text and text.strip():
+                    self.pending.append({"text": text, "language": language_name, "volume": volume,
+                                         "generation": self.generation, "audio": None})
+            self.prefetch()
+            self.condition.notify()
+
+    def speak_all(self, texts, language_name, volume=0.5):
+        """
+        Replace whatever is queued or playing with a new list of paragraphs.
+        """
+        self.cancel()
+        self.enqueue(texts, language_name, volume)
+
+    def cancel(self):
+        """
+        Drop every pending paragraph and stop the one that is playing.
+        """
+        with self.condition:
+            self.generation += 1
+            for item in self.pending:
+                if item["audio"] is not None:
+                    item["audio"].cancel()  # Only cancels synthesis that has not started yet
+            self.pending.clear()
+        self.tts.stop(owner=self)
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                item = self.pending.popleft()
+                if item["audio"] is None:
+                    item["audio"] = self.executor.submit(self.tts.synthesize, item["text"], item["language"])
+                # The following paragraphs are synthesized while this one plays
+                self.prefetch()
+
+            try:
+                audio = item["audio"].result()
+            except Exception as e:
+                print(f"Error in TTS: {e}")
+                continue
+            with self.condition:
+                if item["generation"] != self.generation:
+                    continue  # Cancelled while it was being synthesized
+            print(f"DEBUG: Audio playback started for text: {item['text']} at volume: {item['volume']}")
+            # Checked again once the playback is registered, a cancel() before that point would find nothing to stop
+            self.tts.play(audio, item["volume"], owner=self,
+                          is_cancelled=lambda: item["generation"] != self.generation)
+
+
+# Shared text to speech so the mixer is only initialised once and the audio cache is shared by both tabs
+_text_to_speech = None
+_text_to_speech_lock = threading.Lock()
+
+def get_text_to_speech():
+    """
+    Return the process-wide TextToSpeech, creating it on first use.
+    """
+    global _text_to_speech
+    with _text_to_speech_lock:
+        if _text_to_speech is None:
+            _text_to_speech = TextToSpeech()
+        return _text_to_speech
+
+
+# Shared queue so a new snip or translation replaces the paragraphs still waiting to be spoken
+_speech_queue = None
+_speech_queue_lock = threading.Lock()
+
+def get_speech_queue():
+    """
+    Return the process-wide SpeechQueue, creating it on first use.
+    """
+    global _speech_queue
+    with _speech_queue_lock:
+        if _speech_queue is None:
+            _speech_queue = SpeechQueue(get_text_to_speech())
+        return _speech_queue
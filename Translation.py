@@ -1,12 +1,22 @@
 from googletrans import Translator
+from TranslationCache import get_translation_cache
 
 # Class to handle Google Translate translations
 class TranslationHandling:
     def __init__(self):
         self.translator = Translator()
+        self.cache = get_translation_cache()
+        self.rate_limiter = None  # Optional RateLimiter, set by TranslationExecutor when translating in parallel
 
-    def translate_text(self, text, dest_language='en'):
-        translation = self.translator.translate(text, dest=dest_language)
+    def translate_text(self, text, dest_language='en', src_language='auto'):
+        # Repeated text is served from the translation cache instead of going back to Google Translate
+        cached = self.cache.get("google", src_language, dest_language, text)
+        if cached is not None:
+            return cached
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        translation = self.translator.translate(text, src=src_language, dest=dest_language)
+        self.cache.put("google", src_language, dest_language, text, translation.text)
         return translation.text
 
     
@@ -0,0 +1,176 @@
+import atexit
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# On-disk cache file so translations survive restarts. Set to None to keep the cache in memory only.
+TRANSLATION_CACHE_DB = "translation_cache.db"
+# Maximum number of translations kept in the in-memory tier before the least recently used is evicted
+TRANSLATION_CACHE_MAX_ENTRIES = 4096
+# New translations are written to disk by a background thread in one transaction at most this often,
+# so the parallel translation workers never wait on a SQLite commit
+TRANSLATION_CACHE_FLUSH_SECONDS = 0.5
+
+# Class that caches translation results so repeated text (UI strings, subtitles) does not go back to the API
+class TranslationCache:
+    def __init__(self, max_entries=TRANSLATION_CACHE_MAX_ENTRIES, db_path=TRANSLATION_CACHE_DB):
+        """
+        :param max_entries: Size of the in-memory LRU tier.
+        :param db_path: Path of the SQLite file used as the persistent tier, or None to disable it.
+        """
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self.enabled = True
+        self.entries = OrderedDict()  # (backend, source, target, text) -> translation, oldest first
+        self.lock = threading.Lock()  # Guards the in-memory tier, the pending writes and the counters
+        self.connection = None
+        self.db_lock = threading.Lock()  # Guards the SQLite connection, never held together with self.lock
+        self.pending = {}  # Key -> translation waiting to be written to disk
+        self.pending_event = threading.Event()
+        self.stats = {"hits": 0, "misses": 0, "memory_hits": 0, "disk_hits": 0}
+
+        if db_path:
+            try:
+                self.connection = sqlite3.connect(db_path, check_same_thread=False)
+                self.connection.execute(
+                    "CREATE TABLE IF NOT EXISTS translations ("
+                    "backend TEXT, source TEXT, target TEXT, text TEXT, translation TEXT, "
+                    "PRIMARY KEY (backend, source, target, text))"
+                )
+                self.connection.commit()
+            except sqlite3.Error as e:
+                print(f"DEBUG: Translation cache database unavailable, using memory only: {e}")
+                self.connection = None
+
+        if self.connection is not None:
+            threading.Thread(target=self.run_writer, name="translation-cache-writer", daemon=True).start()
+            atexit.register(self.flush)  # Write whatever is still pending when the application closes
+
+    @staticmethod
+    def normalise_text(text):
+        """
+        Collapse whitespace so the same text split over different lines or OCR spacing shares a cache entry.
+        """
+        return " ".join(text.split())
+
+    def make_key(self, backend, source_language, target_language, text):
+        return (backend, source_language or "auto", target_language, self.normalise_text(text))
+
+    def get(self, backend, source_language, target_language, text):
+        """
+        Look up a translation, first in memory then on disk.
+        :return: The cached translation or None on a miss.
+        """
+        if not self.enabled:
+            return None
+        key = self.make_key(backend, source_language, target_language, text)
+        with self.lock:
+            translation = self.entries.get(key)
+            if translation is None:
+                translation = self.pending.get(key)  # Evicted from memory before it was written to disk
+            if translation is not None:
+                self.stats["hits"] += 1
+                self.stats["memory_hits"] += 1
+                self.remember(key, translation)
+                return translation
+
+        row = None
+        if self.connection is not None:
+            # Read without the memory lock so other lookups are not held up by the disk
+            with self.db_lock:
+                row = self.connection.execute(
+                    "SELECT translation FROM translations WHERE backend=? AND source=? AND target=? AND text=?", key
+                ).fetchone()
+
+        with self.lock:
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["hits"] += 1
+            self.stats["disk_hits"] += 1
+            self.remember(key, row[0])
+            return row[0]
+
+    def put(self, backend, source_language, target_language, text, translation):
+        """
+        Store a translation in memory and queue it for the background writer. Failed (None or empty) translations are not cached.
+        """
+        if not self.enabled or not translation:
+            return
+        key = self.make_key(backend, source_language, target_language, text)
+        with self.lock:
+            self.remember(key, translation)
+            if self.connection is not None:
+                self.pending[key] = translation
+                self.pending_event.set()
+
+    def run_writer(self):
+        while True:
+            self.pending_event.wait()
+            # Wait a moment so the other paragraphs of the same capture are written in the same transaction
+            time.sleep(TRANSLATION_CACHE_FLUSH_SECONDS)
+            self.flush()
+
+    def flush(self):
+        """
+        Write every pending translation to disk in one transaction.
+        """
+        with self.lock:
+            batch = [key + (translation,) for key, translation in self.pending.items()]
+            self.pending.clear()
+            self.pending_event.clear()
+        if not batch or self.connection is None:
+            return
+        with self.db_lock:
+            try:
+                self.connection.executemany("INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)", batch)
+                self.connection.commit()
+            except sqlite3.Error as e:
+                print(f"DEBUG: Failed to write {len(batch)} translation cache entries: {e}")
+
+    def remember(self, key, translation):
+        # Must be called with the lock held
+        self.entries[key] = translation
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def get_stats(self):
+        """
+        Return the hit and miss counters along with the number of entries held in memory.
+        """
+        with self.lock:
+            stats = dict(self.stats)
+            stats["memory_entries"] = len(self.entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """
+        Remove every cached translation from both tiers and reset the counters.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.pending.clear()
+            self.stats = {key: 0 for key in self.stats}
+        if self.connection is not None:
+            with self.db_lock:
+                self.connection.execute("DELETE FROM translations")
+                self.connection.commit()
+
+
+# Shared cache used by every translation backend in the process
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_translation_cache():
+    """
+    Return the process-wide TranslationCache, creating it on first use.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TranslationCache()
+        return _cache
@@ -0,0 +1,97 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from Translation import TranslationHandling
+
+# Maximum number of paragraphs translated at the same time
+TRANSLATION_MAX_WORKERS = 4
+# Maximum requests per second sent to each translation backend, shared by all workers
+TRANSLATION_RATE_LIMITS = {"google": 5.0}
+
+# Class that spaces out requests to a backend so parallel workers do not trip its rate limit
+class RateLimiter:
+    def __init__(self, requests_per_second):
+        """
+        :param requests_per_second: Maximum number of requests allowed per second.
+        """
+        self.interval = 1.0 / requests_per_second
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Block until the caller is allowed to send its request.
+        """
+        with self.lock:
+            now = time.monotonic()
+            wait = max(0.0, self.next_slot - now)
+            self.next_slot = max(now, self.next_slot) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Class that translates the paragraphs of a snip in parallel with a bounded number of workers
+class TranslationExecutor:
+    def __init__(self, max_workers=TRANSLATION_MAX_WORKERS, rate_limits=None):
+        """
+        :param max_workers: Maximum number of paragraphs translated at the same time.
+        :param rate_limits: Dictionary of backend name -> maximum requests per second.
+        """
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="translation")
+        rate_limits = TRANSLATION_RATE_LIMITS if rate_limits is None else rate_limits
+        self.rate_limiters = {backend: RateLimiter(rate) for backend, rate in rate_limits.items()}
+        self.thread_state = threading.local()  # Each worker thread keeps its own googletrans Translator
+
+    def get_translator(self):
+        """
+        Return the Google Translate handler of the calling worker thread, creating it on first use.
+        """
+        translator = getattr(self.thread_state, "translator", None)
+        if translator is None:
+            translator = TranslationHandling()
+            # Only requests that miss the translation cache wait for the rate limiter
+            translator.rate_limiter = self.rate_limiters.get("google")
+            self.thread_state.translator = translator
+        return translator
+
+    def translate_one(self, text, target_lang):
+        return self.get_translator().translate_text(text, target_lang)
+
+    def map(self, texts, target_lang, on_result=None):
+        """
+        Translate texts in parallel with Google Translate.
+        :param texts: List of texts to be translated.
+        :param target_lang: The target language passed to Google Translate.
+        :param on_result: Optional callback(index, translated_text) called from the worker thread as soon as each text finishes.
+        :return: List of translated texts in the same order as the input.
+        """
+        futures = []
+        for index, text in enumerate(texts):
+            future = self.executor.submit(self.translate_one, text, target_lang)
+            if on_result is not None:
+                future.add_done_callback(lambda done, index=index: self.notify(done, index, on_result))
+            futures.append(future)
+        return [future.result() for future in futures]
+
+    def notify(self, future, index, on_result):
+        # Failed translations are raised from map() instead of being reported here
+        if not future.cancelled() and future.exception() is None:
+            on_result(index, future.result())
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Shared executor so the worker threads and their translators are reused between snips
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_translation_executor():
+    """
+    Return the process-wide TranslationExecutor, creating it on first use.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = TranslationExecutor()
+        return _executor
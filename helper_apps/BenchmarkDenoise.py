@@ -0,0 +1,102 @@
+"""
+Measures how much OCR accuracy the realtime denoise methods cost compared to NL-means.
+
+Every language whose preprocessing config uses denoising is preprocessed with each method in DENOISE_METHODS
+(fastNlMeansDenoising, downscaled NL-means and a bilateral filter), then OCR'd with Tesseract and compared with
+the ground truth in benchmark_test_texts. The results are written to denoise_benchmark_results.csv with the
+accuracy drop and speed-up of each method relative to NL-means, so the realtime profile's trade-off is known per language.
+"""
+
+import os
+import sys
+# Adds the parent directory to sys.path since the script is in a subdirectory helper_apps so that it can import modules from the main directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Main import TESSERACT_PATH  # Import the Tesseract path from Main.py
+import csv
+import time
+import pytesseract
+from PIL import Image
+from Levenshtein import distance as levenshtein_distance
+from PipelineForOCR import frame_to_grey, preprocess_grey, perform_ocr, get_ocr_language_code
+from PreprocessingPlan import DENOISE_METHODS
+
+IMAGE_FOLDER = "benchmark_test_images"
+TEXT_FOLDER = "benchmark_test_texts"
+OUTPUT_CSV = "denoise_benchmark_results.csv"
+# Languages whose preprocessing config uses denoising, the other languages are not affected by the realtime profile
+LANGUAGES = ["Arabic", "Bengali", "Greek"]
+# Each image is preprocessed this many times and the fastest run is kept to reduce timing noise
+TIMING_REPEATS = 3
+pytesseract.pytesseract.tesseract_cmd = TESSERACT_PATH
+
+def calculate_accuracy_with_levenshtein__distance(ocr_text, ground_truth_text):
+    """
+    Calculate OCR accuracy using Levenshtein distance, ignoring spaces and gaps.
+    """
+    ocr_text = ''.join(ocr_text.split())
+    ground_truth_text = ''.join(ground_truth_text.split())
+    distance = levenshtein_distance(ocr_text, ground_truth_text)
+    total_chars = max(len(ground_truth_text), len(ocr_text))
+    return 0.0 if total_chars == 0 else ((total_chars - distance) / total_chars) * 100
+
+def benchmark_method(grey_images, language_name, ground_truth_text, denoise_method):
+    """
+    Preprocess and OCR both images with one denoise method.
+    :return: (average accuracy, average preprocessing time in ms, average OCR time in ms)
+    """
+    language_code = get_ocr_language_code(language_name)
+    accuracies, preprocess_times, ocr_times = [], [], []
+    for grey in grey_images:
+        best_time = None
+        for _ in range(TIMING_REPEATS):
+            start_time = time.perf_counter()
+            processed = preprocess_grey(grey, language_code, denoise_method=denoise_method)
+            elapsed = time.perf_counter() - start_time
+            best_time = elapsed if best_time is None else min(best_time, elapsed)
+        preprocess_times.append(best_time * 1000)
+
+        start_time = time.perf_counter()
+        full_text, _ = perform_ocr(processed, lang_name=language_name, use_preprocessing=False)
+        ocr_times.append((time.perf_counter() - start_time) * 1000)
+        accuracies.append(calculate_accuracy_with_levenshtein__distance(full_text, ground_truth_text))
+    count = len(grey_images)
+    return sum(accuracies) / count, sum(preprocess_times) / count, sum(ocr_times) / count
+
+def benchmark():
+    with open(OUTPUT_CSV, mode="w", newline="", encoding="utf-8-sig") as csv_file:
+        csv_writer = csv.writer(csv_file)
+        csv_writer.writerow([
+            "Language", "Denoise Method", "Average Accuracy (%)", "Accuracy Change vs NL-means (%)",
+            "Average Preprocessing Time (ms)", "Preprocessing Speed-up vs NL-means", "Average OCR Time (ms)"
+        ])
+
+        for language_name in LANGUAGES:
+            file_stem = f"paragraph_{language_name.replace(' ', '_')}"
+            text_path = os.path.join(TEXT_FOLDER, f"{file_stem}.txt")
+            image_paths = [os.path.join(IMAGE_FOLDER, f"{file_stem}_{index}.png") for index in (1, 2)]
+            if not os.path.exists(text_path) or not all(os.path.exists(path) for path in image_paths):
+                print(f"WARNING: Benchmark files not found for {language_name}. Skipping...")
+                continue
+
+            with open(text_path, "r", encoding="utf-8") as file:
+                ground_truth_text = file.read()
+            grey_images = [frame_to_grey(Image.open(path)) for path in image_paths]
+
+            baseline = None
+            for denoise_method in DENOISE_METHODS:
+                accuracy, preprocess_ms, ocr_ms = benchmark_method(grey_images, language_name, ground_truth_text, denoise_method)
+                if baseline is None:
+                    baseline = (accuracy, preprocess_ms)  # DENOISE_METHODS starts with NL-means
+                speed_up = baseline[1] / preprocess_ms if preprocess_ms else 0.0
+                csv_writer.writerow([
+                    language_name, denoise_method, f"{accuracy:.2f}", f"{accuracy - baseline[0]:+.2f}",
+                    f"{preprocess_ms:.1f}", f"{speed_up:.1f}x", f"{ocr_ms:.1f}"
+                ])
+                print(f"{language_name:<10} {denoise_method:<20} accuracy {accuracy:6.2f}% ({accuracy - baseline[0]:+.2f}), "
+                      f"preprocessing {preprocess_ms:8.1f} ms ({speed_up:.1f}x), OCR {ocr_ms:8.1f} ms")
+
+    print(f"Results saved to {OUTPUT_CSV}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,97 @@
+"""
+Checks the pooled HTTP session against a local stand-in for the DeepL and Google Vision APIs.
+
+A small HTTP/1.1 server on localhost answers with DeepL and Vision shaped JSON and counts how many
+TCP connections the clients open. The same number of calls is made once with a new connection per call
+(the previous module-level requests.post behaviour) and once through the shared keep-alive session used by
+DeepLTranslation and GoogleVisionOCR. No API keys are used and nothing leaves the machine.
+Both stand-ins share one host, so the Google Vision calls reuse the connection opened for DeepL.
+
+Note that the stand-in is plain HTTP, so the time saved here is only the TCP handshake.
+Against the real APIs each new connection also needs a TLS handshake, which is where most of the saving is.
+"""
+
+import os
+import sys
+# Adds the parent directory to sys.path since the script is in a subdirectory helper_apps so that it can import modules from the main directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import json
+import socket
+import threading
+import time
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from PIL import Image
+from HttpSession import get_http_session
+from DeepLTranslation import get_deepl_translation
+from GoogleVisionOCR import get_google_vision_ocr
+from TranslationCache import get_translation_cache
+
+CALLS = 20
+opened_connections = []
+
+# Stand-in API server that keeps connections alive and records every new connection
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Required for keep-alive
+
+    def setup(self):
+        super().setup()
+        # Send responses immediately, otherwise Nagle's algorithm delays every keep-alive response by ~40ms
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        opened_connections.append(self.client_address)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        if self.path.startswith("/v2/translate"):
+            body = {"translations": [{"detected_source_language": "EN", "text": "Hola"}]}
+        else:
+            body = {"responses": [{"fullTextAnnotation": {"text": "Hello", "pages": []}}]}
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass  # Keep the benchmark output readable
+
+
+def time_calls(name, call):
+    opened_connections.clear()
+    start_time = time.perf_counter()
+    for i in range(CALLS):
+        call(i)
+    average_ms = (time.perf_counter() - start_time) / CALLS * 1000
+    print(f"{name:<45} {len(opened_connections):>3} new connections for {CALLS} calls, {average_ms:.2f} ms per call")
+
+
+def benchmark():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # Point the shared clients at the stand-in server and make every translation a cache miss
+    get_translation_cache().enabled = False
+    deepl = get_deepl_translation()
+    deepl.endpoint = f"{base_url}/v2/translate"
+    vision = get_google_vision_ocr()
+    vision.endpoint = f"{base_url}/v1/images:annotate"
+
+    image_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stand_in_vision_image.png")
+    Image.new("L", (64, 64), 255).save(image_path)
+
+    try:
+        time_calls("DeepL, new connection per call", lambda i: requests.post(deepl.endpoint, data={"text": f"Hello {i}", "target_lang": "ES"}))
+        time_calls("DeepL, pooled session", lambda i: deepl.translate_text(f"Hello {i}", "Spanish"))
+        time_calls("Google Vision, new connection per call", lambda i: requests.post(vision.endpoint, json={"requests": []}))
+        time_calls("Google Vision, pooled session", lambda i: vision.perform_ocr(image_path))
+    finally:
+        os.remove(image_path)
+        server.shutdown()
+        get_http_session().close()
+
+
+if __name__ == "__main__":
+    benchmark()
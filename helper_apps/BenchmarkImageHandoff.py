@@ -0,0 +1,103 @@
+"""
+Benchmark of the image handoff between the mss screen capture, the preprocessing and the OCR engine.
+
+The legacy path builds a PIL image from the mss RGB bytes, converts it back to NumPy, goes RGB -> BGR -> GREY,
+wraps the result in a PIL image again and pytesseract then encodes it to a PNG file before tesseract reads it.
+The buffer path wraps the mss BGRA buffer as a NumPy array, converts it to grey in one step and hands the raw
+pixels to the OCR engine.
+
+No OCR is run here, only the work done before the engine receives the image is measured.
+The frame is built from one of the benchmark test images so the PNG encode size is realistic.
+Bytes copied are the sizes of every new full-frame buffer written along each path.
+"""
+
+import os
+import sys
+# Adds the parent directory to sys.path since the script is in a subdirectory helper_apps so that it can import modules from the main directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import io
+import time
+import cv2
+import numpy as np
+from PIL import Image
+from PipelineForOCR import frame_to_grey
+
+IMAGE_PATH = os.path.join("benchmark_test_images", "paragraph_English_1.png")
+ITERATIONS = 50
+
+
+def load_bgra_frame(image_path):
+    """
+    Build a bytearray in the same BGRA layout that mss returns from ScreenShot.raw.
+    :return: Tuple of (raw bytearray, width, height).
+    """
+    rgb = np.asarray(Image.open(image_path).convert("RGB"))
+    bgra = cv2.cvtColor(rgb, cv2.COLOR_RGB2BGRA)
+    height, width = bgra.shape[:2]
+    return bytearray(bgra.tobytes()), width, height
+
+
+def legacy_handoff(raw, width, height):
+    """
+    The previous capture to OCR path. Returns the number of bytes copied into new buffers.
+    """
+    copied = 0
+    bgra = np.frombuffer(raw, dtype=np.uint8).reshape(height, width, 4)
+
+    # ScreenShot.rgb builds a new RGB bytes object from the BGRA buffer
+    rgb_bytes = np.ascontiguousarray(bgra[:, :, 2::-1]).tobytes()
+    copied += len(rgb_bytes)
+
+    # Image.frombytes copies the bytes into PIL's own storage
+    pil_img = Image.frombytes("RGB", (width, height), rgb_bytes)
+    copied += width * height * 3
+
+    # preprocess_for_ocr: np.array, RGB -> BGR, BGR -> GREY, Image.fromarray
+    img_array = np.array(pil_img)
+    copied += img_array.nbytes
+    img_cv = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+    copied += img_cv.nbytes
+    grey = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
+    copied += grey.nbytes
+    pil_grey = Image.fromarray(grey)
+
+    # pytesseract saves the image as a PNG on disk before tesseract reads it back
+    png_buffer = io.BytesIO()
+    pil_grey.save(png_buffer, format="PNG")
+    copied += png_buffer.tell()
+    return copied
+
+
+def buffer_handoff(raw, width, height):
+    """
+    The new capture to OCR path. Returns the number of bytes copied into new buffers.
+    """
+    copied = 0
+    # Zero-copy view over the mss buffer
+    bgra = np.frombuffer(raw, dtype=np.uint8).reshape(height, width, 4)
+
+    # Single BGRA -> GREY conversion
+    grey = frame_to_grey(bgra)
+    copied += grey.nbytes
+
+    # The persistent engine receives the raw greyscale pixels (tesserocr needs them as a bytes object)
+    pixels = grey.tobytes()
+    copied += len(pixels)
+    return copied
+
+
+def benchmark():
+    raw, width, height = load_bgra_frame(IMAGE_PATH)
+    print(f"Frame: {width}x{height} BGRA ({len(raw):,} bytes)")
+
+    for name, handoff in [("Legacy (PIL + PNG)", legacy_handoff), ("Buffer (NumPy)", buffer_handoff)]:
+        copied = handoff(raw, width, height)
+        start_time = time.perf_counter()
+        for _ in range(ITERATIONS):
+            handoff(raw, width, height)
+        average_ms = (time.perf_counter() - start_time) / ITERATIONS * 1000
+        print(f"{name:<20} {copied:>12,} bytes copied per frame ({copied / len(raw):.2f}x the frame)  {average_ms:.2f} ms per frame")
+
+
+if __name__ == "__main__":
+    benchmark()
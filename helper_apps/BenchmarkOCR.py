@@ -8,6 +8,7 @@ from PIL import Image
 import csv
 from Levenshtein import distance as levenshtein_distance
 from PipelineForOCR import preprocess_for_ocr, perform_ocr, perform_translation, get_ocr_language_code
+from GoogleVisionOCR import get_google_vision_ocr
 from Translation import TranslationHandling
 import psutil
 import time
@@ -141,14 +142,21 @@ def compare_ocr_with_ground_truth():
                             avg_preprocess_time = sum(preprocess_times) / 2
 
                             # Perform OCR And Measure The Time It Takes For Each Image
-                            ocr_start_1 = time.time()
-                            full_text_1, _ = perform_ocr(image_1_proc, lang_name=language_name, use_preprocessing=False, use_google_vision=(ocr_method == "Google Vision"))
-                            ocr_time_1 = time.time() - ocr_start_1
-
-                            ocr_start_2 = time.time()
-                            full_text_2, _ = perform_ocr(image_2_proc, lang_name=language_name, use_preprocessing=False, use_google_vision=(ocr_method == "Google Vision"))
-                            ocr_time_2 = time.time() - ocr_start_2
-                            ocr_time = (ocr_time_1 + ocr_time_2) / 2
+                            if ocr_method == "Google Vision":
+                                # Both images are sent in a single annotate request, the time is shared between them
+                                ocr_start = time.time()
+                                result_1, result_2 = get_google_vision_ocr().perform_ocr_batch([image_1_proc, image_2_proc])
+                                ocr_time = (time.time() - ocr_start) / 2
+                                full_text_1, full_text_2 = result_1["full_text"], result_2["full_text"]
+                            else:
+                                ocr_start_1 = time.time()
+                                full_text_1, _ = perform_ocr(image_1_proc, lang_name=language_name, use_preprocessing=False, use_google_vision=False)
+                                ocr_time_1 = time.time() - ocr_start_1
+
+                                ocr_start_2 = time.time()
+                                full_text_2, _ = perform_ocr(image_2_proc, lang_name=language_name, use_preprocessing=False, use_google_vision=False)
+                                ocr_time_2 = time.time() - ocr_start_2
+                                ocr_time = (ocr_time_1 + ocr_time_2) / 2
 
                             # Measure Average Total Time For Preprocessing and OCR
                             avg_total_time = (time.time() - start_time) / 2
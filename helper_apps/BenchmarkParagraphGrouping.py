@@ -0,0 +1,64 @@
+"""
+Microbenchmark of the two ways perform_ocr merges Tesseract words into paragraphs.
+
+A synthetic image_to_data result is built for a dense screen (many paragraphs of many words, including the empty
+block/paragraph/line rows Tesseract adds), so no Tesseract installation is needed.
+The original word by word loop (group_words_legacy) is timed against the NumPy version (group_words_vectorised).
+"""
+
+import os
+import sys
+# Adds the parent directory to sys.path since the script is in a subdirectory helper_apps so that it can import modules from the main directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import time
+from TesseractEngine import OCR_DATA_KEYS
+from PipelineForOCR import group_words_legacy, group_words_vectorised
+
+# (paragraphs, words per paragraph) screen sizes to test
+SCREEN_SIZES = [(5, 20), (50, 40), (200, 50)]
+WORDS_PER_LINE = 10
+REPEATS = 20
+
+def build_ocr_data(paragraph_count, words_per_paragraph):
+    """
+    Build a dictionary in the image_to_data format laid out as a column of paragraphs.
+    """
+    ocr_data = {key: [] for key in OCR_DATA_KEYS}
+
+    def add_row(level, block, par, line, word, left, top, width, height, conf, text):
+        for key, value in zip(OCR_DATA_KEYS, (level, 1, block, par, line, word, left, top, width, height, conf, text)):
+            ocr_data[key].append(value)
+
+    top = 10
+    for block in range(1, paragraph_count + 1):
+        add_row(2, block, 0, 0, 0, 10, top, 800, 0, -1, "")
+        add_row(3, block, 1, 0, 0, 10, top, 800, 0, -1, "")
+        for word in range(words_per_paragraph):
+            line, column = divmod(word, WORDS_PER_LINE)
+            if column == 0:
+                add_row(4, block, 1, line + 1, 0, 10, top + line * 20, 800, 16, -1, "")
+            add_row(5, block, 1, line + 1, column + 1, 10 + column * 80, top + line * 20, 70, 16, 95, f"word{word}")
+        top += (words_per_paragraph // WORDS_PER_LINE + 1) * 20 + 40
+    return ocr_data
+
+def time_grouping(group_function, ocr_data):
+    best_time = None
+    for _ in range(REPEATS):
+        start_time = time.perf_counter()
+        paragraphs = group_function(ocr_data)
+        elapsed = time.perf_counter() - start_time
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+    return best_time * 1000, len(paragraphs)
+
+def benchmark():
+    print(f"{'Words':>8} {'Legacy (ms)':>12} {'Paragraphs':>11} {'Vectorised (ms)':>16} {'Paragraphs':>11} {'Speed-up':>9}")
+    for paragraph_count, words_per_paragraph in SCREEN_SIZES:
+        ocr_data = build_ocr_data(paragraph_count, words_per_paragraph)
+        legacy_ms, legacy_paragraphs = time_grouping(group_words_legacy, ocr_data)
+        vectorised_ms, vectorised_paragraphs = time_grouping(group_words_vectorised, ocr_data)
+        print(f"{paragraph_count * words_per_paragraph:>8} {legacy_ms:>12.3f} {legacy_paragraphs:>11} "
+              f"{vectorised_ms:>16.3f} {vectorised_paragraphs:>11} {legacy_ms / vectorised_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    benchmark()
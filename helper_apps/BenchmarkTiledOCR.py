@@ -0,0 +1,86 @@
+"""
+Compares whole-image OCR with tiled OCR on the 1200x1200 images in benchmark_test_images.
+
+Tiled OCR splits the image into horizontal strips at the gaps between paragraphs (horizontal projection profile),
+OCRs the strips in parallel in the shared OCR process pool and shifts the paragraphs back into image coordinates.
+The benchmark images are below OCR_TILING_MIN_PIXELS, so perform_tiled_ocr is called directly here.
+Both paths are timed and checked against the ground truth text so a tiling split that cuts through text shows up as lost accuracy.
+"""
+
+import os
+import sys
+# Adds the parent directory to sys.path since the script is in a subdirectory helper_apps so that it can import modules from the main directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Main import TESSERACT_PATH  # Import the Tesseract path from Main.py
+import csv
+import time
+import pytesseract
+from PIL import Image
+from Levenshtein import distance as levenshtein_distance
+from PipelineForOCR import (OCR_TILING_WORKERS, frame_to_grey, get_ocr_language_code, get_ocr_process_pool,
+                            group_words, perform_tiled_ocr, split_into_strips)
+from TesseractEngine import get_tesseract_engine
+
+IMAGE_FOLDER = "benchmark_test_images"
+TEXT_FOLDER = "benchmark_test_texts"
+OUTPUT_CSV = "tiled_ocr_benchmark_results.csv"
+pytesseract.pytesseract.tesseract_cmd = TESSERACT_PATH
+
+def calculate_accuracy_with_levenshtein__distance(ocr_text, ground_truth_text):
+    """
+    Calculate OCR accuracy using Levenshtein distance, ignoring spaces and gaps.
+    """
+    ocr_text = ''.join(ocr_text.split())
+    ground_truth_text = ''.join(ground_truth_text.split())
+    distance = levenshtein_distance(ocr_text, ground_truth_text)
+    total_chars = max(len(ground_truth_text), len(ocr_text))
+    return 0.0 if total_chars == 0 else ((total_chars - distance) / total_chars) * 100
+
+def join_paragraphs(paragraphs, ocr_lang):
+    return ("" if ocr_lang == "chi_sim" else " ").join(p["text"] for p in paragraphs)
+
+def benchmark():
+    # Start the worker processes before timing so their start-up is not counted against the first image
+    get_ocr_process_pool().submit(int).result()
+
+    with open(OUTPUT_CSV, mode="w", newline="", encoding="utf-8-sig") as csv_file:
+        csv_writer = csv.writer(csv_file)
+        csv_writer.writerow(["Language", "Image", "Strips", "Whole Image Time (s)", "Tiled Time (s)", "Speed-up",
+                             "Whole Image Accuracy (%)", "Tiled Accuracy (%)"])
+
+        for text_file in sorted(f for f in os.listdir(TEXT_FOLDER) if f.endswith(".txt")):
+            language_name = text_file.replace("paragraph_", "").replace(".txt", "").replace("_", " ").strip()
+            ocr_lang = get_ocr_language_code(language_name)
+            with open(os.path.join(TEXT_FOLDER, text_file), "r", encoding="utf-8") as file:
+                ground_truth_text = file.read()
+
+            for index in (1, 2):
+                image_path = os.path.join(IMAGE_FOLDER, f"paragraph_{language_name.replace(' ', '_')}_{index}.png")
+                if not os.path.exists(image_path):
+                    print(f"WARNING: {image_path} not found. Skipping...")
+                    continue
+                grey = frame_to_grey(Image.open(image_path))
+
+                start_time = time.perf_counter()
+                whole_text = join_paragraphs(group_words(get_tesseract_engine().image_to_data(grey, ocr_lang)), ocr_lang)
+                whole_time = time.perf_counter() - start_time
+
+                strip_count = len(split_into_strips(grey, OCR_TILING_WORKERS))
+                start_time = time.perf_counter()
+                tiled_paragraphs = perform_tiled_ocr(grey, ocr_lang)
+                tiled_time = time.perf_counter() - start_time
+                # No paragraph breaks to split at means the image would be OCR'd whole
+                tiled_text = whole_text if tiled_paragraphs is None else join_paragraphs(tiled_paragraphs, ocr_lang)
+
+                whole_accuracy = calculate_accuracy_with_levenshtein__distance(whole_text, ground_truth_text)
+                tiled_accuracy = calculate_accuracy_with_levenshtein__distance(tiled_text, ground_truth_text)
+                csv_writer.writerow([language_name, index, strip_count, f"{whole_time:.2f}", f"{tiled_time:.2f}",
+                                     f"{whole_time / tiled_time:.1f}x", f"{whole_accuracy:.2f}", f"{tiled_accuracy:.2f}"])
+                print(f"{language_name} image {index}: {strip_count} strips, whole {whole_time:.2f}s ({whole_accuracy:.2f}%), "
+                      f"tiled {tiled_time:.2f}s ({tiled_accuracy:.2f}%)")
+
+    print(f"Results saved to {OUTPUT_CSV}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -9,6 +9,10 @@ import time
 import threading
 from PipelineForOCR import perform_translation
 from DeepLTranslation import DeepLTranslation  # Import DeepLTranslation class
+from TranslationCache import get_translation_cache
+
+# Disable the translation cache so every benchmark measures a real API round trip
+get_translation_cache().enabled = False
 
 # Paths to the benchmark folders
 TEXT_FOLDER = "benchmark_test_texts"
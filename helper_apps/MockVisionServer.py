@@ -0,0 +1,121 @@
+"""
+Local stand-in for the Google Vision images:annotate endpoint, so the Vision clients can be tested offline.
+
+The server answers every annotate request with recorded per-image responses from RESPONSES_FOLDER
+(one JSON file per image response, the entries of the "responses" list the real API returns), cycling through them.
+To record a new response, save one entry of a real API response's "responses" list into that folder.
+MOCK_LATENCY_SECONDS delays every response so request pipelining and cancellation can be seen.
+
+Running this script starts the server and checks the async client against it:
+- three snips submitted on the same channel, the first two are cancelled as they are superseded,
+- several requests in flight at once, limited by VISION_MAX_IN_FLIGHT,
+- one batched request with several images.
+No API key is used and nothing leaves the machine.
+"""
+
+import os
+import sys
+# Adds the parent directory to sys.path since the script is in a subdirectory helper_apps so that it can import modules from the main directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import glob
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from PIL import Image
+
+RESPONSES_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mock_vision_responses")
+MOCK_LATENCY_SECONDS = 0.5
+
+def load_recorded_responses(folder=RESPONSES_FOLDER):
+    """
+    Load every recorded per-image response in the folder, sorted by file name.
+    """
+    responses = []
+    for path in sorted(glob.glob(os.path.join(folder, "*.json"))):
+        with open(path, "r", encoding="utf-8") as file:
+            responses.append(json.load(file))
+    if not responses:
+        raise FileNotFoundError(f"No recorded responses found in {folder}")
+    return responses
+
+
+def make_handler(responses, latency):
+    recorded = itertools.cycle(responses)
+    recorded_lock = threading.Lock()
+
+    # Handler that replays the recorded responses, one per image in the request
+    class MockVisionHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-alive like the real API
+
+        def do_POST(self):
+            if not self.path.startswith("/v1/images:annotate"):
+                self.send_error(404)
+                return
+            length = int(self.headers.get("Content-Length", 0))
+            image_count = len(json.loads(self.rfile.read(length)).get("requests", []))
+            time.sleep(latency)
+            with recorded_lock:
+                body = {"responses": [next(recorded) for _ in range(image_count)]}
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass  # Keep the output readable
+
+    return MockVisionHandler
+
+
+def start_mock_vision_server(port=0, responses=None, latency=MOCK_LATENCY_SECONDS):
+    """
+    Start the stand-in server on a background thread.
+    :param port: Port to listen on, 0 picks a free port.
+    :return: Tuple of (server, endpoint URL to assign to the Vision client's endpoint attribute).
+    """
+    handler = make_handler(responses or load_recorded_responses(), latency)
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1/images:annotate"
+
+
+def self_test(endpoint):
+    from GoogleVisionOCR import get_google_vision_ocr
+    from AsyncGoogleVisionOCR import VISION_MAX_IN_FLIGHT, get_async_google_vision_ocr, aiohttp
+
+    get_google_vision_ocr().endpoint = endpoint
+    client = get_async_google_vision_ocr()
+    print(f"Async client using {'aiohttp' if aiohttp else 'the blocking client in a thread pool'}")
+    image = Image.new("L", (320, 240), 255)
+
+    # A newer snip on the same channel cancels the older ones that are still waiting
+    futures = [client.submit(image, channel="snip") for _ in range(3)]
+    result = futures[-1].result()
+    print(f"Superseded snips cancelled: {[future.cancelled() for future in futures[:-1]]}, "
+          f"latest snip returned {len(result['paragraphs'])} paragraphs: {result['full_text']!r}")
+
+    # Requests without a channel run side by side, up to VISION_MAX_IN_FLIGHT at a time
+    request_count = VISION_MAX_IN_FLIGHT * 2
+    start_time = time.perf_counter()
+    for future in [client.submit(image) for _ in range(request_count)]:
+        future.result()
+    print(f"{request_count} requests with {MOCK_LATENCY_SECONDS}s latency each took {time.perf_counter() - start_time:.2f}s "
+          f"({VISION_MAX_IN_FLIGHT} in flight)")
+
+    # Several images in one annotate request
+    results = client.submit([image] * 5).result()
+    print(f"Batched request returned {len(results)} results")
+    client.close()
+
+
+if __name__ == "__main__":
+    mock_server, mock_endpoint = start_mock_vision_server()
+    print(f"Mock Google Vision server listening on {mock_endpoint}")
+    try:
+        self_test(mock_endpoint)
+    finally:
+        mock_server.shutdown()
@@ -15,6 +15,21 @@ The results are averaged across the two images and the parameters that give the
 The lengthy time is a result of cycling around 288 variants of preprocessing for each image and language.
 Resulting in around 18,432 total OCR operations (288 x 2 x 32).
 Google Vision OCR is not considered as it expects no preprocessing. 
+
+EXECUTION_MODE = "process" (the default) runs the search in a process pool instead of the original thread pool:
+- Variants are streamed to the workers instead of building all 288 images per image up front.
+- The shared stages (inversion, contrast, denoise) are computed once per combination (24 per image instead of 288)
+  and each worker applies the 12 blur/threshold variants on top of them.
+- Every finished variant is appended to CHECKPOINT_FILE, so an interrupted run resumes where it stopped.
+EXECUTION_MODE = "thread" keeps the original behaviour.
+
+SEARCH_MODE = "halving" replaces the exhaustive grid with successive halving:
+- Every variant is scored on image 1 in order of increasing compute_processing_cost.
+- Any variant scoring 100% on image 1 is checked on image 2 straight away. The search stops at the first cost level
+  where a variant scores 100% on both images, since no other variant can beat it on accuracy or cost.
+- Otherwise only the top HALVING_PROMOTE_FRACTION of variants by image 1 accuracy are promoted to image 2.
+The CSV has the same columns as the exhaustive run so the two can be compared directly.
+Checkpointing is only used by the exhaustive search.
 """
 
 import os
@@ -22,11 +37,14 @@ import sys
 # Add the parent directory to sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import csv
+import json
+import math
 import pytesseract
 import numpy as np
 import cv2
 from PIL import Image
-from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
 from Levenshtein import distance as levenshtein_distance
 from PipelineForOCR import perform_ocr, get_ocr_language_code
 from Translation import TranslationHandling
@@ -35,6 +53,17 @@ from Translation import TranslationHandling
 IMAGE_FOLDER = "benchmark_test_images"
 TEXT_FOLDER = "benchmark_test_texts"
 OUTPUT_CSV = "ocr_accuracy_parameter_search.csv"
+CHECKPOINT_FILE = "ocr_accuracy_parameter_search.checkpoint.jsonl"
+SEARCH_MODE = "exhaustive"  # "exhaustive" (every variant on both images) or "halving" (successive halving with early stopping)
+HALVING_PROMOTE_FRACTION = 0.25  # Fraction of variants promoted from image 1 to image 2 in halving mode
+EXECUTION_MODE = "process"  # "process" (streamed process pool with shared stages and checkpointing) or "thread" (original)
+MAX_WORKERS = os.cpu_count()
+MAX_IN_FLIGHT = MAX_WORKERS * 2  # Shared-stage images queued for the workers at any one time
+# Every variant is read with one whole-image image_to_data call and the same paragraph grouping, whichever mode runs it.
+# NumPy images would otherwise take the text region or tiled OCR paths that PIL images skip, so the thread and
+# process results could not be compared.
+OCR_OPTIONS = {"use_preprocessing": False, "use_google_vision": False, "use_text_regions": False, "use_tiling": False,
+               "paragraph_grouping": "vectorised"}
 pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
 translator = TranslationHandling()
 
@@ -140,7 +169,7 @@ def preprocess_for_ocr(pil_img, contrast_values, denoise_values, invert_options,
 def evaluate_variant(variant, language_name, ground_truth_text):
     try:
         img = variant["image"]
-        full_text, _ = perform_ocr(img, lang_name=language_name, use_preprocessing=False, use_google_vision=False)
+        full_text, _ = perform_ocr(img, lang_name=language_name, **OCR_OPTIONS)
         accuracy = calculate_accuracy_with_levenshtein__distance(full_text, ground_truth_text)
         return {
             "accuracy": accuracy,
@@ -150,13 +179,275 @@ def evaluate_variant(variant, language_name, ground_truth_text):
     except Exception as e:
         return {"accuracy": -1, "error": str(e)}
 
+def to_grey(pil_img):
+    img_cv = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
+    return cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
+
+def variant_key(contrast, denoise_h, invert, threshold_method, blur):
+    return (contrast, denoise_h, invert, threshold_method, blur)
+
+def make_variant(contrast, denoise_h, invert, threshold_cfg, blur_type):
+    return {
+        "contrast": contrast,
+        "denoise_h": denoise_h,
+        "invert": invert,
+        "blur": blur_type,
+        "threshold_method": threshold_cfg["method"],
+        "threshold_blockSize": threshold_cfg.get("blockSize", "N/A"),
+        "threshold_C": threshold_cfg.get("C", "N/A")
+    }
+
+def iterate_shared_stages(gray):
+    """
+    Lazily yield every combination of the shared stages (inversion -> contrast -> denoise).
+    Each stage is computed once and reused by all the combinations built on top of it,
+    so the expensive denoise runs 24 times per image instead of 288.
+    """
+    for invert in INVERT_OPTIONS:
+        inverted = cv2.bitwise_not(gray) if invert else gray
+        for contrast in CONTRAST_VALUES:
+            contrasted = cv2.convertScaleAbs(inverted, alpha=contrast, beta=0) if contrast != 1.0 else inverted
+            for denoise_h in DENOISE_VALUES:
+                denoised = cv2.fastNlMeansDenoising(contrasted, None, h=denoise_h) if denoise_h is not None else contrasted
+                yield (contrast, denoise_h, invert), denoised
+
+def apply_leaf_stages(processed_img, blur_type, threshold_cfg):
+    """
+    Apply the blur and threshold stages, identical to the end of preprocess_for_ocr.
+    """
+    if blur_type == "gaussian":
+        processed_img = cv2.GaussianBlur(processed_img, (3, 3), 0)
+    elif blur_type == "median":
+        processed_img = cv2.medianBlur(processed_img, 3)
+
+    if threshold_cfg["method"] == "otsu":
+        _, processed_img = cv2.threshold(processed_img, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    elif threshold_cfg["method"] == "adaptive_gaussian":
+        processed_img = cv2.adaptiveThreshold(processed_img, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                                              cv2.THRESH_BINARY, threshold_cfg["blockSize"], threshold_cfg["C"])
+    elif threshold_cfg["method"] == "adaptive_mean":
+        processed_img = cv2.adaptiveThreshold(processed_img, 255, cv2.ADAPTIVE_THRESH_MEAN_C,
+                                              cv2.THRESH_BINARY, threshold_cfg["blockSize"], threshold_cfg["C"])
+    return processed_img
+
+def evaluate_shared_stage(prefix_img, prefix, language_name, ground_truth_text, done_keys):
+    """
+    Runs in a worker process. Applies every blur/threshold variant on top of one shared-stage image and OCRs it.
+    The NumPy image is passed straight to perform_ocr, no PIL image is built.
+    :return: List of (variant key, accuracy, full_text) for the variants that were not already in the checkpoint.
+    """
+    contrast, denoise_h, invert = prefix
+    leaves = [(threshold_cfg, blur_type) for threshold_cfg in THRESHOLD_METHODS for blur_type in BLUR_OPTIONS
+              if variant_key(contrast, denoise_h, invert, threshold_cfg["method"], blur_type) not in done_keys]
+    return evaluate_leaves(prefix_img, prefix, language_name, ground_truth_text, leaves)
+
+def evaluate_leaves(prefix_img, prefix, language_name, ground_truth_text, leaves):
+    """
+    Runs in a worker. Applies the given (threshold_cfg, blur_type) pairs on top of one shared-stage image and OCRs them.
+    :return: List of (variant key, accuracy, full_text).
+    """
+    contrast, denoise_h, invert = prefix
+    results = []
+    for threshold_cfg, blur_type in leaves:
+        key = variant_key(contrast, denoise_h, invert, threshold_cfg["method"], blur_type)
+        try:
+            processed_img = apply_leaf_stages(prefix_img, blur_type, threshold_cfg)
+            full_text, _ = perform_ocr(processed_img, lang_name=language_name, **OCR_OPTIONS)
+            results.append((key, calculate_accuracy_with_levenshtein__distance(full_text, ground_truth_text), full_text))
+        except Exception as e:
+            print(f"Error evaluating variant {key} for {language_name}: {e}")
+            results.append((key, -1, ""))
+    return results
+
+def load_checkpoint():
+    """
+    Load the variant results saved by a previous, interrupted run.
+    :return: Dictionary of (language, image index) -> {variant key: (accuracy, full_text)}.
+    """
+    completed = {}
+    if not os.path.exists(CHECKPOINT_FILE):
+        return completed
+    with open(CHECKPOINT_FILE, "r", encoding="utf-8") as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # The last line may be incomplete if the run was killed mid-write
+            completed.setdefault((record["language"], record["image"]), {})[tuple(record["key"])] = (record["accuracy"], record["full_text"])
+    print(f"Resuming from checkpoint with {sum(len(v) for v in completed.values())} evaluated variants")
+    return completed
+
+def evaluate_variants_in_threads(image_1, image_2, language_name, ground_truth_text):
+    """
+    The original evaluation: build every variant image up front and OCR them in a thread pool.
+    """
+    variants_1 = preprocess_for_ocr(image_1, CONTRAST_VALUES, DENOISE_VALUES, INVERT_OPTIONS, THRESHOLD_METHODS, BLUR_OPTIONS)
+    variants_2 = preprocess_for_ocr(image_2, CONTRAST_VALUES, DENOISE_VALUES, INVERT_OPTIONS, THRESHOLD_METHODS, BLUR_OPTIONS)
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results_1 = list(executor.map(
+            lambda v: evaluate_variant(v, language_name, ground_truth_text),
+            variants_1
+        ))
+        results_2 = list(executor.map(
+            lambda v: evaluate_variant(v, language_name, ground_truth_text),
+            variants_2
+        ))
+    return results_1, results_2
+
+def evaluate_variants_in_processes(executor, checkpoint, checkpoint_file, images, language_name, ground_truth_text):
+    """
+    Stream the shared-stage images of both images to the process pool, recording each result in the checkpoint.
+    :return: Lists of results for image 1 and image 2 in the same order and format as evaluate_variants_in_threads.
+    """
+    completed = {index: checkpoint.get((language_name, index), {}) for index in (1, 2)}
+    leaf_count = len(THRESHOLD_METHODS) * len(BLUR_OPTIONS)
+    pending = {}
+
+    def collect(done_futures):
+        for future in done_futures:
+            index = pending.pop(future)
+            for key, accuracy, full_text in future.result():
+                completed[index][key] = (accuracy, full_text)
+                checkpoint_file.write(json.dumps({
+                    "language": language_name, "image": index, "key": list(key),
+                    "accuracy": accuracy, "full_text": full_text
+                }, ensure_ascii=False) + "\n")
+            checkpoint_file.flush()
+
+    for index, image in enumerate(images, start=1):
+        for prefix, prefix_img in iterate_shared_stages(to_grey(image)):
+            done_keys = {key for key in completed[index] if key[:3] == prefix}
+            if len(done_keys) == leaf_count:
+                continue  # Already evaluated in a previous run
+            # Bound the number of queued images so memory stays flat however many variants there are
+            while len(pending) >= MAX_IN_FLIGHT:
+                done_futures, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done_futures)
+            future = executor.submit(evaluate_shared_stage, prefix_img, prefix, language_name, ground_truth_text, done_keys)
+            pending[future] = index
+    while pending:
+        done_futures, _ = wait(pending, return_when=FIRST_COMPLETED)
+        collect(done_futures)
+
+    # Rebuild the results in the same order as the original nested loops so tie-breaking is unchanged
+    results = []
+    for index in (1, 2):
+        image_results = []
+        for contrast in CONTRAST_VALUES:
+            for denoise_h in DENOISE_VALUES:
+                for invert in INVERT_OPTIONS:
+                    for threshold_cfg in THRESHOLD_METHODS:
+                        for blur_type in BLUR_OPTIONS:
+                            key = variant_key(contrast, denoise_h, invert, threshold_cfg["method"], blur_type)
+                            accuracy, full_text = completed[index].get(key, (-1, ""))
+                            image_results.append({
+                                "accuracy": accuracy,
+                                "full_text": full_text,
+                                "variant": make_variant(contrast, denoise_h, invert, threshold_cfg, blur_type)
+                            })
+        results.append(image_results)
+    return results[0], results[1]
+
+def shared_stage_image(gray, prefix, stage_cache):
+    """
+    Build one shared-stage image (inversion -> contrast -> denoise), reusing any stage already computed for this image.
+    """
+    contrast, denoise_h, invert = prefix
+    if (invert,) not in stage_cache:
+        stage_cache[(invert,)] = cv2.bitwise_not(gray) if invert else gray
+    if (invert, contrast) not in stage_cache:
+        inverted = stage_cache[(invert,)]
+        stage_cache[(invert, contrast)] = cv2.convertScaleAbs(inverted, alpha=contrast, beta=0) if contrast != 1.0 else inverted
+    if prefix not in stage_cache:
+        contrasted = stage_cache[(invert, contrast)]
+        stage_cache[prefix] = cv2.fastNlMeansDenoising(contrasted, None, h=denoise_h) if denoise_h is not None else contrasted
+    return stage_cache[prefix]
+
+def evaluate_variants_with_halving(executor, images, language_name, ground_truth_text):
+    """
+    Successive halving search: score every variant on image 1 from cheapest to most expensive,
+    stop as soon as a variant is perfect on both images, otherwise promote the best fraction to image 2.
+    :return: Lists of results for image 1 and image 2 in the same order and format as evaluate_variants_in_threads.
+             Variants that were never evaluated on an image have an accuracy of -1 so they are skipped when picking the best.
+    """
+    variants = [
+        (variant_key(contrast, denoise_h, invert, threshold_cfg["method"], blur_type),
+         make_variant(contrast, denoise_h, invert, threshold_cfg, blur_type), threshold_cfg)
+        for contrast in CONTRAST_VALUES
+        for denoise_h in DENOISE_VALUES
+        for invert in INVERT_OPTIONS
+        for threshold_cfg in THRESHOLD_METHODS
+        for blur_type in BLUR_OPTIONS
+    ]
+    greys = [to_grey(image) for image in images]
+    stage_caches = [{}, {}]
+    completed = [{}, {}]  # Per image: variant key -> (accuracy, full_text)
+
+    def evaluate(index, batch):
+        # Group the batch by shared stage so each worker task reuses one denoised image
+        groups = {}
+        for key, variant, threshold_cfg in batch:
+            groups.setdefault(key[:3], []).append((threshold_cfg, variant["blur"]))
+        futures = [
+            executor.submit(evaluate_leaves, shared_stage_image(greys[index], prefix, stage_caches[index]),
+                            prefix, language_name, ground_truth_text, leaves)
+            for prefix, leaves in groups.items()
+        ]
+        for future in futures:
+            for key, accuracy, full_text in future.result():
+                completed[index][key] = (accuracy, full_text)
+
+    # Rung 1: image 1, one cost level at a time so the search can stop at the cheapest perfect variant
+    by_cost = {}
+    for entry in variants:
+        by_cost.setdefault(compute_processing_cost(entry[1]), []).append(entry)
+    perfect_found = False
+    for cost in sorted(by_cost):
+        evaluate(0, by_cost[cost])
+        perfect_on_first = [entry for entry in by_cost[cost] if completed[0][entry[0]][0] == 100]
+        if perfect_on_first:
+            evaluate(1, perfect_on_first)
+            if any(completed[1][entry[0]][0] == 100 for entry in perfect_on_first):
+                print(f"{language_name}: 100% on both images at cost {cost}, stopping early "
+                      f"after {len(completed[0])} of {len(variants)} variants")
+                perfect_found = True
+                break
+
+    # Rung 2: promote the best fraction by image 1 accuracy, cheapest first among equal scores
+    if not perfect_found:
+        ranked = sorted(variants, key=lambda entry: (-completed[0][entry[0]][0], compute_processing_cost(entry[1])))
+        promote_count = max(1, math.ceil(len(ranked) * HALVING_PROMOTE_FRACTION))
+        evaluate(1, [entry for entry in ranked[:promote_count] if entry[0] not in completed[1]])
+
+    results = []
+    for index in (0, 1):
+        image_results = []
+        for key, variant, _ in variants:
+            accuracy, full_text = completed[index].get(key, (-1, ""))
+            image_results.append({"accuracy": accuracy, "full_text": full_text, "variant": variant})
+        results.append(image_results)
+    return results[0], results[1]
+
 def compare_ocr_with_ground_truth():
     """
     Compare OCR results with ground truth text files and save the results to a CSV file.
     Evaluate both images for each language and return the parameters that give the best average performance.
     """
     text_files = sorted(f for f in os.listdir(TEXT_FOLDER) if f.endswith(".txt"))
-    with open(OUTPUT_CSV, mode="w", newline="", encoding="utf-8-sig") as csv_file:
+    use_processes = EXECUTION_MODE == "process"
+    use_halving = SEARCH_MODE == "halving"
+    use_checkpoint = use_processes and not use_halving
+    if use_processes:
+        pool = ProcessPoolExecutor(max_workers=MAX_WORKERS)
+    elif use_halving:
+        pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    else:
+        pool = nullcontext()
+    checkpoint = load_checkpoint() if use_checkpoint else {}
+    with open(OUTPUT_CSV, mode="w", newline="", encoding="utf-8-sig") as csv_file, \
+         (open(CHECKPOINT_FILE, "a", encoding="utf-8") if use_checkpoint else nullcontext()) as checkpoint_file, \
+         pool as executor:
         csv_writer = csv.writer(csv_file)
         csv_writer.writerow([
             "Language",
@@ -195,8 +486,8 @@ def compare_ocr_with_ground_truth():
 
             # Calculate average accuracy before preprocessing
             try:
-                ocr_text_before_1, _ = perform_ocr(image_1, language_name, use_preprocessing=False)
-                ocr_text_before_2, _ = perform_ocr(image_2, language_name, use_preprocessing=False)
+                ocr_text_before_1, _ = perform_ocr(image_1, language_name, **OCR_OPTIONS)
+                ocr_text_before_2, _ = perform_ocr(image_2, language_name, **OCR_OPTIONS)
                 accuracy_before_1 = calculate_accuracy_with_levenshtein__distance(ocr_text_before_1, ground_truth_text)
                 accuracy_before_2 = calculate_accuracy_with_levenshtein__distance(ocr_text_before_2, ground_truth_text)
                 accuracy_before_avg = (accuracy_before_1 + accuracy_before_2) / 2
@@ -204,39 +495,21 @@ def compare_ocr_with_ground_truth():
                 print(f"Error in baseline OCR for {language_name}: {e}")
                 accuracy_before_avg = -1
 
-            # Generate preprocessing variants
-            variants_1 = preprocess_for_ocr(
-                image_1,
-                CONTRAST_VALUES,
-                DENOISE_VALUES,
-                INVERT_OPTIONS,
-                THRESHOLD_METHODS,
-                BLUR_OPTIONS
-            )
-            variants_2 = preprocess_for_ocr(
-                image_2,
-                CONTRAST_VALUES,
-                DENOISE_VALUES,
-                INVERT_OPTIONS,
-                THRESHOLD_METHODS,
-                BLUR_OPTIONS
-            )
-
-            # Evaluate each variant for both images
+            # Evaluate the preprocessing variants on both images
+            if use_halving:
+                results_1, results_2 = evaluate_variants_with_halving(
+                    executor, (image_1, image_2), language_name, ground_truth_text
+                )
+            elif use_processes:
+                results_1, results_2 = evaluate_variants_in_processes(
+                    executor, checkpoint, checkpoint_file, (image_1, image_2), language_name, ground_truth_text
+                )
+            else:
+                results_1, results_2 = evaluate_variants_in_threads(image_1, image_2, language_name, ground_truth_text)
+
             best_result = None
             best_avg_accuracy = -1
 
-            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
-                results_1 = list(executor.map(
-                    lambda v: evaluate_variant(v, language_name, ground_truth_text),
-                    variants_1
-                ))
-                results_2 = list(executor.map(
-                    lambda v: evaluate_variant(v, language_name, ground_truth_text),
-                    variants_2
-                ))
-
-
             # Combine results and calculate average accuracy
             for res_1, res_2 in zip(results_1, results_2):
                 if res_1["accuracy"] == -1 or res_2["accuracy"] == -1:
@@ -288,5 +561,9 @@ def compare_ocr_with_ground_truth():
             ])
             print(f"{language_name} Evaluation Complete, Best Average Accuracy: {best_avg_accuracy:.2f}% (Before: {accuracy_before_avg:.2f}%)")
 
+    # The run completed so the checkpoint is no longer needed
+    if use_checkpoint and os.path.exists(CHECKPOINT_FILE):
+        os.remove(CHECKPOINT_FILE)
+
 if __name__ == "__main__":
     compare_ocr_with_ground_truth()
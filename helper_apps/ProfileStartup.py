@@ -0,0 +1,118 @@
+"""
+Profiles how long Live-Translate takes to start.
+
+1. Import-time profile: runs `python -X importtime -c "import Main"` in a fresh interpreter (several times, keeping
+   the fastest run so disk caching does not skew it) and lists the slowest modules imported at startup.
+   With fast start only customtkinter, screeninfo and the modules needed for the first paint should appear;
+   pygame, gTTS, OpenCV, aiohttp and the OCR pipeline are imported after the window is shown.
+2. Time to first paint: starts the application in a fresh interpreter and reports the time from launch to the
+   imports finishing, the window being built and the window being drawn. This needs a display.
+
+The results are compared against STARTUP_TARGET_SECONDS and written to startup_profile_results.csv.
+"""
+
+import os
+import sys
+# Adds the parent directory to sys.path since the script is in a subdirectory helper_apps so that it can import modules from the main directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv
+import subprocess
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Target time from launching the application to the window being drawn
+STARTUP_TARGET_SECONDS = 1.0
+IMPORT_RUNS = 5
+TOP_MODULES = 15
+
+# Run in a fresh interpreter, prints the launch -> imports done, window built and first paint times in seconds
+FIRST_PAINT_SCRIPT = """
+import time
+start = time.perf_counter()
+import Gui
+from Main import MainGui
+imported = time.perf_counter()
+app = MainGui()
+constructed = time.perf_counter()
+times = {}
+
+def painted():
+    app.update_idletasks()
+    times["paint"] = time.perf_counter()
+    # Let the deferred startup work run before closing so it is not cut short
+    app.after(Gui.FAST_START_DEFER_MS + 500, app.destroy)
+
+app.after_idle(painted)
+app.mainloop()
+print(f"RESULT {imported - start} {constructed - start} {times['paint'] - start}")
+"""
+
+def profile_imports():
+    """
+    Run `-X importtime` on the application entry point and return the fastest total and its per-module breakdown.
+    :return: Tuple of (total seconds, list of (cumulative seconds, module name) for the top-level imports).
+    """
+    best_total, best_modules = None, None
+    for _ in range(IMPORT_RUNS):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import Main"],
+            cwd=PROJECT_DIR, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Importing Main failed:\n{result.stderr[-2000:]}")
+
+        modules = []
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, name = line.split("|")
+            if not cumulative.strip().isdigit():
+                continue  # Header line
+            # -X importtime indents nested imports by two spaces per level, keep Main, Gui and what Gui imports
+            depth = (len(name) - len(name.lstrip()) - 1) // 2
+            if depth <= 2:
+                modules.append((int(cumulative) / 1e6, name.strip()))
+        total = sum(seconds for seconds, name in modules if name == "Main")
+        if best_total is None or total < best_total:
+            best_total, best_modules = total, modules
+    return best_total, sorted(best_modules, reverse=True)
+
+
+def profile_first_paint():
+    """
+    Start the application and measure the time to the first paint.
+    :return: Tuple of (import seconds, constructor seconds, first paint seconds), or None if there is no display.
+    """
+    result = subprocess.run([sys.executable, "-c", FIRST_PAINT_SCRIPT], cwd=PROJECT_DIR, capture_output=True, text=True)
+    for line in result.stdout.splitlines():
+        if line.startswith("RESULT"):
+            imported, constructed, painted = line.split()[1:]
+            return float(imported), float(constructed), float(painted)
+    print(f"DEBUG: Could not open the window, skipping the first paint measurement:\n{result.stderr[-500:]}")
+    return None
+
+
+if __name__ == "__main__":
+    print(f"Profiling imports ({IMPORT_RUNS} runs, fastest kept)...")
+    import_total, modules = profile_imports()
+    print(f"\nimport Main: {import_total * 1000:.0f} ms")
+    print(f"{'Cumulative ms':>14}  Module")
+    for seconds, name in modules[:TOP_MODULES]:
+        print(f"{seconds * 1000:14.1f}  {name}")
+
+    print("\nMeasuring time to first paint...")
+    paint = profile_first_paint()
+    rows = [["import_main_s", f"{import_total:.3f}"]]
+    if paint is not None:
+        imported, constructed, painted = paint
+        print(f"Imports done:     {imported * 1000:.0f} ms")
+        print(f"Window built:     {constructed * 1000:.0f} ms")
+        print(f"First paint:      {painted * 1000:.0f} ms")
+        print(f"Target:           {STARTUP_TARGET_SECONDS * 1000:.0f} ms -> {'met' if painted <= STARTUP_TARGET_SECONDS else 'missed'}")
+        rows += [["imports_done_s", f"{imported:.3f}"], ["window_built_s", f"{constructed:.3f}"], ["first_paint_s", f"{painted:.3f}"]]
+    rows += [[f"module_{name}_s", f"{seconds:.4f}"] for seconds, name in modules[:TOP_MODULES]]
+
+    with open("startup_profile_results.csv", "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["Measurement", "Value"])
+        writer.writerows(rows)
+    print("\nResults written to startup_profile_results.csv")
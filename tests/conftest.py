@@ -0,0 +1,4 @@
+import os
+import sys
+# Adds the parent directory to sys.path since the tests are in a subdirectory so that they can import modules from the main directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
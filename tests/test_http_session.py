@@ -0,0 +1,53 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import requests
+from HttpSession import PooledSession
+
+
+@pytest.fixture
+def server():
+    """
+    Local server that answers every request with the status code in its path (/503, /500...) and counts the requests.
+    """
+    counts = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def respond(self):
+            counts[(self.command, self.path)] = counts.get((self.command, self.path), 0) + 1
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if self.path == "/slow":
+                threading.Event().wait(0.5)
+            self.send_response(200 if self.path == "/slow" else int(self.path[1:]))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        do_GET = do_POST = respond
+
+        def log_message(self, format, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}", counts
+    httpd.shutdown()
+
+
+def test_post_is_only_retried_when_it_was_not_processed(server):
+    url, counts = server
+    session = PooledSession(retries=2, backoff_factor=0)
+    assert session.post(f"{url}/500").status_code == 500
+    assert session.post(f"{url}/503").status_code == 503
+    assert session.post(f"{url}/429").status_code == 429
+    assert session.get(f"{url}/500").status_code == 500
+    assert counts == {("POST", "/500"): 1, ("POST", "/503"): 3, ("POST", "/429"): 3, ("GET", "/500"): 3}
+
+
+def test_post_is_not_retried_after_a_read_timeout(server):
+    url, counts = server
+    session = PooledSession(retries=2, backoff_factor=0, timeout=(1, 0.1))
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        session.post(f"{url}/slow")
+    assert counts == {("POST", "/slow"): 1}
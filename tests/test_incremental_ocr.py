@@ -0,0 +1,47 @@
+import numpy as np
+import PipelineForOCR
+from IncrementalOCR import IncrementalOCR
+
+
+def fake_perform_ocr(reads):
+    """
+    Stand-in for perform_ocr that records every read and labels its paragraph with the settings it was read with.
+    """
+    def perform_ocr(frame, lang_name, use_preprocessing=True, ocr_lang=None, **ocr_options):
+        reads.append((ocr_lang, use_preprocessing))
+        paragraph = {"text": f"{ocr_lang}-{use_preprocessing}", "x": 10, "y": 10, "width": 40, "height": 20}
+        return paragraph["text"], [paragraph]
+    return perform_ocr
+
+
+def test_unchanged_image_is_read_again_after_changing_settings(monkeypatch):
+    reads = []
+    monkeypatch.setattr(PipelineForOCR, "perform_ocr", fake_perform_ocr(reads))
+    monkeypatch.setattr(PipelineForOCR, "get_incremental_ocr", lambda: incremental)
+    incremental = IncrementalOCR()
+    image = np.full((80, 80), 255, dtype=np.uint8)
+
+    text, _ = PipelineForOCR.perform_incremental_ocr(image, "English", "region")
+    assert text == "eng-True"
+    text, _ = PipelineForOCR.perform_incremental_ocr(image, "English", "region")
+    assert text == "eng-True" and len(reads) == 1  # Same settings, nothing changed, nothing re-read
+
+    text, _ = PipelineForOCR.perform_incremental_ocr(image, "Japanese", "region")
+    assert text == "jpn-True"
+    text, _ = PipelineForOCR.perform_incremental_ocr(image, "Japanese", "region", use_preprocessing=False)
+    assert text == "jpn-False"
+    text, _ = PipelineForOCR.perform_incremental_ocr(image, "Japanese", "region", use_preprocessing=False, latency_budget_ms=100)
+    assert reads == [("eng", True), ("jpn", True), ("jpn", False), ("jpn", False)]
+
+
+def test_chinese_is_joined_without_spaces_for_reused_paragraphs(monkeypatch):
+    monkeypatch.setattr(PipelineForOCR, "get_incremental_ocr", lambda: incremental)
+    monkeypatch.setattr(PipelineForOCR, "perform_ocr", lambda frame, lang_name, **options: ("", [
+        {"text": "你好", "x": 0, "y": 0, "width": 20, "height": 10},
+        {"text": "世界", "x": 0, "y": 30, "width": 20, "height": 10},
+    ]))
+    incremental = IncrementalOCR()
+    image = np.full((60, 60), 255, dtype=np.uint8)
+    for _ in range(2):
+        text, _ = PipelineForOCR.perform_incremental_ocr(image, "Chinese (Simplified)", "region")
+        assert text == "你好世界"
@@ -0,0 +1,50 @@
+import types
+import LocalTranslation
+from LocalTranslation import LocalTranslation as LocalTranslator
+
+
+def fake_argostranslate(installed):
+    """
+    Stand-in for argostranslate where the model is only found once installed["ready"] is True.
+    get_installed_languages has no cache_clear, like argostranslate versions that do not cache it.
+    """
+    class Language:
+        def get_translation(self, target):
+            return "translation" if installed["ready"] else None
+
+    def install_package_for_language_pair(source_code, target_code):
+        installed["attempts"] += 1
+        raise ConnectionError("download interrupted")
+
+    return types.SimpleNamespace(
+        translate=types.SimpleNamespace(get_language_from_code=lambda code: Language(),
+                                        get_installed_languages=lambda: []),
+        package=types.SimpleNamespace(update_package_index=lambda: None,
+                                      install_package_for_language_pair=install_package_for_language_pair),
+    )
+
+
+def test_failed_install_is_retried_after_a_while(monkeypatch):
+    monkeypatch.setattr(LocalTranslation, "get_translation_cache", lambda: None)
+    installed = {"ready": False, "attempts": 0}
+    monkeypatch.setattr(LocalTranslation, "argostranslate", fake_argostranslate(installed))
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(LocalTranslation.time, "monotonic", lambda: clock["now"])
+    translator = LocalTranslator()
+
+    assert translator.get_translation("en", "fr") is None
+    assert translator.get_translation("en", "fr") is None
+    assert installed["attempts"] == 1  # Not retried straight away
+
+    installed["ready"] = True
+    clock["now"] += LocalTranslation.LOCAL_TRANSLATION_RETRY_SECONDS
+    assert translator.get_translation("en", "fr") == "translation"
+
+
+def test_install_works_without_a_cached_language_list(monkeypatch):
+    installed = {"ready": False, "attempts": 0}
+    argos = fake_argostranslate(installed)
+    argos.package.install_package_for_language_pair = lambda source_code, target_code: True
+    monkeypatch.setattr(LocalTranslation, "argostranslate", argos)
+    monkeypatch.setattr(LocalTranslation, "get_translation_cache", lambda: None)
+    assert LocalTranslator().install_pair("en", "fr")
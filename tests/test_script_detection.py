@@ -0,0 +1,34 @@
+import TesseractEngine
+from ScriptDetection import ScriptDetector
+
+
+class FakeEngine:
+    def __init__(self, script, installed):
+        self.script = script
+        self.installed = installed
+
+    def detect_script(self, image):
+        return self.script, 5.0
+
+    def get_installed_languages(self):
+        return self.installed
+
+
+def detect(monkeypatch, script, installed):
+    monkeypatch.setattr(TesseractEngine, "get_tesseract_engine", lambda: FakeEngine(script, installed))
+    return ScriptDetector().detect(None)[0]
+
+
+def test_script_models_are_used_when_installed(monkeypatch):
+    assert detect(monkeypatch, "Latin", {"eng", "rus", "script/Latin"}) == "script/Latin"
+
+
+def test_missing_script_models_fall_back_to_language_models(monkeypatch):
+    assert detect(monkeypatch, "Latin", {"eng", "rus", "osd"}) == "eng"
+    assert detect(monkeypatch, "Cyrillic", {"eng", "rus", "osd"}) == "rus"
+    assert detect(monkeypatch, "Cyrillic", {"eng", "osd"}) == "eng"
+    assert detect(monkeypatch, "Han", {"eng", "osd"}) == "eng"
+
+
+def test_languages_are_not_filtered_when_they_cannot_be_listed(monkeypatch):
+    assert detect(monkeypatch, "Latin", set()) == "script/Latin"
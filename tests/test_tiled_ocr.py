@@ -0,0 +1,37 @@
+import numpy as np
+from PipelineForOCR import perform_tiled_ocr, split_into_strips
+
+LINE_HEIGHT = 30
+LINE_GAP = 20
+
+
+def draw_paragraph(image, top, line_count):
+    """
+    Draw a paragraph of dark bars standing in for text lines, return the row below its last line.
+    """
+    for _ in range(line_count):
+        image[top:top + LINE_HEIGHT, 100:1100] = 0
+        top += LINE_HEIGHT + LINE_GAP
+    return top - LINE_GAP
+
+
+def test_strips_are_only_cut_between_paragraphs():
+    image = np.full((1200, 1200), 255, dtype=np.uint8)
+    # The first paragraph spans the middle of the image, where the first cut would land if any line gap could be used
+    first_bottom = draw_paragraph(image, 60, 14)
+    second_top = first_bottom + 150
+    draw_paragraph(image, second_top, 5)
+
+    strips = split_into_strips(image, 4)
+    cuts = [top for top, _ in strips[1:]]
+    assert cuts, "expected a cut at the paragraph break"
+    for cut in cuts:
+        assert first_bottom <= cut < second_top
+    assert strips[0][0] == 0 and strips[-1][1] == 1200
+
+
+def test_single_paragraph_is_not_split():
+    image = np.full((1200, 1200), 255, dtype=np.uint8)
+    draw_paragraph(image, 60, 20)
+    assert len(split_into_strips(image, 4)) == 1
+    assert perform_tiled_ocr(image, "eng", strip_count=4) is None  # OCR'd whole instead
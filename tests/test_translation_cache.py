@@ -0,0 +1,27 @@
+import sqlite3
+from TranslationCache import TranslationCache
+
+
+def count_rows(db_path):
+    with sqlite3.connect(db_path) as connection:
+        return connection.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+
+def test_writes_are_batched_and_reach_disk(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    cache = TranslationCache(db_path=db_path)
+    for index in range(20):
+        cache.put("google", "en", "fr", f"text {index}", f"texte {index}")
+    # Lookups are answered from memory while the writes are still queued
+    assert cache.get("google", "en", "fr", "text 3") == "texte 3"
+
+    cache.flush()
+    assert count_rows(db_path) == 20
+    assert TranslationCache(db_path=db_path).get("google", "en", "fr", "text 19") == "texte 19"
+
+
+def test_evicted_entries_are_found_before_they_are_written(tmp_path):
+    cache = TranslationCache(max_entries=2, db_path=str(tmp_path / "cache.db"))
+    for index in range(5):
+        cache.put("google", "en", "fr", f"text {index}", f"texte {index}")
+    assert cache.get("google", "en", "fr", "text 0") == "texte 0"